@@ -24,8 +24,11 @@ CREATE TABLE IF NOT EXISTS orders_created_daily (
   created_at    TIMESTAMPTZ NOT NULL DEFAULT now(),
   UNIQUE (day, supplier_id)
 );
-CREATE INDEX IF NOT EXISTS idx_ocd_day        ON orders_created_daily(day DESC);
-CREATE INDEX IF NOT EXISTS idx_ocd_supplier   ON orders_created_daily(supplier_id);
+-- Paginação keyset (day DESC, id DESC), com e sem filtro por dimensão
+DROP INDEX IF EXISTS idx_ocd_day;
+DROP INDEX IF EXISTS idx_ocd_supplier;
+CREATE INDEX IF NOT EXISTS idx_ocd_day_id           ON orders_created_daily(day DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_ocd_supplier_day_id  ON orders_created_daily(supplier_id, day DESC, id DESC);
 
 -- ============================================
 -- FATO AGREGADO: Atrasos por fornecedor (snapshot diário)
@@ -40,8 +43,11 @@ CREATE TABLE IF NOT EXISTS orders_delayed_daily (
   created_at      TIMESTAMPTZ NOT NULL DEFAULT now(),
   UNIQUE (day, supplier_id)
 );
-CREATE INDEX IF NOT EXISTS idx_odd_day        ON orders_delayed_daily(day DESC);
-CREATE INDEX IF NOT EXISTS idx_odd_supplier   ON orders_delayed_daily(supplier_id);
+-- Paginação keyset (day DESC, id DESC), com e sem filtro por dimensão
+DROP INDEX IF EXISTS idx_odd_day;
+DROP INDEX IF EXISTS idx_odd_supplier;
+CREATE INDEX IF NOT EXISTS idx_odd_day_id           ON orders_delayed_daily(day DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_odd_supplier_day_id  ON orders_delayed_daily(supplier_id, day DESC, id DESC);
 
 -- ============================================
 -- FATO AGREGADO: Alertas de estoque por SKU (snapshot diário)
@@ -56,8 +62,65 @@ CREATE TABLE IF NOT EXISTS inventory_alerts_daily (
   created_at       TIMESTAMPTZ NOT NULL DEFAULT now(),
   UNIQUE (day, sku_id)
 );
-CREATE INDEX IF NOT EXISTS idx_iad_day        ON inventory_alerts_daily(day DESC);
-CREATE INDEX IF NOT EXISTS idx_iad_sku        ON inventory_alerts_daily(sku_id);
+-- Paginação keyset (day DESC, id DESC), com e sem filtro por dimensão
+DROP INDEX IF EXISTS idx_iad_day;
+DROP INDEX IF EXISTS idx_iad_sku;
+CREATE INDEX IF NOT EXISTS idx_iad_day_id           ON inventory_alerts_daily(day DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_iad_sku_day_id       ON inventory_alerts_daily(sku_id, day DESC, id DESC);
+
+-- ============================================
+-- ROLLUPS: semana / mês / total por fornecedor e SKU
+-- Mantidos pelo ETL (storage/rollups.py) na mesma transação das tabelas
+-- diárias; grain = 'week' | 'month' | 'total' (period_start 1970-01-01).
+-- ============================================
+CREATE TABLE IF NOT EXISTS orders_created_rollup (
+  id            BIGSERIAL PRIMARY KEY,
+  grain         TEXT      NOT NULL,
+  period_start  DATE      NOT NULL,
+  supplier_id   BIGINT    NOT NULL REFERENCES suppliers(id) ON DELETE RESTRICT,
+  total_orders  BIGINT    NOT NULL,
+  total_qty     BIGINT    NOT NULL,
+  days          INTEGER   NOT NULL,                    -- dias com dados no período
+  updated_at    TIMESTAMPTZ NOT NULL DEFAULT now(),
+  CONSTRAINT uq_ocr_period UNIQUE (grain, period_start, supplier_id)
+);
+CREATE INDEX IF NOT EXISTS idx_ocr_supplier ON orders_created_rollup(grain, supplier_id, period_start DESC);
+
+CREATE TABLE IF NOT EXISTS orders_delayed_rollup (
+  id              BIGSERIAL PRIMARY KEY,
+  grain           TEXT      NOT NULL,
+  period_start    DATE      NOT NULL,
+  supplier_id     BIGINT    NOT NULL REFERENCES suppliers(id) ON DELETE RESTRICT,
+  delayed_orders  BIGINT    NOT NULL,
+  delay_days_sum  NUMERIC(18,4) NOT NULL,              -- Σ avg_delay_days × delayed_orders
+  days            INTEGER   NOT NULL,
+  updated_at      TIMESTAMPTZ NOT NULL DEFAULT now(),
+  CONSTRAINT uq_odr_period UNIQUE (grain, period_start, supplier_id)
+);
+CREATE INDEX IF NOT EXISTS idx_odr_supplier ON orders_delayed_rollup(grain, supplier_id, period_start DESC);
+
+CREATE TABLE IF NOT EXISTS inventory_alerts_rollup (
+  id               BIGSERIAL PRIMARY KEY,
+  grain            TEXT      NOT NULL,
+  period_start     DATE      NOT NULL,
+  sku_id           BIGINT    NOT NULL REFERENCES skus(id) ON DELETE RESTRICT,
+  low_stock_alerts BIGINT    NOT NULL,
+  min_threshold    INTEGER   NOT NULL,
+  days             INTEGER   NOT NULL,
+  updated_at       TIMESTAMPTZ NOT NULL DEFAULT now(),
+  CONSTRAINT uq_iar_period UNIQUE (grain, period_start, sku_id)
+);
+CREATE INDEX IF NOT EXISTS idx_iar_sku ON inventory_alerts_rollup(grain, sku_id, period_start DESC);
+
+-- ============================================
+-- GERAÇÃO GOLD: contador de cargas (linha única)
+-- Incrementado pelo ETL na transação da carga; chave do cache da API.
+-- ============================================
+CREATE TABLE IF NOT EXISTS gold_generation (
+  id          INTEGER PRIMARY KEY,
+  generation  BIGINT  NOT NULL,
+  updated_at  TIMESTAMPTZ NOT NULL DEFAULT now()
+);
 
 -- ============================================
 -- Views úteis para o Streamlit
@@ -72,15 +135,17 @@ FROM orders_created_daily o
 JOIN suppliers s ON s.id = o.supplier_id
 ORDER BY day DESC, supplier;
 
+-- Lê o rollup 'total' (uma linha por fornecedor) em vez do histórico diário;
+-- a média é ponderada pelo número de pedidos atrasados
 CREATE OR REPLACE VIEW v_delays_top_suppliers AS
 SELECT
   s.name AS supplier,
-  SUM(delayed_orders) AS delayed_events,
-  AVG(avg_delay_days) AS avg_delay_days
-FROM orders_delayed_daily d
-JOIN suppliers s ON s.id = d.supplier_id
-GROUP BY s.name
-ORDER BY avg_delay_days DESC, delayed_events DESC;
+  r.delayed_orders AS delayed_events,
+  ROUND(r.delay_days_sum / NULLIF(r.delayed_orders, 0), 4) AS avg_delay_days
+FROM orders_delayed_rollup r
+JOIN suppliers s ON s.id = r.supplier_id
+WHERE r.grain = 'total'
+ORDER BY avg_delay_days DESC NULLS LAST, delayed_events DESC;
 
 CREATE OR REPLACE VIEW v_inventory_risk AS
 SELECT
@@ -0,0 +1,36 @@
+"""user token_version
+
+Revision ID: c3f8a1d2e5b7
+Revises: 94d692fb3734
+Create Date: 2026-10-16 10:12:40.118204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c3f8a1d2e5b7"
+down_revision: Union[str, Sequence[str], None] = "94d692fb3734"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "users",
+        sa.Column(
+            "token_version",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("users", "token_version")
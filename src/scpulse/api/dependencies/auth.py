@@ -1,24 +1,76 @@
+import dataclasses
 import os
-from typing import Optional
+from typing import Any, Optional
 
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from src.scpulse.storage.models.users import User
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.scpulse.storage.postgres import get_session
-from sqlalchemy.future import select
+
+from src.scpulse.storage.postgres import get_async_session
+from src.scpulse.storage.user_cache import USERS, CachedUser
 
 SECRET_KEY: str = os.getenv("SECRET_KEY", "changeme")
 ALGORITHM: str = os.getenv("ALGORITHM", "HS256")
+# Aceita as claims assinadas (uid/act/ver) sem consultar o banco. Revogações
+# feitas neste processo valem na hora; as de outro processo só quando o
+# token expira.
+AUTH_TRUST_CLAIMS: bool = os.getenv("AUTH_TRUST_CLAIMS", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/login")
 
 
+def token_claims(user: CachedUser) -> dict[str, Any]:
+    """Claims do access token: `sub` + o necessário para validar offline."""
+    return {
+        "sub": user.email,
+        "uid": user.id,
+        "name": user.name,
+        "act": user.is_active,
+        "ver": user.token_version,
+    }
+
+
+def _user_from_claims(payload: dict[str, Any]) -> Optional[CachedUser]:
+    """Usuário das claims, com o estado de revogação conhecido no processo.
+
+    `token_version`/`is_active` vêm de `USERS.state_of` quando o processo
+    já viu o usuário: um token revogado aqui não se valida com o próprio
+    `ver`.
+    """
+    try:
+        user = CachedUser(
+            id=int(payload["uid"]),
+            name=str(payload.get("name", "")),
+            email=payload["sub"],
+            is_active=bool(payload["act"]),
+            token_version=int(payload["ver"]),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+    state = USERS.state_of(user.id)
+    if state is None:
+        return user
+    return dataclasses.replace(
+        user, token_version=state.token_version, is_active=state.is_active
+    )
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_session),
-) -> User:
+    db: AsyncSession = Depends(get_async_session),
+) -> CachedUser:
+    """Usuário do token, resolvido sem ir ao banco sempre que possível.
+
+    Ordem: cache em processo → claims assinadas (se `AUTH_TRUST_CLAIMS`)
+    → SELECT em `users` (e grava no cache). Em todos os casos o token é
+    recusado se o usuário estiver inativo ou se `ver` for diferente do
+    `token_version` conhecido (tokens revogados).
+    """
     credentials_exception = HTTPException(
         status_code=401, detail="Could not validate credentials"
     )
@@ -31,9 +83,17 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    result = await db.execute(select(User).where(User.email == email))
-    user: Optional[User] = result.scalars().first()
+    user = USERS.peek(email)
+    if user is None and AUTH_TRUST_CLAIMS:
+        user = _user_from_claims(payload)
     if user is None:
+        user = await USERS.get_by_email_async(db, email)
+
+    if (
+        user is None
+        or not user.is_active
+        or user.token_version != payload.get("ver", 0)
+    ):
         raise credentials_exception
 
     return user
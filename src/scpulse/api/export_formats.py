@@ -0,0 +1,200 @@
+"""Codificadores de exportação em streaming (NDJSON, CSV, Arrow, Parquet).
+
+Cada codificador recebe lotes de linhas (`list[dict]`) de um iterador
+assíncrono e devolve blocos de bytes à medida que os lotes chegam; nenhum
+formato acumula o resultado inteiro em memória. Arrow IPC e Parquet usam o
+`pyarrow` (dependência opcional): cada lote vira um record batch / row
+group.
+"""
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterable, AsyncIterator
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable
+
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    Date,
+    Integer,
+    Numeric,
+    TIMESTAMP,
+)
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - depende do ambiente
+    pa = None
+    pq = None
+
+Batches = AsyncIterable[list[dict[str, Any]]]
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Tipo não serializável: {type(value)!r}")
+
+
+async def encode_ndjson(
+    batches: Batches, columns: list[Column]
+) -> AsyncIterator[bytes]:
+    async for rows in batches:
+        yield "".join(
+            json.dumps(row, default=_json_default) + "\n" for row in rows
+        ).encode()
+
+
+async def encode_csv(
+    batches: Batches, columns: list[Column]
+) -> AsyncIterator[bytes]:
+    names = [c.name for c in columns]
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=names)
+    writer.writeheader()
+    async for rows in batches:
+        writer.writerows(rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def require_pyarrow() -> None:
+    if pa is None:
+        raise RuntimeError(
+            "pyarrow não está instalado. Rode: poetry add pyarrow"
+        )
+
+
+def arrow_schema(columns: list[Column]) -> "pa.Schema":
+    """Schema Arrow fixo a partir dos tipos SQLAlchemy das colunas."""
+    require_pyarrow()
+
+    def arrow_type(column: Column) -> "pa.DataType":
+        sql_type = column.type
+        if isinstance(sql_type, BigInteger):
+            return pa.int64()
+        if isinstance(sql_type, Integer):
+            return pa.int32()
+        if isinstance(sql_type, Numeric):
+            return pa.float64()
+        if isinstance(sql_type, TIMESTAMP):
+            return pa.timestamp("us", tz="UTC")
+        if isinstance(sql_type, Date):
+            return pa.date32()
+        if isinstance(sql_type, Boolean):
+            return pa.bool_()
+        return pa.string()
+
+    return pa.schema([(c.name, arrow_type(c)) for c in columns])
+
+
+def _record_batch(
+    rows: list[dict[str, Any]], schema: "pa.Schema"
+) -> "pa.RecordBatch":
+    arrays = []
+    for field in schema:
+        values = [row[field.name] for row in rows]
+        if pa.types.is_floating(field.type):
+            values = [None if v is None else float(v) for v in values]
+        arrays.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+class _DrainableSink(io.RawIOBase):
+    """Arquivo só de escrita cujo conteúdo pode ser retirado aos poucos."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def _encode_arrow_writer(
+    batches: Batches,
+    columns: list[Column],
+    open_writer: Callable[[Any, "pa.Schema"], Any],
+    write: Callable[[Any, "pa.RecordBatch"], None],
+) -> AsyncIterator[bytes]:
+    schema = arrow_schema(columns)
+    sink = _DrainableSink()
+    writer = open_writer(sink, schema)
+    try:
+        async for rows in batches:
+            write(writer, _record_batch(rows, schema))
+            data = sink.drain()
+            if data:
+                yield data
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def encode_arrow(
+    batches: Batches, columns: list[Column]
+) -> AsyncIterator[bytes]:
+    """Arrow IPC stream: um record batch por lote."""
+    return _encode_arrow_writer(
+        batches,
+        columns,
+        lambda sink, schema: pa.ipc.new_stream(sink, schema),
+        lambda writer, batch: writer.write_batch(batch),
+    )
+
+
+def encode_parquet(
+    batches: Batches, columns: list[Column]
+) -> AsyncIterator[bytes]:
+    """Parquet: um row group por lote; o footer sai no último bloco."""
+    return _encode_arrow_writer(
+        batches,
+        columns,
+        lambda sink, schema: pq.ParquetWriter(
+            sink, schema, compression="snappy"
+        ),
+        lambda writer, batch: writer.write_batch(batch),
+    )
+
+
+# formato → (codificador, media type, extensão, requer pyarrow)
+EXPORT_FORMATS: dict[str, tuple[Callable, str, str, bool]] = {
+    "ndjson": (encode_ndjson, "application/x-ndjson", "ndjson", False),
+    "csv": (encode_csv, "text/csv", "csv", False),
+    "arrow": (
+        encode_arrow,
+        "application/vnd.apache.arrow.stream",
+        "arrows",
+        True,
+    ),
+    "parquet": (
+        encode_parquet,
+        "application/vnd.apache.parquet",
+        "parquet",
+        True,
+    ),
+}
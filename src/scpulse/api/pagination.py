@@ -0,0 +1,171 @@
+"""Paginação por cursor (keyset) e projeção de colunas para tabelas Gold.
+
+As tabelas diárias são percorridas em `(day DESC, id DESC)`: a próxima
+página começa estritamente depois da última linha devolvida, então o custo
+de cada página não depende de quantas vieram antes (ao contrário de
+`OFFSET`). O cursor é opaco para o cliente (base64 de `{"d": dia, "i": id}`;
+no backend DuckDB, sem `id`, o desempate é o nome da dimensão).
+"""
+
+import base64
+import binascii
+import json
+import os
+from collections.abc import Mapping, Sequence
+from datetime import date
+from typing import Any, Optional
+
+from fastapi import HTTPException, Query
+from sqlalchemy import ColumnElement, Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.scpulse.api.schemas.schemas import Item, Page
+
+DEFAULT_PAGE_SIZE = int(os.getenv("API_DEFAULT_PAGE_SIZE", "100"))
+MAX_PAGE_SIZE = int(os.getenv("API_MAX_PAGE_SIZE", "1000"))
+
+
+def encode_cursor(day: date, row_id: int | str) -> str:
+    raw = json.dumps({"d": day.isoformat(), "i": row_id}).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, key_type: type = int) -> tuple[date, Any]:
+    """Decodifica um cursor; cursores inválidos viram HTTP 400.
+
+    Args:
+        cursor (str): Valor de `next_cursor`.
+        key_type (type): Tipo esperado do desempate (`int` = id da linha,
+            `str` = nome da dimensão).
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded))
+        key = data["i"]
+        if type(key) is not key_type:
+            raise TypeError(f"desempate {key!r} não é {key_type.__name__}")
+        return date.fromisoformat(data["d"]), key
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Cursor inválido")
+
+
+class PageParams:
+    """Parâmetros de query comuns às listagens paginadas."""
+
+    def __init__(
+        self,
+        limit: int = Query(
+            DEFAULT_PAGE_SIZE,
+            ge=1,
+            le=MAX_PAGE_SIZE,
+            description="Linhas por página",
+        ),
+        cursor: Optional[str] = Query(
+            None, description="`next_cursor` da página anterior"
+        ),
+        fields: Optional[str] = Query(
+            None,
+            description="Colunas a retornar, separadas por vírgula",
+        ),
+        include_total: bool = Query(
+            False, description="Inclui a contagem total (consulta extra)"
+        ),
+    ) -> None:
+        self.limit = limit
+        self.cursor = cursor
+        self.fields = fields
+        self.include_total = include_total
+
+
+def select_fields(
+    available: Sequence[str], fields: Optional[str]
+) -> list[str]:
+    """Valida `fields=` contra os campos disponíveis (na ordem pedida)."""
+    available = list(available)
+    if not fields:
+        return available
+    wanted = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = sorted(set(wanted) - set(available))
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Campos desconhecidos: {unknown}. Use {available}",
+        )
+    return list(dict.fromkeys(wanted))
+
+
+def select_columns(model: Any, fields: Optional[str]) -> list[str]:
+    """Valida `fields=` contra as colunas da tabela."""
+    return select_fields(list(model.__table__.columns.keys()), fields)
+
+
+async def fetch_page(
+    db: AsyncSession,
+    model: Any,
+    stmt: Optional[Select],
+    params: PageParams,
+    item: type[Item],
+    extra: Optional[Mapping[str, ColumnElement[Any]]] = None,
+) -> Page[Item]:
+    """Executa uma página keyset a partir dos filtros de `stmt`.
+
+    Só as colunas pedidas (mais `day`/`id`, usadas no cursor) são lidas,
+    como linhas Core, sem instanciar objetos ORM.
+
+    Args:
+        db (AsyncSession): Sessão assíncrona.
+        model: Tabela Gold diária (com `day` e `id`).
+        stmt (Optional[Select]): Consulta de `crud.*_stmt`; só o WHERE é
+            reaproveitado. None = filtro sem resultados (ex.: fornecedor
+            inexistente).
+        params (PageParams): limite, cursor, projeção e total.
+        item (type[Item]): Schema do item; define os campos aceitos em
+            `fields=` e a ordem de saída.
+        extra (Optional[Mapping[str, ColumnElement]]): Campos que não são
+            colunas da tabela (ex.: nome do fornecedor via subquery).
+    """
+    lookup: dict[str, ColumnElement[Any]] = {
+        **model.__table__.c,
+        **(extra or {}),
+    }
+    names = select_fields(list(item.model_fields), params.fields)
+    if stmt is None:
+        return Page[Item](
+            items=[],
+            next_cursor=None,
+            total=0 if params.include_total else None,
+        )
+
+    where = [stmt.whereclause] if stmt.whereclause is not None else []
+    columns = [
+        lookup[n].label(n) for n in dict.fromkeys([*names, "day", "id"])
+    ]
+    query = select(*columns).where(*where)
+    if params.cursor:
+        after_day, after_id = decode_cursor(params.cursor)
+        query = query.where(
+            tuple_(model.day, model.id) < tuple_(after_day, after_id)
+        )
+    query = query.order_by(model.day.desc(), model.id.desc()).limit(
+        params.limit + 1
+    )
+
+    rows = (await db.execute(query)).mappings().all()
+    next_cursor = None
+    if len(rows) > params.limit:
+        rows = rows[: params.limit]
+        next_cursor = encode_cursor(rows[-1]["day"], rows[-1]["id"])
+
+    total = None
+    if params.include_total:
+        total = await db.scalar(
+            select(func.count()).select_from(model).where(*where)
+        )
+
+    return Page[Item](
+        items=[
+            item.model_construct(**{n: row[n] for n in names}) for row in rows
+        ],
+        next_cursor=next_cursor,
+        total=total,
+    )
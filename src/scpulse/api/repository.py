@@ -0,0 +1,283 @@
+"""Backends de leitura das rotas Gold: Postgres ou DuckDB sobre Parquet.
+
+As rotas de `orders`, `inventory` e `suppliers` dependem de
+`get_repository`, que devolve a implementação escolhida por
+`API_READ_BACKEND`:
+
+    postgres  tabelas Gold do Postgres (crud + paginação keyset);
+    duckdb    Parquets Gold do lake via `storage.duck`, sem ida ao Postgres.
+
+As duas implementações devolvem a mesma `Page[<schema>Out]` e aceitam os
+mesmos filtros e `fields=`. `id`,
+`<dimensão>_id` e `created_at` só existem no Postgres e vêm null no
+DuckDB; a chave natural (`supplier` / `sku`) vem dos dois.
+"""
+
+import dataclasses
+import os
+from collections.abc import AsyncIterator
+from datetime import date
+from typing import Any, Optional, Protocol
+
+from fastapi.concurrency import run_in_threadpool
+
+from src.scpulse.api.pagination import (
+    PageParams,
+    decode_cursor,
+    encode_cursor,
+    fetch_page,
+    select_fields,
+)
+from src.scpulse.api.schemas.schemas import (
+    InventoryAlertOut,
+    Item,
+    OrderCreatedOut,
+    OrderDelayedOut,
+    Page,
+)
+from src.scpulse.storage import crud, duck
+from src.scpulse.storage.models.entities import (
+    InventoryAlertsDaily,
+    OrdersCreatedDaily,
+    OrdersDelayedDaily,
+    Sku,
+    Supplier,
+)
+from src.scpulse.storage.postgres import AsyncSessionLocal
+from sqlalchemy import ColumnElement, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+API_READ_BACKEND = os.getenv("API_READ_BACKEND", "postgres")
+
+
+def _natural_key(model: Any) -> dict[str, ColumnElement[Any]]:
+    """Chave natural da dimensão de cada linha Gold (subquery pela PK)."""
+    if hasattr(model, "sku_id"):
+        sku = select(Sku.sku_code).where(Sku.id == model.sku_id)
+        return {"sku": sku.scalar_subquery()}
+    name = select(Supplier.name).where(Supplier.id == model.supplier_id)
+    return {"supplier": name.scalar_subquery()}
+
+
+class GoldRepository(Protocol):
+    name: str
+
+    async def orders_created(
+        self,
+        supplier: Optional[str],
+        start: Optional[date],
+        end: Optional[date],
+        page: PageParams,
+    ) -> Page[OrderCreatedOut]: ...
+
+    async def orders_delayed(
+        self,
+        supplier: Optional[str],
+        start: Optional[date],
+        end: Optional[date],
+        page: PageParams,
+    ) -> Page[OrderDelayedOut]: ...
+
+    async def inventory_alerts(
+        self,
+        sku: Optional[str],
+        start: Optional[date],
+        end: Optional[date],
+        page: PageParams,
+    ) -> Page[InventoryAlertOut]: ...
+
+    async def suppliers(self) -> list[dict[str, Any]]: ...
+
+    async def skus(self) -> list[dict[str, Any]]: ...
+
+
+class PostgresRepository:
+    """Tabelas Gold do Postgres (comportamento original das rotas)."""
+
+    name = "postgres"
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def _page(
+        self, model: Any, item: type[Item], stmt: Any, page: PageParams
+    ) -> Page[Item]:
+        return await fetch_page(
+            self.db, model, stmt, page, item, _natural_key(model)
+        )
+
+    async def orders_created(
+        self,
+        supplier: Optional[str],
+        start: Optional[date],
+        end: Optional[date],
+        page: PageParams,
+    ) -> Page[OrderCreatedOut]:
+        stmt = await crud.orders_created_query_async(
+            self.db, supplier, start, end
+        )
+        return await self._page(
+            OrdersCreatedDaily, OrderCreatedOut, stmt, page
+        )
+
+    async def orders_delayed(
+        self,
+        supplier: Optional[str],
+        start: Optional[date],
+        end: Optional[date],
+        page: PageParams,
+    ) -> Page[OrderDelayedOut]:
+        stmt = await crud.orders_delayed_query_async(
+            self.db, supplier, start, end
+        )
+        return await self._page(
+            OrdersDelayedDaily, OrderDelayedOut, stmt, page
+        )
+
+    async def inventory_alerts(
+        self,
+        sku: Optional[str],
+        start: Optional[date],
+        end: Optional[date],
+        page: PageParams,
+    ) -> Page[InventoryAlertOut]:
+        stmt = await crud.inventory_alerts_query_async(
+            self.db, sku, start, end
+        )
+        return await self._page(
+            InventoryAlertsDaily, InventoryAlertOut, stmt, page
+        )
+
+    async def suppliers(self) -> list[dict[str, Any]]:
+        rows = await self.db.execute(
+            select(Supplier.id, Supplier.name).order_by(Supplier.id)
+        )
+        return [dict(row) for row in rows.mappings()]
+
+    async def skus(self) -> list[dict[str, Any]]:
+        rows = await self.db.execute(
+            select(Sku.id, Sku.sku_code).order_by(Sku.id)
+        )
+        return [dict(row) for row in rows.mappings()]
+
+
+class DuckDBRepository:
+    """Parquets Gold do lake, lidos pelo DuckDB embutido.
+
+    As consultas do DuckDB são síncronas (e liberam o GIL): rodam no
+    threadpool para não bloquear o event loop; cada thread usa o próprio
+    cursor do `DuckLake`.
+    """
+
+    name = "duckdb"
+
+    def __init__(self, lake: duck.DuckLake) -> None:
+        self.lake = lake
+
+    async def _page(
+        self,
+        metric: str,
+        item: type[Item],
+        key: Optional[str],
+        start: Optional[date],
+        end: Optional[date],
+        page: PageParams,
+    ) -> Page[Item]:
+        spec = duck.GOLD_QUERIES[metric]
+        columns = [f.name for f in dataclasses.fields(spec.row)]
+        names = select_fields(list(item.model_fields), page.fields)
+        after = None
+        if page.cursor:
+            after = decode_cursor(page.cursor, key_type=str)
+
+        rows = await run_in_threadpool(
+            duck.query_gold,
+            metric,
+            key,
+            start,
+            end,
+            after,
+            page.limit + 1,
+            self.lake,
+        )
+        next_cursor = None
+        if len(rows) > page.limit:
+            rows = rows[: page.limit]
+            last = dict(zip(columns, rows[-1]))
+            next_cursor = encode_cursor(last["day"], last[spec.key])
+
+        total = None
+        if page.include_total:
+            total = await run_in_threadpool(
+                duck.count_gold, metric, key, start, end, self.lake
+            )
+        # campos só do Postgres (id, *_id, created_at) vêm null
+        values = [dict(zip(columns, row)) for row in rows]
+        return Page[Item](
+            items=[
+                item.model_construct(**{n: v.get(n) for n in names})
+                for v in values
+            ],
+            next_cursor=next_cursor,
+            total=total,
+        )
+
+    async def orders_created(
+        self,
+        supplier: Optional[str],
+        start: Optional[date],
+        end: Optional[date],
+        page: PageParams,
+    ) -> Page[OrderCreatedOut]:
+        return await self._page(
+            "orders_created", OrderCreatedOut, supplier, start, end, page
+        )
+
+    async def orders_delayed(
+        self,
+        supplier: Optional[str],
+        start: Optional[date],
+        end: Optional[date],
+        page: PageParams,
+    ) -> Page[OrderDelayedOut]:
+        return await self._page(
+            "orders_delayed", OrderDelayedOut, supplier, start, end, page
+        )
+
+    async def inventory_alerts(
+        self,
+        sku: Optional[str],
+        start: Optional[date],
+        end: Optional[date],
+        page: PageParams,
+    ) -> Page[InventoryAlertOut]:
+        return await self._page(
+            "inventory_alerts", InventoryAlertOut, sku, start, end, page
+        )
+
+    async def suppliers(self) -> list[dict[str, Any]]:
+        names = await run_in_threadpool(
+            duck.list_dimension, "supplier", self.lake
+        )
+        return [{"name": name} for name in names]
+
+    async def skus(self) -> list[dict[str, Any]]:
+        codes = await run_in_threadpool(duck.list_dimension, "sku", self.lake)
+        return [{"sku_code": code} for code in codes]
+
+
+async def get_repository() -> AsyncIterator[GoldRepository]:
+    """Dependency do backend de leitura (`API_READ_BACKEND`).
+
+    No backend DuckDB nenhuma sessão do Postgres é aberta.
+    """
+    if API_READ_BACKEND == "duckdb":
+        yield DuckDBRepository(duck.get_lake())
+        return
+    if API_READ_BACKEND != "postgres":
+        raise RuntimeError(
+            f"API_READ_BACKEND inválido: {API_READ_BACKEND!r} "
+            "(use postgres ou duckdb)"
+        )
+    async with AsyncSessionLocal() as db:
+        yield PostgresRepository(db)
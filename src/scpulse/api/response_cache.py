@@ -0,0 +1,243 @@
+"""Cache de respostas das consultas Gold, invalidado pela geração do ETL.
+
+As tabelas Gold só mudam quando `silver_to_gold` confirma uma carga, e na
+transação de cada carga o ETL incrementa a geração (`storage.generation`,
+tabela `gold_generation` no Postgres). A chave do
+cache é `geração + rota + query string normalizada`: quando a geração muda,
+as entradas antigas simplesmente deixam de ser encontradas (e expiram pelo
+TTL / LRU). O mesmo par vira o ETag, então `If-None-Match` é respondido com
+304 sem tocar no cache nem no banco.
+
+Backends:
+    memory: LRU em processo com TTL (padrão).
+    redis:  qualquer servidor compatível com Redis em `REDIS_URL` (Redis,
+            Valkey, KeyDB...), compartilhado entre réplicas da API.
+    off:    desliga o cache (ETag continua ativo).
+
+Fonte da geração (`GOLD_GENERATION_SOURCE`; por padrão acompanha o
+`API_READ_BACKEND`):
+    postgres: tabela `gold_generation`, lida no máximo uma vez a cada
+              `GOLD_GENERATION_POLL_S` (padrão do backend postgres; vale
+              com várias réplicas e com o ETL em outro host).
+    file:     marcador `_generation.json` ao lado dos Parquets Gold
+              (padrão do backend duckdb, que não abre conexão com o
+              Postgres); exige API e ETL no mesmo filesystem.
+"""
+
+import hashlib
+import json
+import os
+from collections.abc import Awaitable, Iterable
+from typing import Any, Callable, Optional, Protocol
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from src.scpulse.core.cache import LRUCache
+from src.scpulse.storage.generation import (
+    DbGenerationWatcher,
+    GenerationWatcher,
+)
+
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import RedisError
+except ImportError:  # pragma: no cover - depende do ambiente
+    aioredis = None
+    RedisError = OSError
+
+API_CACHE_BACKEND = os.getenv("API_CACHE_BACKEND", "memory")
+API_CACHE_MAX_ENTRIES = int(os.getenv("API_CACHE_MAX_ENTRIES", "2048"))
+API_CACHE_TTL_S = float(os.getenv("API_CACHE_TTL_S", "300"))
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+# Lido direto do ambiente: importar `repository` criaria as engines
+API_READ_BACKEND = os.getenv("API_READ_BACKEND", "postgres")
+GOLD_GENERATION_SOURCE = os.getenv("GOLD_GENERATION_SOURCE") or (
+    "file" if API_READ_BACKEND == "duckdb" else "postgres"
+)
+
+
+class CacheBackend(Protocol):
+    async def get(self, key: str) -> Optional[bytes]: ...
+
+    async def set(self, key: str, value: bytes) -> None: ...
+
+
+class MemoryBackend:
+    """Corpos de resposta em um LRU local (por processo)."""
+
+    def __init__(
+        self,
+        maxsize: int = API_CACHE_MAX_ENTRIES,
+        ttl_seconds: Optional[float] = API_CACHE_TTL_S,
+    ) -> None:
+        self.entries: LRUCache[str, bytes] = LRUCache(maxsize, ttl_seconds)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self.entries.get(key)
+
+    async def set(self, key: str, value: bytes) -> None:
+        self.entries.set(key, value)
+
+
+class RedisBackend:
+    """Corpos de resposta em um servidor compatível com Redis.
+
+    O tamanho é limitado pelo TTL de cada chave e pela política de
+    eviction do servidor (`maxmemory-policy allkeys-lru`). Falhas de
+    conexão viram miss: o cache nunca derruba a API.
+    """
+
+    def __init__(
+        self,
+        url: str = REDIS_URL,
+        ttl_seconds: float = API_CACHE_TTL_S,
+        prefix: str = "scpulse:api:",
+    ) -> None:
+        if aioredis is None:
+            raise RuntimeError(
+                "redis não está instalado. Rode: poetry add redis"
+            )
+        self.client = aioredis.from_url(url)
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            value = await self.client.get(self.prefix + key)
+        except RedisError as e:
+            print(f"[CACHE WARN] Redis indisponível: {e}")
+            return None
+        return None if value is None else bytes(value)
+
+    async def set(self, key: str, value: bytes) -> None:
+        try:
+            await self.client.set(
+                self.prefix + key, value, ex=max(1, int(self.ttl_seconds))
+            )
+        except RedisError as e:
+            print(f"[CACHE WARN] Redis indisponível: {e}")
+
+
+def make_backend(name: str = API_CACHE_BACKEND) -> Optional[CacheBackend]:
+    if name == "memory":
+        return MemoryBackend()
+    if name == "redis":
+        return RedisBackend()
+    if name == "off":
+        return None
+    raise ValueError(
+        f"API_CACHE_BACKEND inválido: {name!r} (use memory, redis ou off)"
+    )
+
+
+def make_generation(
+    source: str = GOLD_GENERATION_SOURCE,
+) -> Callable[[], Awaitable[int]]:
+    """Função assíncrona que devolve a geração Gold atual."""
+    if source == "postgres":
+        return DbGenerationWatcher().current
+    if source == "file":
+        watcher = GenerationWatcher()
+
+        async def current() -> int:
+            return watcher.current()
+
+        return current
+    raise ValueError(
+        f"GOLD_GENERATION_SOURCE inválido: {source!r} (use postgres ou file)"
+    )
+
+
+def normalize_params(params: Iterable[tuple[str, str]]) -> list[list[str]]:
+    """Query string canônica: sem valores vazios, ordenada por nome.
+
+    `?end=&supplier=A&start=2025-01-01` e `?start=2025-01-01&supplier=A`
+    geram a mesma chave. A ordem de `fields=` é preservada (define a ordem
+    das colunas na resposta).
+    """
+    return sorted(
+        [name, value.strip()] for name, value in params if value.strip()
+    )
+
+
+def cache_key(
+    path: str, params: Iterable[tuple[str, str]], generation: int
+) -> str:
+    canonical = json.dumps([path, normalize_params(params)])
+    digest = hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+    return f"{generation}-{digest}"
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Compara `If-None-Match` com o ETag (comparação fraca, RFC 9110)."""
+    if not if_none_match:
+        return False
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    return "*" in candidates or etag in [
+        c.removeprefix("W/") for c in candidates
+    ]
+
+
+class ResponseCache:
+    """Serve respostas JSON pelo cache, com ETag derivado da geração Gold.
+
+    Args:
+        backend (Optional[CacheBackend]): Onde guardar os corpos. None =
+            sem cache (apenas ETag / 304).
+        generation (Callable[[], Awaitable[int]]): Geração Gold atual.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend],
+        generation: Callable[[], Awaitable[int]],
+    ) -> None:
+        self.backend = backend
+        self.generation = generation
+
+    async def respond(
+        self,
+        request: Request,
+        produce: Callable[[], Awaitable[Any]],
+        vary: Iterable[tuple[str, str]] = (),
+        exclude_unset: bool = False,
+    ) -> Response:
+        """Resposta de `request`, chamando `produce` só em cache miss.
+
+        `vary` entra na chave junto com a query string: use para valores
+        implícitos que mudam a resposta (ex.: "hoje" como padrão).
+        `exclude_unset` equivale ao `response_model_exclude_unset` do
+        FastAPI (campos fora de `fields=` não vão para o JSON).
+        """
+        key = cache_key(
+            request.url.path,
+            [*request.query_params.multi_items(), *vary],
+            await self.generation(),
+        )
+        headers = {"ETag": f'"{key}"', "Cache-Control": "no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+
+        body = None
+        if self.backend is not None:
+            body = await self.backend.get(key)
+        headers["X-Cache"] = "HIT" if body is not None else "MISS"
+        if body is None:
+            body = json.dumps(
+                jsonable_encoder(await produce(), exclude_unset=exclude_unset),
+                separators=(",", ":"),
+            ).encode()
+            if self.backend is not None:
+                await self.backend.set(key, body)
+        return Response(
+            content=body, media_type="application/json", headers=headers
+        )
+
+
+response_cache = ResponseCache(make_backend(), make_generation())
+
+
+def get_response_cache() -> ResponseCache:
+    """Dependency do cache de respostas (sobrescrevível nos testes)."""
+    return response_cache
@@ -0,0 +1,105 @@
+"""Agregados servidos dos rollups (semana, mês, total e top-N).
+
+As consultas leem `*_rollup`, mantidas pelo ETL na mesma transação das
+tabelas diárias: o custo é proporcional ao número de grupos devolvidos, não
+ao histórico diário.
+"""
+
+from datetime import date
+from typing import Any, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.scpulse.api.response_cache import ResponseCache, get_response_cache
+from src.scpulse.storage import rollups
+from src.scpulse.storage.dimensions import SKUS, SUPPLIERS
+from src.scpulse.storage.postgres import get_async_session
+
+router = APIRouter(prefix="/aggregates", tags=["Aggregates"])
+
+
+def _spec(dataset: str) -> rollups.RollupSpec:
+    if dataset not in rollups.ROLLUPS:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Dataset desconhecido. Use um de {list(rollups.ROLLUPS)}",
+        )
+    return rollups.ROLLUPS[dataset]
+
+
+def _check_grain(grain: str) -> None:
+    if grain not in rollups.GRAINS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"grain inválido. Use um de {list(rollups.GRAINS)}",
+        )
+
+
+async def _fetch(db: AsyncSession, stmt: Any) -> list[dict[str, Any]]:
+    return [dict(row) for row in (await db.execute(stmt)).mappings()]
+
+
+@router.get("/{dataset}")
+async def get_rollup(
+    request: Request,
+    dataset: str,
+    grain: str = Query("month", description="week, month ou total"),
+    supplier: Optional[str] = Query(None, description="Filtrar fornecedor"),
+    sku: Optional[str] = Query(None, description="Filtrar SKU"),
+    start: Optional[date] = Query(None, description="Data inicial"),
+    end: Optional[date] = Query(None, description="Data final"),
+    db: AsyncSession = Depends(get_async_session),
+    cache: ResponseCache = Depends(get_response_cache),
+) -> Response:
+    spec = _spec(dataset)
+    _check_grain(grain)
+
+    async def produce() -> list[dict[str, Any]]:
+        key_id = None
+        if spec.dimension == "sku_id" and sku:
+            key_id = await SKUS.id_of_async(db, sku)
+            if key_id is None:
+                return []
+        elif spec.dimension == "supplier_id" and supplier:
+            key_id = await SUPPLIERS.id_of_async(db, supplier)
+            if key_id is None:
+                return []
+        return await _fetch(
+            db, rollups.rollup_stmt(dataset, grain, key_id, start, end)
+        )
+
+    return await cache.respond(request, produce)
+
+
+@router.get("/{dataset}/top")
+async def get_top(
+    request: Request,
+    dataset: str,
+    grain: str = Query("total", description="week, month ou total"),
+    period: Optional[date] = Query(
+        None, description="Qualquer dia do período (padrão: hoje)"
+    ),
+    by: Optional[str] = Query(None, description="Medida de ordenação"),
+    n: int = Query(10, ge=1, le=100, description="Tamanho do ranking"),
+    db: AsyncSession = Depends(get_async_session),
+    cache: ResponseCache = Depends(get_response_cache),
+) -> Response:
+    _spec(dataset)
+    _check_grain(grain)
+    measures = rollups.sort_measures(dataset)
+    by = by or measures[0]
+    if by not in measures:
+        raise HTTPException(
+            status_code=400, detail=f"by inválido. Use um de {measures}"
+        )
+
+    day = period or date.today()
+
+    async def produce() -> list[dict[str, Any]]:
+        return await _fetch(db, rollups.top_stmt(dataset, grain, day, by, n))
+
+    return await cache.respond(
+        request, produce, vary=[("_period", day.isoformat())]
+    )
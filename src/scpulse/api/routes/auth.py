@@ -1,31 +1,38 @@
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.scpulse.api.dependencies.auth import token_claims
 from src.scpulse.api.schemas.auth import Token
-from src.scpulse.storage.postgres import get_session
+from src.scpulse.storage.postgres import get_async_session
 from src.scpulse.storage.models.users import User
-from src.scpulse.core.security import verify_password, create_access_token
+from src.scpulse.storage.user_cache import USERS
+from src.scpulse.core.security import (
+    create_access_token,
+    verify_password_async,
+)
 from sqlalchemy.future import select
 
 router = APIRouter()
 
 
 @router.post("/login")
-def login(
+async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_session),
+    db: AsyncSession = Depends(get_async_session),
 ) -> Token:
     query = select(User).where(User.email == form_data.username)
-    result = db.execute(query)
+    result = await db.execute(query)
     user = result.scalars().first()
 
-    if not user or not verify_password(
+    # bcrypt é CPU-bound: roda no pool limitado (429 se saturado)
+    if not user or not await verify_password_async(
         form_data.password, user.hashed_password
     ):
         raise HTTPException(
             status_code=400, detail="Incorrect email or password"
         )
 
-    token = create_access_token(data={"sub": user.email})
+    # 🔹 Já deixa o usuário em cache para as requisições com este token
+    token = create_access_token(data=token_claims(USERS.put(user)))
     return Token(access_token=token, token_type="bearer")
@@ -0,0 +1,113 @@
+"""Exportação em massa das tabelas Gold, em streaming.
+
+`GET /exports/{dataset}?format=ndjson|csv|arrow|parquet` percorre a tabela
+com um cursor do lado do servidor (`AsyncSession.stream`) e envia cada lote
+assim que ele é lido: a memória do servidor não depende do tamanho do
+resultado.
+"""
+
+import os
+from collections.abc import AsyncIterator
+from datetime import date
+from typing import Any, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.scpulse.api.export_formats import EXPORT_FORMATS, pa
+from src.scpulse.api.pagination import select_columns
+from src.scpulse.storage import crud
+from src.scpulse.storage.models.entities import (
+    InventoryAlertsDaily,
+    OrdersCreatedDaily,
+    OrdersDelayedDaily,
+)
+from src.scpulse.storage.postgres import AsyncSessionLocal, get_async_session
+
+EXPORT_BATCH_ROWS = int(os.getenv("EXPORT_BATCH_ROWS", "10000"))
+
+# dataset → (tabela, builder do filtro)
+DATASETS: dict[str, tuple[Any, Any]] = {
+    "orders_created": (OrdersCreatedDaily, crud.orders_created_query_async),
+    "orders_delayed": (OrdersDelayedDaily, crud.orders_delayed_query_async),
+    "inventory_alerts": (
+        InventoryAlertsDaily,
+        crud.inventory_alerts_query_async,
+    ),
+}
+
+router = APIRouter(prefix="/exports", tags=["Exports"])
+
+
+async def _stream_batches(
+    query: Optional[Select],
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Lê `query` em lotes com um cursor do lado do servidor.
+
+    O gerador abre a própria sessão: a sessão da dependency é fechada
+    antes de a resposta terminar de ser enviada.
+    """
+    if query is None:
+        return
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(
+            query.execution_options(yield_per=EXPORT_BATCH_ROWS)
+        )
+        async for partition in result.mappings().partitions():
+            yield [dict(row) for row in partition]
+
+
+@router.get("/{dataset}")
+async def export_dataset(
+    dataset: str,
+    fmt: str = Query(
+        "ndjson", alias="format", description="ndjson, csv, arrow, parquet"
+    ),
+    supplier: Optional[str] = Query(None, description="Filtrar fornecedor"),
+    sku: Optional[str] = Query(None, description="Filtrar SKU"),
+    start: Optional[date] = Query(None, description="Data inicial"),
+    end: Optional[date] = Query(None, description="Data final"),
+    fields: Optional[str] = Query(
+        None, description="Colunas a exportar, separadas por vírgula"
+    ),
+    db: AsyncSession = Depends(get_async_session),
+) -> StreamingResponse:
+    if dataset not in DATASETS:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Dataset desconhecido. Use um de {list(DATASETS)}",
+        )
+    if fmt not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Formato inválido. Use um de {list(EXPORT_FORMATS)}",
+        )
+    encode, media_type, extension, needs_arrow = EXPORT_FORMATS[fmt]
+    if needs_arrow and pa is None:
+        raise HTTPException(
+            status_code=501,
+            detail=f"Formato {fmt} requer pyarrow no servidor",
+        )
+
+    model, build_query = DATASETS[dataset]
+    key = sku if model is InventoryAlertsDaily else supplier
+    stmt = await build_query(db, key, start, end)
+
+    columns = [model.__table__.c[n] for n in select_columns(model, fields)]
+    query = None
+    if stmt is not None:
+        query = select(*columns).order_by(model.day.desc(), model.id.desc())
+        if stmt.whereclause is not None:
+            query = query.where(stmt.whereclause)
+
+    return StreamingResponse(
+        encode(_stream_batches(query), columns),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="{dataset}.{extension}"'
+            )
+        },
+    )
@@ -1,21 +1,34 @@
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, Request, Response
 from datetime import date
-from typing import List, Optional, Sequence
+from typing import Optional
 
-from src.scpulse.storage.models.entities import InventoryAlertsDaily
-from src.scpulse.storage.postgres import get_session
-from src.scpulse.storage import crud
-from src.scpulse.api.schemas.schemas import InventoryAlertOut
+from src.scpulse.api.pagination import PageParams
+from src.scpulse.api.repository import GoldRepository, get_repository
+from src.scpulse.api.response_cache import (
+    ResponseCache,
+    get_response_cache,
+)
+from src.scpulse.api.schemas.schemas import InventoryAlertOut, Page
 
 router = APIRouter(prefix="/inventory", tags=["Inventory"])
 
 
-@router.get("/alerts", response_model=List[InventoryAlertOut])
-def get_inventory_alerts(
+@router.get("/alerts", response_model=Page[InventoryAlertOut])
+async def get_inventory_alerts(
+    request: Request,
     sku: Optional[str] = Query(None),
     start: Optional[date] = Query(None),
     end: Optional[date] = Query(None),
-    db: Session = Depends(get_session),
-) -> Sequence[InventoryAlertsDaily]:
-    return crud.get_inventory_alerts(db, sku=sku, start=start, end=end)
+    page: PageParams = Depends(),
+    repo: GoldRepository = Depends(get_repository),
+    cache: ResponseCache = Depends(get_response_cache),
+) -> Response:
+    async def produce() -> Page[InventoryAlertOut]:
+        return await repo.inventory_alerts(sku, start, end, page)
+
+    return await cache.respond(
+        request,
+        produce,
+        vary=[("_backend", repo.name)],
+        exclude_unset=True,
+    )
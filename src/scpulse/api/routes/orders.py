@@ -1,38 +1,63 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from datetime import date
-from typing import Optional, List, Sequence
+from typing import Optional
 
-from src.scpulse.storage.models.entities import (
-    OrdersDelayedDaily,
-    OrdersCreatedDaily,
+from src.scpulse.api.pagination import PageParams
+from src.scpulse.api.repository import GoldRepository, get_repository
+from src.scpulse.api.response_cache import (
+    ResponseCache,
+    get_response_cache,
+)
+from src.scpulse.api.schemas.schemas import (
+    OrderCreatedOut,
+    OrderDelayedOut,
+    Page,
 )
-from src.scpulse.storage.postgres import get_session
-from src.scpulse.storage import crud
-from src.scpulse.api.schemas.schemas import OrderCreatedOut, OrderDelayedOut
-from sqlalchemy.orm import Session
 
 router = APIRouter(prefix="/orders", tags=["orders"])
 
 
-@router.get("/created", response_model=List[OrderCreatedOut])
-def list_orders_created(
+@router.get("/created", response_model=Page[OrderCreatedOut])
+async def list_orders_created(
+    request: Request,
     supplier: Optional[str] = Query(
         None, description="Filtrar por fornecedor"
     ),
     start: Optional[date] = Query(None, description="Data inicial"),
     end: Optional[date] = Query(None, description="Data final"),
-    db: Session = Depends(get_session),
-) -> Sequence[OrdersCreatedDaily]:
-    return crud.get_orders_created(db, supplier=supplier, start=start, end=end)
+    page: PageParams = Depends(),
+    repo: GoldRepository = Depends(get_repository),
+    cache: ResponseCache = Depends(get_response_cache),
+) -> Response:
+    async def produce() -> Page[OrderCreatedOut]:
+        return await repo.orders_created(supplier, start, end, page)
+
+    return await cache.respond(
+        request,
+        produce,
+        vary=[("_backend", repo.name)],
+        exclude_unset=True,
+    )
 
 
-@router.get("/delayed", response_model=List[OrderDelayedOut])
-def list_orders_delayed(
+@router.get("/delayed", response_model=Page[OrderDelayedOut])
+async def list_orders_delayed(
+    request: Request,
     supplier: Optional[str] = Query(
         None, description="Filtrar por fornecedor"
     ),
     start: Optional[date] = Query(None, description="Data inicial"),
     end: Optional[date] = Query(None, description="Data final"),
-    db: Session = Depends(get_session),
-) -> Sequence[OrdersDelayedDaily]:
-    return crud.get_orders_delayed(db, supplier=supplier, start=start, end=end)
+    page: PageParams = Depends(),
+    repo: GoldRepository = Depends(get_repository),
+    cache: ResponseCache = Depends(get_response_cache),
+) -> Response:
+    async def produce() -> Page[OrderDelayedOut]:
+        return await repo.orders_delayed(supplier, start, end, page)
+
+    return await cache.respond(
+        request,
+        produce,
+        vary=[("_backend", repo.name)],
+        exclude_unset=True,
+    )
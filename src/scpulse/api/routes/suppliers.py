@@ -1,22 +1,36 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from sqlalchemy import select
-from typing import List, Sequence, Any
+from fastapi import APIRouter, Depends, Request, Response
+from typing import Any, List
 
-from src.scpulse.storage.postgres import get_session
-from src.scpulse.storage.models.entities import Supplier, Sku
+from src.scpulse.api.repository import GoldRepository, get_repository
+from src.scpulse.api.response_cache import ResponseCache, get_response_cache
 from src.scpulse.api.schemas.schemas import SupplierOut, SkuOut
 
 router = APIRouter(prefix="/suppliers", tags=["Suppliers"])
 
 
 @router.get("/", response_model=List[SupplierOut])
-def list_suppliers(
-    db: Session = Depends(get_session),
-) -> Sequence[Supplier] | Any:
-    return db.execute(select(Supplier)).scalars().all()
+async def list_suppliers(
+    request: Request,
+    repo: GoldRepository = Depends(get_repository),
+    cache: ResponseCache = Depends(get_response_cache),
+) -> Response:
+    async def produce() -> list[dict[str, Any]]:
+        return await repo.suppliers()
+
+    return await cache.respond(
+        request, produce, vary=[("_backend", repo.name)]
+    )
 
 
 @router.get("/skus", response_model=List[SkuOut])
-def list_skus(db: Session = Depends(get_session)) -> Sequence[Sku] | Any:
-    return db.execute(select(Sku)).scalars().all()
+async def list_skus(
+    request: Request,
+    repo: GoldRepository = Depends(get_repository),
+    cache: ResponseCache = Depends(get_response_cache),
+) -> Response:
+    async def produce() -> list[dict[str, Any]]:
+        return await repo.skus()
+
+    return await cache.respond(
+        request, produce, vary=[("_backend", repo.name)]
+    )
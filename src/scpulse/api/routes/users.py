@@ -1,25 +1,43 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from src.scpulse.api.schemas.users import UserOut, UserCreate
 from src.scpulse.api.dependencies.auth import get_current_user
 from src.scpulse.storage.models.users import User
-from src.scpulse.storage.postgres import get_session
-from src.scpulse.storage.users_crud import create_user
+from src.scpulse.storage.postgres import get_async_session
+from src.scpulse.storage.user_cache import CachedUser
+from src.scpulse.storage.users_crud import create_user_async
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter()
 
 
 @router.get("/me", response_model=UserOut)
-def read_own_profile(current_user: User = Depends(get_current_user)) -> User:
+async def read_own_profile(
+    current_user: CachedUser = Depends(get_current_user),
+) -> CachedUser:
     return current_user
 
 
+@router.post("/me/tokens/revoke", status_code=204)
+async def revoke_own_tokens(
+    current_user: CachedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_session),
+) -> Response:
+    """Invalida todos os tokens já emitidos (novo login necessário)."""
+    user = await db.get(User, current_user.id)
+    if user is None:
+        raise HTTPException(status_code=404, detail="Usuário não encontrado")
+    user.token_version += 1
+    await db.commit()
+    return Response(status_code=204)
+
+
 @router.post("/users/", response_model=UserOut)
-def create_user_route(
-    user: UserCreate, db: Session = Depends(get_session)
+async def create_user_route(
+    user: UserCreate, db: AsyncSession = Depends(get_async_session)
 ) -> User:
-    db_user = db.query(User).filter(User.email == user.email).first()
-    if db_user:
+    result = await db.execute(select(User).where(User.email == user.email))
+    if result.scalars().first():
         raise HTTPException(status_code=400, detail="Email já registrado")
-    return create_user(db, user)
+    return await create_user_async(db, user)
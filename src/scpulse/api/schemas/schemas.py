@@ -1,27 +1,50 @@
 from datetime import date, datetime
+from typing import Generic, Optional, TypeVar
+
 from pydantic import BaseModel
 
+Item = TypeVar("Item", bound=BaseModel)
+
+
+# ========== PAGINAÇÃO ==========
+class Page(BaseModel, Generic[Item]):
+    """Página keyset: linhas projetadas + cursor da próxima página.
+
+    Com `fields=`, cada item traz só os campos pedidos: os demais ficam
+    "unset" e são omitidos do JSON (as rotas serializam com
+    `exclude_unset`).
+    """
+
+    items: list[Item]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
 
 # ========== ORDERS ==========
+# Mesmo schema nos dois backends de leitura (`API_READ_BACKEND`): `id`,
+# `<dimensão>_id` e `created_at` só existem no Postgres (null no DuckDB);
+# a chave natural (`supplier` / `sku`) vem dos dois.
 class OrderCreatedOut(BaseModel):
-    id: int
+    id: Optional[int] = None
     day: date
-    supplier_id: int
+    supplier_id: Optional[int] = None
+    supplier: str
     total_orders: int
     total_qty: int
-    created_at: datetime
+    created_at: Optional[datetime] = None
 
     class Config:
         orm_mode = True
 
 
 class OrderDelayedOut(BaseModel):
-    id: int
+    id: Optional[int] = None
     day: date
-    supplier_id: int
+    supplier_id: Optional[int] = None
+    supplier: str
     delayed_orders: int
     avg_delay_days: float
-    created_at: datetime
+    created_at: Optional[datetime] = None
 
     class Config:
         orm_mode = True
@@ -29,12 +52,13 @@ class OrderDelayedOut(BaseModel):
 
 # ========== INVENTORY ==========
 class InventoryAlertOut(BaseModel):
-    id: int
+    id: Optional[int] = None
     day: date
-    sku_id: int
+    sku_id: Optional[int] = None
+    sku: str
     low_stock_alerts: int
     min_threshold: int
-    created_at: datetime
+    created_at: Optional[datetime] = None
 
     class Config:
         orm_mode = True
@@ -42,7 +66,7 @@ class InventoryAlertOut(BaseModel):
 
 # ========== SUPPLIER / SKU ==========
 class SupplierOut(BaseModel):
-    id: int
+    id: Optional[int] = None  # ausente no backend DuckDB
     name: str
 
     class Config:
@@ -50,7 +74,7 @@ class SupplierOut(BaseModel):
 
 
 class SkuOut(BaseModel):
-    id: int
+    id: Optional[int] = None  # ausente no backend DuckDB
     sku_code: str
 
     class Config:
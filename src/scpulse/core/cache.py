@@ -0,0 +1,111 @@
+"""Cache LRU em memória, thread-safe e com TTL opcional."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Callable,
+    Final,
+    Generic,
+    Hashable,
+    Iterable,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class _Missing:
+    """Sentinela de entrada ausente (distinta de um valor None)."""
+
+
+_MISSING: Final = _Missing()
+
+
+class LRUCache(Generic[K, V]):
+    """Mapa limitado a `maxsize` entradas, descartando a menos usada.
+
+    Args:
+        maxsize (int): Número máximo de entradas.
+        ttl_seconds (Optional[float]): Validade de cada entrada desde a
+            escrita. None = não expira.
+        clock (Callable[[], float]): Relógio monotônico (injetável nos
+            testes).
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize deve ser positivo")
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._data: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        with self._lock:
+            value = self._get(key)
+        return default if isinstance(value, _Missing) else value
+
+    def get_many(self, keys: Iterable[K]) -> dict[K, V]:
+        """Entradas presentes (e válidas) entre `keys`, com um único lock."""
+        found: dict[K, V] = {}
+        with self._lock:
+            for key in keys:
+                value = self._get(key)
+                if not isinstance(value, _Missing):
+                    found[key] = value
+        return found
+
+    def set(self, key: K, value: V) -> None:
+        with self._lock:
+            self._set(key, value)
+
+    def set_many(self, items: Iterable[tuple[K, V]]) -> None:
+        with self._lock:
+            for key, value in items:
+                self._set(key, value)
+
+    def delete(self, key: K) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _get(self, key: K) -> Union[V, _Missing]:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return _MISSING
+        value, expires_at = entry
+        if expires_at and self._clock() >= expires_at:
+            del self._data[key]
+            self.misses += 1
+            return _MISSING
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def _set(self, key: K, value: V) -> None:
+        expires_at = (
+            self._clock() + self.ttl_seconds if self.ttl_seconds else 0.0
+        )
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
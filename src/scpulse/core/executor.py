@@ -0,0 +1,71 @@
+"""Executor limitado para trabalho CPU-bound chamado de handlers async."""
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class ExecutorSaturated(RuntimeError):
+    """A fila do executor está cheia; o chamador deve tentar mais tarde."""
+
+
+class BoundedExecutor:
+    """Pool de threads dedicado com limite de tarefas pendentes.
+
+    No máximo `workers` tarefas rodam ao mesmo tempo e no máximo
+    `max_pending` (em execução + na fila) são aceitas; acima disso `run`
+    falha imediatamente com `ExecutorSaturated` em vez de enfileirar sem
+    limite (back-pressure). Uma tarefa só libera a vaga quando termina na
+    thread, mesmo que a requisição que a pediu tenha sido cancelada.
+
+    Args:
+        workers (int): Threads do pool.
+        max_pending (int): Tarefas aceitas ao mesmo tempo (>= workers).
+        name (str): Prefixo do nome das threads.
+    """
+
+    def __init__(self, workers: int, max_pending: int, name: str) -> None:
+        if workers <= 0:
+            raise ValueError("workers deve ser positivo")
+        self.workers = workers
+        self.max_pending = max(max_pending, workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=name
+        )
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.rejected = 0
+
+    def _acquire(self) -> None:
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise ExecutorSaturated(
+                    f"{self.pending} tarefas pendentes "
+                    f"(limite {self.max_pending})"
+                )
+            self.pending += 1
+
+    def _release(self) -> None:
+        with self._lock:
+            self.pending -= 1
+
+    def _on_done(self, _: Future[Any]) -> None:
+        self._release()
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Executa `fn(*args)` no pool sem bloquear o event loop."""
+        self._acquire()
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(self._on_done)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
@@ -6,6 +6,8 @@ import os
 
 from dotenv import load_dotenv
 
+from .executor import BoundedExecutor
+
 load_dotenv()
 
 SECRET_KEY: str = os.getenv("SECRET_KEY", "changeme")
@@ -14,7 +16,20 @@ ACCESS_TOKEN_EXPIRE_MINUTES: int = int(
     os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
 )
 
+# bcrypt (~100-300ms de CPU por chamada) roda em um pool próprio: não
+# ocupa o event loop nem o threadpool padrão usado pelo resto da API, e
+# acima de BCRYPT_MAX_PENDING chamadas a requisição é recusada (HTTP 429)
+BCRYPT_WORKERS: int = int(
+    os.getenv("BCRYPT_WORKERS", str(os.cpu_count() or 1))
+)
+BCRYPT_MAX_PENDING: int = int(
+    os.getenv("BCRYPT_MAX_PENDING", str(BCRYPT_WORKERS * 8))
+)
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+hash_executor = BoundedExecutor(
+    BCRYPT_WORKERS, BCRYPT_MAX_PENDING, name="bcrypt"
+)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool | Any:
@@ -25,6 +40,22 @@ def get_password_hash(password: str) -> str | Any:
     return pwd_context.hash(password)
 
 
+async def verify_password_async(
+    plain_password: str, hashed_password: str
+) -> bool:
+    """`verify_password` no pool do bcrypt (ExecutorSaturated se cheio)."""
+    return bool(
+        await hash_executor.run(
+            verify_password, plain_password, hashed_password
+        )
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """`get_password_hash` no pool do bcrypt (ExecutorSaturated se cheio)."""
+    return str(await hash_executor.run(get_password_hash, password))
+
+
 def create_access_token(
     data: Dict[str, Any], expires_delta: Optional[timedelta] = None
 ) -> str:
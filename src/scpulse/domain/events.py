@@ -0,0 +1,111 @@
+"""Schemas dos eventos de cadeia de suprimentos (camada Bronze).
+
+Espelham os campos gerados por `scripts.factories` para cada `event_type`.
+"""
+
+from datetime import datetime
+from typing import Annotated, Literal, Optional, Union
+
+import polars as pl
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+)
+
+BASE_EVENT_SCHEMA: dict[str, pl.DataType] = {
+    "event_id": pl.Utf8(),
+    "event_type": pl.Utf8(),
+    "timestamp": pl.Utf8(),  # ISO-8601, convertido para datetime no flush
+    "supplier": pl.Utf8(),
+    "sku": pl.Utf8(),
+    "qty": pl.Int64(),
+}
+
+EVENT_SCHEMAS: dict[str, dict[str, pl.DataType]] = {
+    "order_created": {
+        **BASE_EVENT_SCHEMA,
+        "order_id": pl.Utf8(),
+        "expected_delivery": pl.Utf8(),
+    },
+    "order_delayed": {
+        **BASE_EVENT_SCHEMA,
+        "order_id": pl.Utf8(),
+        "old_delivery": pl.Utf8(),
+        "new_delivery": pl.Utf8(),
+    },
+    "inventory_low": {
+        **BASE_EVENT_SCHEMA,
+        "threshold": pl.Int64(),
+    },
+}
+
+# União de todas as colunas conhecidas: schema estável dos part files
+BRONZE_SCHEMA: dict[str, pl.DataType] = {
+    name: dtype
+    for schema in EVENT_SCHEMAS.values()
+    for name, dtype in schema.items()
+}
+BRONZE_SCHEMA["timestamp"] = pl.Datetime("ns", "UTC")
+
+
+# =======================
+# Structs tipados (ingestão)
+# =======================
+# ISO-8601 com offset obrigatório (ex.: 2025-09-17T10:00:00.123+00:00)
+_ISO_TIMESTAMP_RE = (
+    r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?[+-]\d{2}:?\d{2}$"
+)
+
+
+def _valid_calendar_date(value: str) -> str:
+    """Rejeita datas impossíveis (ex.: 30/02) que o regex deixa passar."""
+    datetime.fromisoformat(value)  # ValueError vira erro de validação
+    return value
+
+
+IsoTimestamp = Annotated[
+    str,
+    StringConstraints(pattern=_ISO_TIMESTAMP_RE),
+    AfterValidator(_valid_calendar_date),
+]
+
+
+class _BaseEvent(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    event_id: Annotated[str, StringConstraints(min_length=1)]
+    timestamp: IsoTimestamp
+    supplier: Optional[str] = None
+    sku: Optional[str] = None
+    qty: Optional[int] = None
+
+
+class OrderCreatedEvent(_BaseEvent):
+    event_type: Literal["order_created"]
+    supplier: str
+    qty: int
+    order_id: Optional[str] = None
+    expected_delivery: Optional[IsoTimestamp] = None
+
+
+class OrderDelayedEvent(_BaseEvent):
+    event_type: Literal["order_delayed"]
+    supplier: str
+    order_id: Optional[str] = None
+    old_delivery: IsoTimestamp
+    new_delivery: IsoTimestamp
+
+
+class InventoryLowEvent(_BaseEvent):
+    event_type: Literal["inventory_low"]
+    sku: str
+    threshold: int
+
+
+SupplyChainEvent = Annotated[
+    Union[OrderCreatedEvent, OrderDelayedEvent, InventoryLowEvent],
+    Field(discriminator="event_type"),
+]
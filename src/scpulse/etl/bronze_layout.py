@@ -0,0 +1,105 @@
+"""Layout Hive da camada Bronze: `event_type=<tipo>/date=<dia>/part-*.parquet`.
+
+Centraliza a montagem e a listagem de partições para que ingestão,
+compactação e transformação leiam apenas as partições que precisam.
+"""
+
+import os
+from collections import defaultdict
+from pathlib import Path
+from typing import Optional
+
+import polars as pl
+
+# Valor de partição para chaves nulas (mesma convenção do Hive)
+DEFAULT_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+def partition_dir(base_dir: Path, event_type: Optional[str], day: str) -> Path:
+    """Diretório da partição de um tipo de evento em um dia."""
+    event_type = event_type or DEFAULT_PARTITION
+    return base_dir / f"event_type={event_type}" / f"date={day}"
+
+
+def split_by_partition(
+    df: pl.DataFrame,
+) -> list[tuple[Optional[str], str, pl.DataFrame]]:
+    """Divide um micro-batch por (event_type, dia do timestamp do evento)."""
+    keyed = df.with_columns(
+        pl.col("timestamp").dt.date().cast(pl.Utf8).alias("__day")
+    )
+    return [
+        (event_type, day or DEFAULT_PARTITION, part.drop("__day"))
+        for (event_type, day), part in keyed.group_by(
+            ["event_type", "__day"], maintain_order=True
+        )
+    ]
+
+
+def leaf_partitions(base_dir: Path) -> list[Path]:
+    """Lista todos os diretórios folha (`event_type=*/date=*`)."""
+    return sorted(
+        p for p in base_dir.glob("event_type=*/date=*") if p.is_dir()
+    )
+
+
+def bronze_days(
+    base_dir: Path, event_types: Optional[set[str]] = None
+) -> dict[str, list[Path]]:
+    """Agrupa os part files do Bronze por dia.
+
+    Args:
+        base_dir (Path): Raiz da camada Bronze.
+        event_types (Optional[set[str]]): Restringe a leitura a estes tipos
+            (poda de partições por `event_type`).
+
+    Returns:
+        dict[str, list[Path]]: Dia (`YYYY-MM-DD`) → part files ordenados.
+        Arquivos legados `events_<dia>.parquet` e partições `date=<dia>`
+        sem `event_type` também são incluídos.
+    """
+    days: dict[str, list[Path]] = defaultdict(list)
+    for leaf in leaf_partitions(base_dir):
+        event_type = leaf.parent.name.removeprefix("event_type=")
+        if event_types is not None and event_type not in event_types:
+            continue
+        days[leaf.name.removeprefix("date=")] += leaf.glob("*.parquet")
+
+    for legacy_dir in base_dir.glob("date=*"):
+        days[legacy_dir.name.removeprefix("date=")] += legacy_dir.glob(
+            "*.parquet"
+        )
+    for legacy in base_dir.glob("events_*.parquet"):
+        days[legacy.stem.removeprefix("events_")].append(legacy)
+
+    return {day: sorted(files) for day, files in sorted(days.items())}
+
+
+def fsync_dir(path: Path) -> None:
+    """Garante que a entrada do diretório (rename/unlink) foi persistida."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_durable(
+    df: pl.DataFrame, path: Path, row_group_size: Optional[int] = None
+) -> Path:
+    """Escreve um Parquet de forma atômica e durável.
+
+    Grava em `<nome>.tmp`, faz fsync e renomeia; leitores nunca veem um
+    arquivo parcial.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".parquet.tmp")
+    with open(tmp_path, "wb") as f:
+        df.write_parquet(
+            f, compression="snappy", row_group_size=row_group_size
+        )
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    fsync_dir(path.parent)
+    return path
@@ -1,62 +1,248 @@
+import hashlib
+import os
 from pathlib import Path
+from typing import Optional, Sequence, TypeVar
+
 import polars as pl
 
+from .dedup import DedupIndex
+
+# "lazy" (streaming, memória limitada) ou "eager" (referência/paridade)
+SILVER_ENGINE = os.getenv("SILVER_ENGINE", "lazy")
+# Qual versão de um event_id repetido vai para a Silver: a de menor
+# timestamp ("first") ou a de maior timestamp ("latest")
+SILVER_DEDUP_KEEP = os.getenv("SILVER_DEDUP_KEEP", "first")
+DEDUP_KEY = "event_id"
+
+REQUIRED_COLS = ["event_id", "event_type", "timestamp"]
+SILVER_TYPES = pl.Schema(
+    {
+        "event_id": pl.Utf8(),
+        "event_type": pl.Utf8(),
+        "timestamp": pl.Datetime("ns", "UTC"),
+    }
+)
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S%.f%z"  # aceita microssegundos + offset
+
+
+def _bronze_files(input_path: Path | Sequence[Path]) -> list[Path]:
+    """Resolve a entrada do Bronze em uma lista de arquivos Parquet."""
+    if isinstance(input_path, Path):
+        if not input_path.is_dir():
+            return [input_path]
+        return sorted(input_path.rglob("*.parquet"))
+    return list(input_path)
 
-def bronze_to_silver(input_path: Path, output_path: Path) -> None:
+
+def _read_bronze(input_path: Path | Sequence[Path]) -> pl.DataFrame:
+    """Lê um arquivo Bronze, uma partição ou uma lista de part files.
+
+    Part files de micro-batches distintos podem ter colunas diferentes
+    (ex.: arquivos legados sem schema fixo), então a leitura concatena os
+    arquivos de forma diagonal, preenchendo ausentes com nulo.
     """
-    Pipeline Bronze → Silver para normalização e qualidade de dados.
+    parts = _bronze_files(input_path)
+    if len(parts) == 1:
+        return pl.read_parquet(parts[0], hive_partitioning=False)
+    if not parts:
+        raise FileNotFoundError(f"Nenhum part file em {input_path}")
+    return pl.concat(
+        [pl.read_parquet(p, hive_partitioning=False) for p in parts],
+        how="diagonal_relaxed",
+    )
 
-    Este processo transforma os eventos brutos (Bronze) em uma camada Silver
-    consistente, aplicando validações de schema, limpeza de nulos, deduplicação
-    e tipagem adequada.
 
-    Passos aplicados:
-    1. Leitura do Parquet do Bronze.
-    2. Verificação de colunas obrigatórias: ["event_id", "event_type", "timestamp"].
-    3. Validação de nulos nas colunas obrigatórias.
-    4. Deduplicação preservando o primeiro registro de cada chave.
-    5. Conversão do campo "timestamp" para datetime UTC.
-    6. Ordenação final pelo campo "timestamp".
-    7. Escrita em Parquet (Snappy) na camada Silver.
+def _scan_bronze(input_path: Path | Sequence[Path]) -> pl.LazyFrame:
+    """Versão lazy de `_read_bronze`: nenhum dado é lido até o sink."""
+    parts = _bronze_files(input_path)
+    if not parts:
+        raise FileNotFoundError(f"Nenhum part file em {input_path}")
+    scans = [pl.scan_parquet(p, hive_partitioning=False) for p in parts]
+    if len(scans) == 1:
+        return scans[0]
+    return pl.concat(scans, how="diagonal_relaxed")
 
-    Args:
-        input_path (Path): Caminho do arquivo Parquet Bronze.
-        output_path (Path): Caminho do arquivo Parquet Silver.
+
+def _check_required(columns: Sequence[str]) -> None:
+    missing = set(REQUIRED_COLS) - set(columns)
+    if missing:
+        raise ValueError(f"Colunas ausentes no Bronze: {missing}")
+
+
+Frame = TypeVar("Frame", pl.DataFrame, pl.LazyFrame)
+
+
+def _dedup_by_key(frame: Frame, keep: str) -> Frame:
+    """Mantém uma linha por `event_id`, escolhida pelo timestamp.
+
+    Agrega por chave (`arg_min`/`arg_max` do timestamp) em vez de ordenar
+    o dia inteiro: o group_by roda em streaming, sem o sort global
+    bloqueante. Empates ficam com a primeira linha na ordem dos part
+    files (já ordenados), então o resultado é determinístico mesmo quando
+    redeliveries chegam em part files e ordens diferentes.
     """
+    if keep not in ("first", "latest"):
+        raise ValueError(f"keep inválido: {keep!r}. Use 'first' ou 'latest'")
+    ts = pl.col("timestamp")
+    pick = ts.arg_min() if keep == "first" else ts.arg_max()
+    return (
+        frame.group_by(DEDUP_KEY)
+        .agg(pl.all().get(pick))
+        .select(frame.collect_schema().names())
+    )
+
+
+def silver_part_name(bronze_parts: Sequence[Path]) -> str:
+    """Nome determinístico do part Silver gerado a partir destes arquivos.
+
+    Reprocessar o mesmo conjunto de arquivos Bronze (ex.: após uma falha
+    no Gold) sobrescreve o mesmo part, em vez de criar um duplicado.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for part in sorted(str(p) for p in bronze_parts):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return f"part-{digest.hexdigest()}.parquet"
 
-    df = pl.read_parquet(input_path)
+
+def _bronze_to_silver_eager(
+    input_path: Path | Sequence[Path],
+    output_path: Path,
+    keep: str,
+    dedup_index: Optional[DedupIndex],
+) -> int:
+    """Implementação eager: cada passo materializa um DataFrame."""
+    df = _read_bronze(input_path)
 
     # 🔹 Garante colunas obrigatórias
-    required_cols = {"event_id", "event_type", "timestamp"}
-    if not required_cols.issubset(df.columns):
-        missing = required_cols - set(df.columns)
-        raise ValueError(f"Colunas ausentes no Bronze: {missing}")
+    _check_required(df.columns)
 
     # 🔹 Remove linhas com nulos nas obrigatórias
-    df = df.drop_nulls(subset=required_cols)
+    df = df.drop_nulls(subset=REQUIRED_COLS)
 
     # 🔹 Se timestamp for string → parse ISO8601 com offset +00:00
     if df["timestamp"].dtype == pl.Utf8:
         df = df.with_columns(
             pl.col("timestamp").str.strptime(
                 pl.Datetime("ns", "UTC"),
-                format="%Y-%m-%dT%H:%M:%S%.f%z",  # aceita microssegundos + offset
+                format=TIMESTAMP_FORMAT,
                 strict=False,
             )
         )
 
-    # 🔹 Deduplicação + tipagem final
-    df = (
-        df.unique()
-        .cast(
-            {
-                "event_id": pl.Utf8,
-                "event_type": pl.Utf8,
-                "timestamp": pl.Datetime("ns", "UTC"),
-            }
-        )
-        .with_columns(pl.col("timestamp").dt.date().alias("date"))
-    )
+    # 🔹 Deduplicação por chave (no lote e contra lotes anteriores)
+    df = _dedup_by_key(df.cast(SILVER_TYPES), keep)
+    if dedup_index is not None:
+        df = dedup_index.exclude_seen(df.lazy(), output_path.name).collect()
+
+    # 🔹 Tipagem final
+    df = df.with_columns(pl.col("timestamp").dt.date().alias("date"))
 
     df.write_parquet(output_path, compression="snappy")
-    print(f"[SILVER] Wrote {len(df)} rows → {output_path}")
+    return len(df)
+
+
+def _bronze_to_silver_lazy(
+    input_path: Path | Sequence[Path],
+    output_path: Path,
+    keep: str,
+    dedup_index: Optional[DedupIndex],
+) -> int:
+    """Implementação lazy: um único plano otimizado, executado em streaming.
+
+    `scan_parquet` → filtros/parse/dedup/cast → `sink_parquet`. O Polars
+    aplica projection/predicate pushdown na leitura e processa os part
+    files em lotes, sem materializar o dia inteiro em memória.
+    """
+    lf = _scan_bronze(input_path)
+    schema = lf.collect_schema()
+    _check_required(schema.names())
+
+    lf = lf.drop_nulls(subset=REQUIRED_COLS)
+    if schema["timestamp"] == pl.Utf8:
+        lf = lf.with_columns(
+            pl.col("timestamp").str.strptime(
+                pl.Datetime("ns", "UTC"),
+                format=TIMESTAMP_FORMAT,
+                strict=False,
+            )
+        )
+    lf = _dedup_by_key(lf.cast(SILVER_TYPES), keep)
+    if dedup_index is not None:
+        lf = dedup_index.exclude_seen(lf, output_path.name)
+    lf = lf.with_columns(pl.col("timestamp").dt.date().alias("date"))
+
+    lf.sink_parquet(output_path, compression="snappy")
+    # Contagem vinda dos metadados do Parquet, sem reler os dados
+    return int(pl.scan_parquet(output_path).select(pl.len()).collect().item())
+
+
+ENGINES = {
+    "eager": _bronze_to_silver_eager,
+    "lazy": _bronze_to_silver_lazy,
+}
+
+
+def bronze_to_silver(
+    input_path: Path | Sequence[Path],
+    output_path: Path,
+    engine: str = SILVER_ENGINE,
+    keep: str = SILVER_DEDUP_KEEP,
+    dedup_index: Optional[DedupIndex] = None,
+) -> None:
+    """
+    Pipeline Bronze → Silver para normalização e qualidade de dados.
+
+    Este processo transforma os eventos brutos (Bronze) em uma camada Silver
+    consistente, aplicando validações de schema, limpeza de nulos, deduplicação
+    e tipagem adequada.
+
+    Passos aplicados:
+    1. Leitura do Parquet do Bronze (arquivo, partição ou lista de parts).
+    2. Verificação de colunas obrigatórias: ["event_id", "event_type", "timestamp"].
+    3. Validação de nulos nas colunas obrigatórias.
+    4. Deduplicação por `event_id`, mantendo o registro de menor
+       (`keep="first"`) ou maior (`keep="latest"`) timestamp.
+    5. Conversão do campo "timestamp" para datetime UTC.
+    6. Ordenação final pelo campo "timestamp".
+    7. Escrita em Parquet (Snappy) na camada Silver.
+
+    Args:
+        input_path (Path | Sequence[Path]): Arquivo Parquet Bronze,
+            diretório de partição ou lista de part files (ex.: todos os
+            `event_type=*/date=<dia>` de um dia).
+        output_path (Path): Caminho do arquivo Parquet Silver.
+        engine (str): "lazy" (padrão, `SILVER_ENGINE`) executa um plano
+            único em streaming, com memória limitada; "eager" é a
+            implementação de referência usada nos testes de paridade.
+        keep (str): Versão mantida de um `event_id` repetido no lote:
+            "first" (padrão, `SILVER_DEDUP_KEEP`) ou "latest".
+        dedup_index (Optional[DedupIndex]): Índice de chaves já emitidas
+            no dia. Linhas cujo `event_id` já foi gravado por outro part
+            são descartadas, e as chaves do novo part são registradas no
+            índice. Entre lotes vale a primeira versão gravada, por isso o
+            índice só aceita `keep="first"`.
+
+    Raises:
+        ValueError: Engine desconhecida ou `keep="latest"` com
+            `dedup_index` (a versão mais nova de um lote posterior seria
+            descartada em silêncio).
+    """
+    try:
+        run = ENGINES[engine]
+    except KeyError:
+        raise ValueError(
+            f"Engine desconhecida: {engine!r}. Use um de {list(ENGINES)}"
+        ) from None
+    if dedup_index is not None and keep != "first":
+        raise ValueError(
+            f"keep={keep!r} não é suportado com dedup_index: o índice "
+            "mantém a primeira versão gravada. Use keep='first' ou "
+            "reprocesse o dia sem índice"
+        )
+
+    rows = run(input_path, output_path, keep, dedup_index)
+    if dedup_index is not None:
+        keys = pl.read_parquet(output_path, columns=[DEDUP_KEY])[DEDUP_KEY]
+        dedup_index.add(keys, output_path.name)
+    print(f"[SILVER] Wrote {rows} rows → {output_path} ({engine})")
@@ -0,0 +1,138 @@
+"""Compactação do Bronze: junta part files pequenos em arquivos maiores.
+
+Cada micro-batch da ingestão gera um part file por partição; com o tempo uma
+partição acumula milhares de arquivos pequenos e a leitura paga overhead
+por arquivo. A compactação agrupa os arquivos pequenos de cada partição
+`event_type=*/date=*` em arquivos de tamanho alvo, ordenados por timestamp
+e com row groups de tamanho fixo.
+
+Uso:
+    python -m scpulse.etl.compaction --target-mb 128
+"""
+
+import argparse
+import os
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from pathlib import Path
+
+import polars as pl
+
+from .bronze_layout import fsync_dir, leaf_partitions, write_durable
+
+BRONZE_DIR = Path("data/bronze")
+COMPACTION_TARGET_BYTES = int(
+    os.getenv("COMPACTION_TARGET_BYTES", str(128 * 1024**2))
+)
+COMPACTION_ROW_GROUP_ROWS = int(
+    os.getenv("COMPACTION_ROW_GROUP_ROWS", "131072")
+)
+
+
+@dataclass
+class CompactionResult:
+    partition: Path
+    files_in: int
+    files_out: int
+    rows: int
+
+
+def _plan_bins(files: list[Path], target_bytes: int) -> list[list[Path]]:
+    """Agrupa arquivos pequenos, em ordem, em lotes de ~`target_bytes`.
+
+    Arquivos já maiores que o alvo ficam de fora; lotes com um único
+    arquivo não são reescritos.
+    """
+    bins: list[list[Path]] = []
+    current: list[Path] = []
+    current_size = 0
+    for f in files:
+        size = f.stat().st_size
+        if size >= target_bytes:
+            continue
+        if current and current_size + size > target_bytes:
+            bins.append(current)
+            current, current_size = [], 0
+        current.append(f)
+        current_size += size
+    if current:
+        bins.append(current)
+    return [b for b in bins if len(b) > 1]
+
+
+def compact_partition(
+    partition: Path,
+    target_bytes: int = COMPACTION_TARGET_BYTES,
+    row_group_rows: int = COMPACTION_ROW_GROUP_ROWS,
+) -> CompactionResult:
+    """Compacta os part files de uma partição folha.
+
+    O arquivo compactado é gravado (atômico + fsync) antes da remoção dos
+    originais. Se o processo cair entre os dois passos, a partição fica
+    temporariamente com eventos duplicados, que a deduplicação da Silver
+    descarta; nenhum evento se perde.
+    """
+    files = sorted(partition.glob("part-*.parquet"))
+    bins = _plan_bins(files, target_bytes)
+
+    files_in = files_out = rows = 0
+    for group in bins:
+        df = pl.concat(
+            [pl.read_parquet(f, hive_partitioning=False) for f in group],
+            how="diagonal_relaxed",
+        ).sort(["timestamp", "event_id"], nulls_last=True)
+
+        stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S%f")
+        name = f"part-{stamp}-compacted-{uuid.uuid4().hex[:8]}.parquet"
+        write_durable(df, partition / name, row_group_size=row_group_rows)
+
+        for f in group:
+            f.unlink()
+        fsync_dir(partition)
+
+        files_in += len(group)
+        files_out += 1
+        rows += df.height
+
+    return CompactionResult(partition, files_in, files_out, rows)
+
+
+def compact_bronze(
+    base_dir: Path = BRONZE_DIR,
+    target_bytes: int = COMPACTION_TARGET_BYTES,
+    row_group_rows: int = COMPACTION_ROW_GROUP_ROWS,
+) -> list[CompactionResult]:
+    """Compacta todas as partições do Bronze que têm arquivos pequenos."""
+    results = []
+    for partition in leaf_partitions(base_dir):
+        result = compact_partition(partition, target_bytes, row_group_rows)
+        if result.files_in:
+            print(
+                f"[COMPACTION] {partition}: {result.files_in} → "
+                f"{result.files_out} arquivos ({result.rows} linhas)"
+            )
+        results.append(result)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bronze-dir", type=Path, default=BRONZE_DIR)
+    parser.add_argument(
+        "--target-mb",
+        type=float,
+        default=COMPACTION_TARGET_BYTES / 1024**2,
+        help="Tamanho alvo dos arquivos compactados (MiB)",
+    )
+    parser.add_argument(
+        "--row-group-rows", type=int, default=COMPACTION_ROW_GROUP_ROWS
+    )
+    args = parser.parse_args()
+    compact_bronze(
+        args.bronze_dir, int(args.target_mb * 1024**2), args.row_group_rows
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Decodificação e validação de eventos na ingestão (Kafka/arquivo → Bronze).
+
+Eventos inválidos são rejeitados já na entrada e enviados para um
+dead-letter sink, em vez de seguirem até a Silver.
+"""
+
+import json
+import os
+from datetime import datetime, UTC
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Mapping, Optional, Protocol
+
+from pydantic import TypeAdapter, ValidationError
+
+from ..domain.events import SupplyChainEvent
+
+orjson: Optional[ModuleType]
+try:
+    import orjson as _orjson
+
+    orjson = _orjson
+except ImportError:
+    orjson = None
+
+
+INGEST_DECODER = os.getenv("INGEST_DECODER", "typed")  # "typed" ou "json"
+DEAD_LETTER_DIR = Path("data/dead_letter")
+
+
+class EventDecodeError(ValueError):
+    """Payload que não pôde ser decodificado ou não respeita o schema."""
+
+
+class EventDecoder(Protocol):
+    """Converte o payload bruto de uma mensagem em um evento."""
+
+    def decode(self, raw: bytes) -> Mapping[str, Any]: ...
+
+
+class JsonEventDecoder:
+    """Decoder sem validação (comportamento legado).
+
+    Usa `orjson` quando instalado e cai para `json` da stdlib.
+    """
+
+    def decode(self, raw: bytes) -> Mapping[str, Any]:
+        try:
+            event = orjson.loads(raw) if orjson else json.loads(raw)
+        except ValueError as e:
+            raise EventDecodeError(f"JSON inválido: {e}") from e
+        if not isinstance(event, dict):
+            raise EventDecodeError("Payload não é um objeto JSON")
+        return event
+
+
+class TypedEventDecoder:
+    """Decodifica direto para os structs tipados dos três `event_type`.
+
+    O parse do JSON e a validação acontecem numa única passada no núcleo
+    Rust do pydantic (`validate_json`), sem criar um dict intermediário
+    com `json.loads`. O discriminador `event_type` escolhe o struct, então
+    tipos desconhecidos também são rejeitados.
+    """
+
+    _adapter: TypeAdapter[SupplyChainEvent] = TypeAdapter(SupplyChainEvent)
+
+    def decode(self, raw: bytes) -> Mapping[str, Any]:
+        try:
+            event = self._adapter.validate_json(raw)
+        except ValidationError as e:
+            raise EventDecodeError(_summarize(e)) from e
+        return event.model_dump()
+
+
+def _summarize(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(p) for p in err['loc']) or '<root>'}: {err['msg']}"
+        for err in error.errors(include_url=False)
+    )
+
+
+DECODERS: dict[str, type[EventDecoder]] = {
+    "typed": TypedEventDecoder,
+    "json": JsonEventDecoder,
+}
+
+
+def get_decoder(name: str = INGEST_DECODER) -> EventDecoder:
+    """Instancia o decoder configurado (`INGEST_DECODER`)."""
+    try:
+        return DECODERS[name]()
+    except KeyError:
+        raise ValueError(
+            f"Decoder desconhecido: {name!r}. Use um de {list(DECODERS)}"
+        ) from None
+
+
+class DeadLetterSink:
+    """Grava payloads rejeitados em JSONL, um arquivo por dia.
+
+    Cada linha guarda o payload original, o motivo da rejeição e a origem
+    (tópico/partição/offset ou arquivo/linha) para reprocessamento.
+    """
+
+    def __init__(self, base_dir: Path = DEAD_LETTER_DIR) -> None:
+        self.base_dir = base_dir
+        self._file: Optional[Any] = None
+        self._day: Optional[str] = None
+        self.count = 0
+
+    def write(self, raw: bytes, error: str, **source: Any) -> None:
+        day = str(datetime.now(UTC).date())
+        if self._file is None or day != self._day:
+            self.close()
+            self.base_dir.mkdir(parents=True, exist_ok=True)
+            path = self.base_dir / f"dead_letters_{day}.jsonl"
+            self._file = open(path, "a", encoding="utf-8")
+            self._day = day
+
+        record = {
+            "received_at": datetime.now(UTC).isoformat(),
+            "error": error,
+            "source": source,
+            "payload": raw.decode("utf-8", errors="replace"),
+        }
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.count += 1
+        print(f"[DEAD_LETTER] {error} ({source})")
+
+    def sync(self) -> None:
+        """Persiste em disco o que foi rejeitado (antes do commit)."""
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
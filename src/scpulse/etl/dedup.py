@@ -0,0 +1,71 @@
+"""Índice persistente de deduplicação da Silver (um arquivo por dia).
+
+Redeliveries do Kafka (at-least-once) chegam em part files diferentes do
+Bronze e, portanto, em micro-batches diferentes da Silver. Em vez de reler
+a Silver já gravada para descartá-las, cada dia mantém um índice compacto
+e ordenado `event_id → silver_part` com as chaves já emitidas.
+
+O índice registra qual part da Silver introduziu cada chave: reprocessar o
+mesmo lote (ex.: após uma falha no Gold) regrava o mesmo part com as mesmas
+linhas, em vez de descartá-las como duplicatas.
+"""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+import polars as pl
+
+DEDUP_DIR = Path("data/silver/_dedup")
+
+
+class DedupIndex:
+    """Chaves já emitidas na Silver para um dia (`date=<dia>.parquet`)."""
+
+    def __init__(
+        self, day: str, base_dir: Path = DEDUP_DIR, key: str = "event_id"
+    ) -> None:
+        self.day = day
+        self.key = key
+        self.path = base_dir / f"date={day}.parquet"
+
+    def scan(self) -> Optional[pl.LazyFrame]:
+        if not self.path.exists():
+            return None
+        return pl.scan_parquet(self.path)
+
+    def exclude_seen(self, lf: pl.LazyFrame, part_name: str) -> pl.LazyFrame:
+        """Remove linhas cuja chave já foi emitida por outro part."""
+        seen = self.scan()
+        if seen is None:
+            return lf
+        seen = seen.filter(pl.col("silver_part") != part_name).select(
+            pl.col(self.key).cast(pl.Utf8)
+        )
+        return lf.join(seen, on=self.key, how="anti")
+
+    def add(self, keys: pl.Series, part_name: str) -> int:
+        """Registra as chaves de um part recém-gravado.
+
+        Chaves já presentes mantêm o part original. O índice é regravado
+        ordenado por chave, de forma atômica.
+
+        Returns:
+            int: Total de chaves no índice.
+        """
+        new = pl.DataFrame(
+            {self.key: keys.cast(pl.Utf8), "silver_part": part_name}
+        )
+        seen = self.scan()
+        merged = new if seen is None else pl.concat([seen.collect(), new])
+        merged = merged.unique(subset=[self.key], keep="first").sort(self.key)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".parquet.tmp")
+        merged.write_parquet(tmp_path, compression="zstd")
+        os.replace(tmp_path, self.path)
+        return int(merged.height)
+
+    def reset(self) -> None:
+        """Descarta o índice (reconstrução completa do dia)."""
+        self.path.unlink(missing_ok=True)
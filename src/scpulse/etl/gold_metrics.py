@@ -0,0 +1,188 @@
+"""Registro declarativo das métricas Gold e motor de agregação em um plano.
+
+Cada métrica declara o tipo de evento que consome, as colunas de que
+precisa e como agregar. `build_gold_frames` monta um plano lazy por
+métrica sobre o mesmo scan da Silver e executa todos juntos com
+`pl.collect_all`: o Polars elimina o subplano comum (scan + parse de
+timestamps) e a Silver é lida uma única vez.
+
+Para adicionar uma métrica basta registrar um `GoldMetric`:
+
+    register_metric(
+        GoldMetric(
+            name="orders_by_sku",
+            event_type="order_created",
+            required=frozenset({"sku", "qty"}),
+            build=lambda lf: lf.group_by("sku").agg(pl.col("qty").sum()),
+        )
+    )
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+import polars as pl
+
+GOLD_WRITE_WORKERS = int(os.getenv("GOLD_WRITE_WORKERS", "4"))
+SILVER_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+
+
+@dataclass(frozen=True)
+class GoldMetric:
+    """Uma tabela Gold derivada de um tipo de evento da Silver.
+
+    Attributes:
+        name (str): Identificador (ex.: "orders_created"); define o
+            arquivo `gold_<name>.parquet`.
+        event_type (str): Eventos da Silver usados pela métrica.
+        required (frozenset[str]): Colunas exigidas; sem elas a métrica é
+            pulada.
+        build (Callable): Agregação sobre o LazyFrame já filtrado pelo
+            `event_type`, com timestamps convertidos.
+        save (Optional[str]): Função de `storage.crud` que persiste as
+            linhas no Postgres (None = só Parquet).
+    """
+
+    name: str
+    event_type: str
+    required: frozenset[str]
+    build: Callable[[pl.LazyFrame], pl.LazyFrame]
+    save: Optional[str] = None
+
+
+GOLD_METRICS: dict[str, GoldMetric] = {}
+
+
+def register_metric(metric: GoldMetric) -> GoldMetric:
+    """Adiciona (ou substitui) uma métrica no registro."""
+    GOLD_METRICS[metric.name] = metric
+    return metric
+
+
+register_metric(
+    GoldMetric(
+        name="orders_created",
+        event_type="order_created",
+        required=frozenset({"supplier", "qty"}),
+        build=lambda lf: lf.group_by(
+            pl.col("supplier"),
+            pl.col("timestamp").dt.date().alias("date"),
+        ).agg(
+            total_orders=pl.len(),
+            total_qty=pl.col("qty").sum(),
+        ),
+        save="save_orders_created",
+    )
+)
+
+register_metric(
+    GoldMetric(
+        name="orders_delayed",
+        event_type="order_delayed",
+        required=frozenset({"supplier", "old_delivery", "new_delivery"}),
+        build=lambda lf: lf.with_columns(
+            (pl.col("new_delivery") - pl.col("old_delivery"))
+            .dt.total_days()
+            .alias("delay_days")
+        )
+        .group_by("supplier")
+        .agg(
+            delayed_orders=pl.len(),
+            avg_delay_days=pl.col("delay_days").mean(),
+        ),
+        save="save_orders_delayed",
+    )
+)
+
+register_metric(
+    GoldMetric(
+        name="inventory_alerts",
+        event_type="inventory_low",
+        required=frozenset({"sku", "threshold"}),
+        build=lambda lf: lf.group_by("sku").agg(
+            low_stock_alerts=pl.len(),
+            min_threshold=pl.col("threshold").min(),
+        ),
+        save="save_inventory_alerts",
+    )
+)
+
+
+def scan_silver(input_path: Path) -> pl.LazyFrame:
+    """Scan lazy de um arquivo Silver ou de uma partição `date=<dia>`."""
+    if not input_path.is_dir():
+        return pl.scan_parquet(input_path)
+    parts = sorted(input_path.glob("*.parquet"))
+    if not parts:
+        raise FileNotFoundError(f"Nenhum part file em {input_path}")
+    scans = [pl.scan_parquet(p, hive_partitioning=False) for p in parts]
+    if len(scans) == 1:
+        return scans[0]
+    return pl.concat(scans, how="diagonal_relaxed")
+
+
+def _parse_datetimes(lf: pl.LazyFrame, schema: pl.Schema) -> pl.LazyFrame:
+    """Converte para datetime UTC as colunas de data ainda em texto."""
+    parsed = [
+        pl.col(name)
+        .str.strptime(pl.Datetime("ns"), SILVER_TIMESTAMP_FORMAT, strict=False)
+        .dt.convert_time_zone("UTC")
+        for name in ("timestamp", "old_delivery", "new_delivery")
+        if schema.get(name) == pl.Utf8
+    ]
+    return lf.with_columns(parsed) if parsed else lf
+
+
+def build_gold_frames(
+    input_path: Path, metrics: Optional[list[GoldMetric]] = None
+) -> dict[str, pl.DataFrame]:
+    """Calcula todas as métricas Gold aplicáveis com uma leitura da Silver.
+
+    Args:
+        input_path (Path): Arquivo Silver ou partição `date=<dia>`.
+        metrics (Optional[list[GoldMetric]]): Métricas a calcular
+            (padrão: todas as registradas).
+
+    Returns:
+        dict[str, pl.DataFrame]: Nome da métrica → agregado. Métricas cujas
+        colunas não existem na Silver ficam de fora.
+    """
+    lf = scan_silver(input_path)
+    schema = lf.collect_schema()
+    lf = _parse_datetimes(lf, schema)
+
+    selected = [
+        m
+        for m in (metrics or GOLD_METRICS.values())
+        if m.required <= set(schema.names())
+    ]
+    plans = [
+        m.build(lf.filter(pl.col("event_type") == m.event_type))
+        for m in selected
+    ]
+    frames = pl.collect_all(plans)
+    return {m.name: df for m, df in zip(selected, frames)}
+
+
+def write_gold_frames(
+    frames: dict[str, pl.DataFrame],
+    output_dir: Path,
+    workers: int = GOLD_WRITE_WORKERS,
+) -> list[Path]:
+    """Grava os agregados em Parquet em paralelo (um arquivo por métrica).
+
+    A escrita do Polars libera o GIL, então threads bastam.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths = [output_dir / f"gold_{name}.parquet" for name in frames]
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = [
+            executor.submit(df.write_parquet, path, compression="snappy")
+            for df, path in zip(frames.values(), paths)
+        ]
+        for future in futures:
+            future.result()
+    return paths
@@ -0,0 +1,91 @@
+"""Buffer colunar de eventos para a ingestão no Bronze."""
+
+from typing import Any, Mapping, Optional
+
+import polars as pl
+
+from ..domain.events import BRONZE_SCHEMA, EVENT_SCHEMAS
+
+
+class ColumnarEventBuffer:
+    """Acumula eventos direto em colunas tipadas, uma tabela por event_type.
+
+    Em vez de guardar um dict por evento (e deixar o Polars inferir o
+    schema linha a linha no flush), cada evento é espalhado em listas por
+    coluna segundo o schema do seu `event_type`. No flush cada tabela vira
+    um `pl.DataFrame` com schema declarado, sem inferência, e o frame é
+    entregue inteiro ao writer Parquet.
+
+    Eventos com `event_type` desconhecido caem num buffer de dicts e são
+    convertidos pelo caminho genérico, para não perder dados.
+    """
+
+    def __init__(
+        self, schemas: Mapping[str, Mapping[str, pl.DataType]] = EVENT_SCHEMAS
+    ) -> None:
+        self._schemas = schemas
+        self._columns: dict[str, dict[str, list[Any]]] = {}
+        self._unknown: list[dict[str, Any]] = []
+        self._rows = 0
+        self.clear()
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def append(self, event: Mapping[str, Any]) -> None:
+        """Adiciona um evento às colunas do seu tipo."""
+        columns = self._columns.get(str(event.get("event_type")))
+        if columns is None:
+            self._unknown.append(dict(event))
+        else:
+            for name, values in columns.items():
+                values.append(event.get(name))
+        self._rows += 1
+
+    def clear(self) -> None:
+        self._columns = {
+            event_type: {name: [] for name in schema}
+            for event_type, schema in self._schemas.items()
+        }
+        self._unknown = []
+        self._rows = 0
+
+    def to_frame(self) -> Optional[pl.DataFrame]:
+        """Materializa o buffer com o schema estável do Bronze.
+
+        Returns:
+            Optional[pl.DataFrame]: Frame com todas as colunas de
+            `BRONZE_SCHEMA` (nulas quando o tipo não as possui), ou None se
+            o buffer estiver vazio.
+        """
+        frames = [
+            pl.DataFrame(
+                columns, schema=self._schemas[event_type], strict=False
+            )
+            for event_type, columns in self._columns.items()
+            if columns["event_type"]
+        ]
+        if self._unknown:
+            frames.append(pl.DataFrame(self._unknown))
+        if not frames:
+            return None
+
+        df = pl.concat(frames, how="diagonal_relaxed")
+        if df.schema.get("timestamp") == pl.Utf8:
+            df = df.with_columns(
+                pl.col("timestamp")
+                .str.strptime(
+                    pl.Datetime("ns"),
+                    "%Y-%m-%dT%H:%M:%S%.f%z",
+                    strict=True,  # suporta +00:00
+                )
+                .dt.convert_time_zone("UTC")  # normaliza para UTC
+            )
+
+        missing = [
+            pl.lit(None, dtype=dtype).alias(name)
+            for name, dtype in BRONZE_SCHEMA.items()
+            if name not in df.columns
+        ]
+        extras = [c for c in df.columns if c not in BRONZE_SCHEMA]
+        return df.with_columns(missing).select([*BRONZE_SCHEMA, *extras])
@@ -1,105 +1,472 @@
 import asyncio
-import json
+import glob
+import gzip
+import io
+import multiprocessing as mp
 import os
+import time
+import uuid
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict
+from itertools import repeat
+from types import ModuleType
+from typing import IO, Any, Callable, Mapping, Optional, cast
 from datetime import datetime, UTC
 
 import polars as pl
 
+from .decoding import (
+    DEAD_LETTER_DIR,
+    DeadLetterSink,
+    EventDecodeError,
+    EventDecoder,
+    get_decoder,
+)
+from .bronze_layout import partition_dir, split_by_partition, write_durable
+from .ingest_buffer import ColumnarEventBuffer
+
 try:
     from aiokafka import AIOKafkaConsumer
 except ImportError:
     AIOKafkaConsumer = None
 
+zstandard: Optional[ModuleType]
+try:
+    import zstandard as _zstandard
+
+    zstandard = _zstandard
+except ImportError:
+    zstandard = None
+
 
 KAFKA_BOOTSTRAP = os.getenv("KAFKA_BOOTSTRAP", "localhost:9092")
 TOPIC = os.getenv("KAFKA_TOPIC", "supplychain_events")
+KAFKA_GROUP_ID = os.getenv("KAFKA_GROUP_ID", "scpulse-bronze")
+
+# Gatilhos do micro-batch (o que ocorrer primeiro dispara o flush)
+BATCH_MAX_ROWS = int(os.getenv("INGEST_BATCH_MAX_ROWS", "5000"))
+BATCH_MAX_BYTES = int(os.getenv("INGEST_BATCH_MAX_BYTES", str(8 * 1024**2)))
+BATCH_MAX_LATENCY_S = float(os.getenv("INGEST_BATCH_MAX_LATENCY_S", "5"))
+
+# Paralelismo: N consumers no mesmo consumer group
+INGEST_WORKERS = int(os.getenv("INGEST_WORKERS", "1"))
+INGEST_WORKER_MODE = os.getenv("INGEST_WORKER_MODE", "async")  # ou "process"
+
+# Ingestão de arquivos (backfill)
+LANDING_GLOB = os.getenv("INGEST_LANDING_GLOB", "data/landing/*.jsonl*")
+FILE_CHUNK_ROWS = int(os.getenv("INGEST_FILE_CHUNK_ROWS", "100000"))
 
 DATA_DIR = Path("data/bronze")
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
+@dataclass(frozen=True)
+class BatchPolicy:
+    """Limites que disparam o flush de um micro-batch para o Bronze.
+
+    Attributes:
+        max_rows (int): Número máximo de eventos em memória.
+        max_bytes (int): Tamanho máximo (bytes serializados) em memória.
+        max_latency_s (float): Tempo máximo que o evento mais antigo do
+            buffer pode esperar até ser gravado.
+    """
+
+    max_rows: int = BATCH_MAX_ROWS
+    max_bytes: int = BATCH_MAX_BYTES
+    max_latency_s: float = BATCH_MAX_LATENCY_S
+
+
+def _part_filename(worker_id: str = "") -> str:
+    """Gera um nome único e ordenável para um part file."""
+    stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S%f")
+    worker = f"-{worker_id}" if worker_id else ""
+    return f"part-{stamp}{worker}-{uuid.uuid4().hex[:8]}.parquet"
+
+
 def _write_parquet(
-    events: List[Dict], filename: str = "events.parquet"
-) -> Path:
-    """Grava eventos em Parquet na camada Bronze."""
-    if not events:
-        return DATA_DIR / filename
-
-    df = pl.DataFrame(events)
-
-    if "timestamp" in df.columns:
-        df = df.with_columns(
-            pl.col("timestamp")
-            .str.strptime(
-                pl.Datetime("ns"),
-                "%Y-%m-%dT%H:%M:%S%.f%z",
-                strict=True,  # suporta +00:00
-            )
-            .dt.convert_time_zone("UTC")  # normaliza para UTC
+    df: pl.DataFrame, base_dir: Path = DATA_DIR, worker_id: str = ""
+) -> list[Path]:
+    """Grava um micro-batch como novos part files no layout Hive do Bronze.
+
+    O batch é dividido por `event_type` e pelo dia do timestamp do evento;
+    cada pedaço vira um part file em `event_type=<tipo>/date=<dia>/`. Cada
+    arquivo é escrito em um temporário, sincronizado em disco (fsync) e só
+    então renomeado, de modo que leitores nunca vejam um Parquet parcial e
+    o offset só seja confirmado após a gravação.
+
+    Args:
+        df (pl.DataFrame): Eventos já materializados pelo buffer colunar.
+        base_dir (Path): Raiz da camada Bronze.
+        worker_id (str): Identificador do worker, incluído no nome do part.
+
+    Returns:
+        list[Path]: Part files gravados (vazio se não havia eventos).
+    """
+    if df.is_empty():
+        return []
+
+    paths = [
+        write_durable(
+            part,
+            partition_dir(base_dir, event_type, day)
+            / _part_filename(worker_id),
         )
+        for event_type, day, part in split_by_partition(df)
+    ]
+    print(f"[BRONZE] Wrote {df.height} events → {len(paths)} part files")
+    return paths
+
+
+@dataclass
+class BronzeBatchWriter:
+    """Buffer de micro-batch com flush por linhas, bytes ou latência.
+
+    Cada flush gera um part file novo (nunca sobrescreve o anterior).
+    """
+
+    base_dir: Path = DATA_DIR
+    policy: BatchPolicy = field(default_factory=BatchPolicy)
+    clock: Callable[[], float] = time.monotonic
+    worker_id: str = ""
+
+    def __post_init__(self) -> None:
+        self._buffer = ColumnarEventBuffer()
+        self._nbytes = 0
+        self._first_event_at: Optional[float] = None
+
+    @property
+    def rows(self) -> int:
+        return len(self._buffer)
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def add(self, event: Mapping[str, Any], size_bytes: int = 0) -> None:
+        """Adiciona um evento ao buffer."""
+        if self._first_event_at is None:
+            self._first_event_at = self.clock()
+        self._buffer.append(event)
+        self._nbytes += size_bytes
+
+    def seconds_until_deadline(self) -> float:
+        """Tempo restante até o gatilho de latência do buffer atual."""
+        if self._first_event_at is None:
+            return self.policy.max_latency_s
+        elapsed = self.clock() - self._first_event_at
+        return max(0.0, self.policy.max_latency_s - elapsed)
+
+    def should_flush(self) -> bool:
+        if not self.rows:
+            return False
+        return (
+            self.rows >= self.policy.max_rows
+            or self.nbytes >= self.policy.max_bytes
+            or self.seconds_until_deadline() <= 0
+        )
+
+    def flush(self) -> list[Path]:
+        """Grava o buffer como part files e o esvazia."""
+        df = self._buffer.to_frame()
+        paths = (
+            []
+            if df is None
+            else _write_parquet(df, self.base_dir, self.worker_id)
+        )
+        self._buffer.clear()
+        self._nbytes = 0
+        self._first_event_at = None
+        return paths
+
+
+async def _consume_loop(
+    consumer: Any,
+    writer: BronzeBatchWriter,
+    stop: Optional[asyncio.Event] = None,
+    decoder: Optional[EventDecoder] = None,
+    dead_letters: Optional[DeadLetterSink] = None,
+    executor: Optional[Executor] = None,
+) -> None:
+    """Loop de consumo: decodifica, bufferiza, grava parts e confirma offsets.
+
+    Mensagens que não passam no `decoder` vão para o dead-letter sink e não
+    entram no Bronze. O commit dos offsets acontece somente depois do flush
+    (e do fsync do dead-letter), garantindo entrega at-least-once: se o
+    processo cair antes do commit, as mensagens do buffer são relidas do
+    Kafka em vez de perdidas. Se o loop sair com erro, nada é gravado nem
+    confirmado: o `commit()` confirmaria a posição já avançada pelo
+    `getmany`, perdendo as mensagens do lote após a que falhou. No
+    cancelamento (parada normal) o buffer é gravado e confirmado.
+
+    Com um `executor`, o encode Parquet e a escrita em disco rodam fora do
+    event loop, liberando os demais workers enquanto este grava.
+    """
+    decoder = decoder or get_decoder()
+    dead_letters = dead_letters or DeadLetterSink()
+    loop = asyncio.get_running_loop()
+
+    async def flush_and_commit() -> None:
+        if executor is None:
+            writer.flush()
+        else:
+            await loop.run_in_executor(executor, writer.flush)
+        dead_letters.sync()
+        await consumer.commit()
 
-    print(df["timestamp"].head())
+    failed = False
+    try:
+        while stop is None or not stop.is_set():
+            timeout_ms = int(writer.seconds_until_deadline() * 1000)
+            batches = await consumer.getmany(
+                timeout_ms=max(timeout_ms, 1),
+                max_records=writer.policy.max_rows,
+            )
+            for messages in batches.values():
+                for msg in messages:
+                    try:
+                        event = decoder.decode(msg.value)
+                    except EventDecodeError as e:
+                        dead_letters.write(
+                            msg.value,
+                            str(e),
+                            topic=msg.topic,
+                            partition=msg.partition,
+                            offset=msg.offset,
+                        )
+                        continue
+                    writer.add(event, msg.serialized_value_size)
 
-    file_path = DATA_DIR / filename
-    df.write_parquet(file_path, compression="snappy")
-    print(f"[BRONZE] Wrote {len(events)} events → {file_path}")
-    return file_path
+            if writer.should_flush():
+                await flush_and_commit()
+    except Exception:
+        failed = True  # sem commit: o lote é relido após o restart
+        raise
+    finally:
+        if not failed and (writer.rows or dead_letters.count):
+            await flush_and_commit()
+        dead_letters.close()
 
 
-async def consume_kafka() -> None:
-    """Consome mensagens do Kafka e grava em Bronze."""
+def _kafka_consumer() -> Any:
+    """Cria um consumer do tópico Bronze no consumer group da ingestão."""
     if AIOKafkaConsumer is None:
         raise RuntimeError(
             "aiokafka não instalado. Rode `poetry add aiokafka`."
         )
-
-    consumer = AIOKafkaConsumer(
+    return AIOKafkaConsumer(
         TOPIC,
         bootstrap_servers=KAFKA_BOOTSTRAP,
+        group_id=KAFKA_GROUP_ID,
         auto_offset_reset="earliest",
-        enable_auto_commit=True,
-        value_deserializer=lambda v: json.loads(v.decode("utf-8")),
+        enable_auto_commit=False,
     )
 
+
+async def _run_worker(
+    worker_id: str,
+    consumer: Any,
+    writer: BronzeBatchWriter,
+    executor: Executor,
+    stop: Optional[asyncio.Event],
+) -> None:
     await consumer.start()
     try:
-        buffer: List[Dict] = []
-        async for msg in consumer:
-            event = msg.value
-            buffer.append(event)
-            print(f"[CONSUMER] Received: {event}")
-
-            # Salva em batch de 10 eventos
-            if len(buffer) >= 10:
-                _write_parquet(
-                    buffer,
-                    filename=f"events_{datetime.now(UTC).date()}.parquet",
-                )
-                buffer.clear()
+        print(f"[CONSUMER] Worker {worker_id} iniciado")
+        await _consume_loop(consumer, writer, stop, executor=executor)
     finally:
         await consumer.stop()
 
 
+async def consume_kafka(
+    policy: Optional[BatchPolicy] = None,
+    workers: int = INGEST_WORKERS,
+    consumer_factory: Callable[[], Any] = _kafka_consumer,
+    base_dir: Path = DATA_DIR,
+    stop: Optional[asyncio.Event] = None,
+) -> None:
+    """Consome mensagens do Kafka e grava em Bronze em micro-batches.
+
+    Sobe `workers` consumers no mesmo consumer group; o Kafka distribui as
+    partições do tópico entre eles e cada worker grava seus próprios part
+    files. A decodificação roda no event loop e o encode/escrita Parquet
+    num pool de threads (o Polars libera o GIL durante a escrita). Para
+    escalar também a decodificação com os cores, use `consume_kafka_processes`.
+
+    Args:
+        policy (Optional[BatchPolicy]): Gatilhos de flush. Por padrão usa
+            os valores de `INGEST_BATCH_MAX_*`.
+        workers (int): Número de consumers no grupo (`INGEST_WORKERS`).
+        consumer_factory (Callable[[], Any]): Cria um consumer; permite
+            trocar o Kafka pelo `InMemoryBroker` em testes.
+        base_dir (Path): Raiz da camada Bronze.
+        stop (Optional[asyncio.Event]): Sinal de parada (loop infinito se
+            None).
+    """
+    policy = policy or BatchPolicy()
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="bronze-writer"
+    ) as executor:
+        async with asyncio.TaskGroup() as tg:
+            for i in range(workers):
+                worker_id = f"w{os.getpid()}-{i}"
+                writer = BronzeBatchWriter(
+                    base_dir, policy, worker_id=worker_id
+                )
+                tg.create_task(
+                    _run_worker(
+                        worker_id, consumer_factory(), writer, executor, stop
+                    )
+                )
+
+
+def _process_worker(policy: Optional[BatchPolicy]) -> None:
+    asyncio.run(consume_kafka(policy, workers=1))
+
+
+def consume_kafka_processes(
+    workers: int = INGEST_WORKERS, policy: Optional[BatchPolicy] = None
+) -> None:
+    """Roda um processo por worker, todos no mesmo consumer group.
+
+    Cada processo tem seu próprio event loop e consumer, então decode,
+    encode e escrita escalam com os cores (limitado ao nº de partições).
+    """
+    procs = [
+        mp.Process(target=_process_worker, args=(policy,), daemon=False)
+        for _ in range(workers)
+    ]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join()
+
+
+def _open_landing(filepath: Path) -> IO[bytes]:
+    """Abre um arquivo de landing em modo binário, descomprimindo se preciso.
+
+    Suporta JSONL puro, `.gz` e `.zst`/`.zstd` (requer `zstandard`).
+    """
+    if filepath.suffix == ".gz":
+        return cast(IO[bytes], gzip.open(filepath, "rb"))
+    if filepath.suffix in {".zst", ".zstd"}:
+        if zstandard is None:
+            raise RuntimeError(
+                "zstandard não instalado. Rode `poetry add zstandard`."
+            )
+        reader = zstandard.ZstdDecompressor().stream_reader(
+            open(filepath, "rb"), closefd=True
+        )
+        return io.BufferedReader(reader)
+    return open(filepath, "rb")
+
+
 def consume_from_file(
     filepath: Path = Path("data/landing/events.jsonl"),
-) -> Path:
-    """Consome eventos de um arquivo JSONL e grava em Bronze (fallback)."""
+    chunk_rows: int = FILE_CHUNK_ROWS,
+    base_dir: Path = DATA_DIR,
+    dead_letter_dir: Path = DEAD_LETTER_DIR,
+) -> list[Path]:
+    """Consome eventos de um arquivo JSONL em streaming e grava em Bronze.
+
+    O arquivo é lido linha a linha e, a cada `chunk_rows` eventos (ou
+    `INGEST_BATCH_MAX_BYTES`), o buffer vira um part file. A memória fica
+    limitada ao tamanho de um chunk, independente do tamanho do arquivo.
+
+    Args:
+        filepath (Path): Arquivo JSONL (opcionalmente `.gz` ou `.zst`).
+        chunk_rows (int): Linhas por part file (`INGEST_FILE_CHUNK_ROWS`).
+        base_dir (Path): Raiz da camada Bronze.
+        dead_letter_dir (Path): Destino das linhas rejeitadas.
+
+    Returns:
+        list[Path]: Part files gravados.
+    """
     if not filepath.exists():
         raise FileNotFoundError(f"Arquivo {filepath} não encontrado.")
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        events = [json.loads(line.strip()) for line in f if line.strip()]
-
-    return _write_parquet(
-        events, filename=f"events_{datetime.now(UTC).date()}.parquet"
+    decoder = get_decoder()
+    dead_letters = DeadLetterSink(dead_letter_dir)
+    writer = BronzeBatchWriter(
+        base_dir,
+        BatchPolicy(max_rows=chunk_rows, max_latency_s=float("inf")),
+        worker_id=f"f{os.getpid()}",
     )
+    parts: list[Path] = []
+    try:
+        with _open_landing(filepath) as f:
+            for lineno, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    event = decoder.decode(line)
+                except EventDecodeError as e:
+                    dead_letters.write(
+                        line, str(e), file=str(filepath), line=lineno
+                    )
+                    continue
+                writer.add(event, len(line))
+                if writer.should_flush():
+                    parts += writer.flush()
+        if writer.rows:
+            parts += writer.flush()
+    finally:
+        dead_letters.close()
+
+    print(f"[FILE] {filepath} → {len(parts)} part files")
+    return parts
+
+
+def consume_from_files(
+    pattern: str = LANDING_GLOB,
+    workers: int = INGEST_WORKERS,
+    chunk_rows: int = FILE_CHUNK_ROWS,
+    base_dir: Path = DATA_DIR,
+    dead_letter_dir: Path = DEAD_LETTER_DIR,
+) -> list[Path]:
+    """Ingere todos os arquivos de landing que casam com `pattern`.
+
+    Com `workers > 1` cada arquivo é processado em um processo separado
+    (decode é CPU-bound), útil para backfills com muitos arquivos grandes.
+
+    Returns:
+        list[Path]: Part files gravados, de todos os arquivos.
+    """
+    files = [Path(f) for f in sorted(glob.glob(pattern))]
+    if not files:
+        raise FileNotFoundError(f"Nenhum arquivo casa com {pattern}.")
+
+    if workers <= 1 or len(files) == 1:
+        results = [
+            consume_from_file(f, chunk_rows, base_dir, dead_letter_dir)
+            for f in files
+        ]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(files)),
+            mp_context=mp.get_context("spawn"),
+        ) as pool:
+            results = list(
+                pool.map(
+                    consume_from_file,
+                    files,
+                    repeat(chunk_rows),
+                    repeat(base_dir),
+                    repeat(dead_letter_dir),
+                )
+            )
+    return [part for parts in results for part in parts]
 
 
 if __name__ == "__main__":
     mode = os.getenv("INGEST_MODE", "kafka")  # "kafka" ou "file"
-    if mode == "kafka":
+    if mode == "kafka" and INGEST_WORKER_MODE == "process":
+        consume_kafka_processes()
+    elif mode == "kafka":
         asyncio.run(consume_kafka())
     else:
-        consume_from_file()
+        consume_from_files()
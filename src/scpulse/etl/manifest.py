@@ -0,0 +1,149 @@
+"""Manifest de arquivos Bronze já processados (execução incremental).
+
+Guarda, por dia, a impressão digital (tamanho + mtime, ou hash do conteúdo)
+de cada part file que já passou por Bronze → Silver → Gold. A cada ciclo
+só são reprocessados os dias com arquivos novos, alterados ou removidos
+(ex.: após uma compactação).
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from pathlib import Path
+from typing import Any, Optional
+
+MANIFEST_PATH = Path("data/manifest/transform_manifest.json")
+TRANSFORM_FINGERPRINT = os.getenv("TRANSFORM_FINGERPRINT", "stat")  # ou "hash"
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """Identidade de um part file em um dado momento."""
+
+    size: int
+    mtime_ns: int
+    digest: str = ""
+
+    @classmethod
+    def of(cls, path: Path, mode: str = "stat") -> "FileFingerprint":
+        stat = path.stat()
+        digest = ""
+        if mode == "hash":
+            with open(path, "rb") as f:
+                digest = hashlib.file_digest(f, "blake2b").hexdigest()
+        return cls(stat.st_size, stat.st_mtime_ns, digest)
+
+
+class TransformManifest:
+    """Estado persistido em JSON: dia → arquivos processados + watermark.
+
+    O watermark de um dia é o maior mtime entre seus arquivos processados.
+    """
+
+    def __init__(
+        self,
+        path: Path = MANIFEST_PATH,
+        mode: str = TRANSFORM_FINGERPRINT,
+    ) -> None:
+        self.path = path
+        self.mode = mode
+        self._days: dict[str, dict[str, Any]] = {}
+        if path.exists():
+            self._days = json.loads(path.read_text(encoding="utf-8"))["days"]
+
+    def snapshot(self, files: list[Path]) -> dict[str, FileFingerprint]:
+        """Impressões digitais dos arquivos, tiradas antes do processamento."""
+        return {str(f): FileFingerprint.of(f, self.mode) for f in files}
+
+    def is_current(self, day: str, files: list[Path]) -> bool:
+        """True se o dia já foi processado com exatamente estes arquivos.
+
+        Compara primeiro tamanho e mtime (um `stat` por arquivo). No modo
+        `hash`, um arquivo com stat diferente ainda é considerado igual se
+        o hash do conteúdo não mudou (ex.: `touch` ou cópia).
+        """
+        entry = self._days.get(day)
+        if entry is None:
+            return False
+
+        recorded = entry["files"]
+        if set(recorded) != {str(f) for f in files}:
+            return False
+        return all(self._unchanged(recorded[str(f)], f) for f in files)
+
+    def new_files(self, day: str, files: list[Path]) -> Optional[list[Path]]:
+        """Arquivos do dia ainda não processados, se o resto está intacto.
+
+        Returns:
+            Optional[list[Path]]: Os arquivos novos, quando todos os já
+            registrados continuam presentes e inalterados (o dia pode ser
+            processado só com eles, em modo append). None quando o dia
+            nunca foi processado ou algum arquivo registrado foi removido
+            ou reescrito (ex.: compactação) e o dia precisa ser refeito.
+        """
+        entry = self._days.get(day)
+        if entry is None:
+            return None
+
+        recorded = entry["files"]
+        current = {str(f): f for f in files}
+        if not set(recorded) <= set(current):
+            return None
+        if not all(
+            self._unchanged(fp, current[name]) for name, fp in recorded.items()
+        ):
+            return None
+        return [f for f in files if str(f) not in recorded]
+
+    def _unchanged(self, recorded: dict[str, Any], path: Path) -> bool:
+        old = FileFingerprint(**recorded)
+        new = FileFingerprint.of(path)
+        if (old.size, old.mtime_ns) == (new.size, new.mtime_ns):
+            return True
+        return bool(
+            self.mode == "hash"
+            and old.digest
+            and FileFingerprint.of(path, "hash").digest == old.digest
+        )
+
+    def pending(self, days: dict[str, list[Path]]) -> dict[str, list[Path]]:
+        """Filtra os dias que precisam ser (re)processados."""
+        return {
+            day: files
+            for day, files in days.items()
+            if not self.is_current(day, files)
+        }
+
+    def mark_processed(
+        self, day: str, fingerprints: dict[str, FileFingerprint]
+    ) -> None:
+        """Registra o dia como processado e persiste o manifest.
+
+        Args:
+            day (str): Dia processado (`YYYY-MM-DD`).
+            fingerprints (dict[str, FileFingerprint]): `snapshot` tirado
+                antes do processamento; um arquivo alterado durante o ciclo
+                continua pendente para o próximo.
+        """
+        self._days[day] = {
+            "files": {name: fp.__dict__ for name, fp in fingerprints.items()},
+            "watermark": max(
+                (fp.mtime_ns for fp in fingerprints.values()), default=0
+            ),
+            "processed_at": datetime.now(UTC).isoformat(),
+        }
+        self.save()
+
+    def forget(self, day: str) -> None:
+        self._days.pop(day, None)
+        self.save()
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps({"days": self._days}, indent=2), encoding="utf-8"
+        )
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,156 @@
+"""Broker Kafka em memória para testes e desenvolvimento local.
+
+Implementa o subconjunto da API do `AIOKafkaConsumer` usado pela ingestão
+(`start`, `stop`, `getmany`, `commit`) com tópicos particionados, consumer
+groups e rebalanceamento round-robin entre os membros ativos do grupo.
+"""
+
+import asyncio
+import itertools
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class TopicPartition:
+    topic: str
+    partition: int
+
+
+@dataclass(frozen=True)
+class Message:
+    """Equivalente mínimo ao `ConsumerRecord` do aiokafka."""
+
+    topic: str
+    partition: int
+    offset: int
+    value: bytes
+    key: Optional[bytes] = None
+
+    @property
+    def serialized_value_size(self) -> int:
+        return len(self.value)
+
+
+class InMemoryBroker:
+    """Log particionado em memória com offsets confirmados por grupo."""
+
+    def __init__(self, partitions: int = 1) -> None:
+        self.partitions = partitions
+        self._logs: dict[TopicPartition, list[Message]] = defaultdict(list)
+        self._committed: dict[tuple[str, TopicPartition], int] = {}
+        self._members: dict[str, list["InMemoryConsumer"]] = defaultdict(list)
+        self._round_robin = itertools.count()
+
+    def produce(
+        self, topic: str, value: bytes, key: Optional[bytes] = None
+    ) -> Message:
+        """Publica uma mensagem (por hash da chave ou round-robin)."""
+        if key is not None:
+            partition = hash(key) % self.partitions
+        else:
+            partition = next(self._round_robin) % self.partitions
+        tp = TopicPartition(topic, partition)
+        log = self._logs[tp]
+        msg = Message(topic, partition, len(log), value, key)
+        log.append(msg)
+        return msg
+
+    def consumer(self, topic: str, group_id: str) -> "InMemoryConsumer":
+        return InMemoryConsumer(self, topic, group_id)
+
+    def committed(self, group_id: str, tp: TopicPartition) -> int:
+        return self._committed.get((group_id, tp), 0)
+
+    def lag(self, group_id: str, topic: str) -> int:
+        """Mensagens ainda não confirmadas pelo grupo no tópico."""
+        return sum(
+            len(self._logs[tp]) - self.committed(group_id, tp)
+            for tp in self._topic_partitions(topic)
+        )
+
+    def _topic_partitions(self, topic: str) -> list[TopicPartition]:
+        return [TopicPartition(topic, p) for p in range(self.partitions)]
+
+    def _join(self, member: "InMemoryConsumer") -> None:
+        self._members[member.group_id].append(member)
+        self._rebalance(member.group_id, member.topic)
+
+    def _leave(self, member: "InMemoryConsumer") -> None:
+        self._members[member.group_id].remove(member)
+        self._rebalance(member.group_id, member.topic)
+
+    def _rebalance(self, group_id: str, topic: str) -> None:
+        members = self._members[group_id]
+        if not members:
+            return
+        assignments: list[list[TopicPartition]] = [[] for _ in members]
+        for i, tp in enumerate(self._topic_partitions(topic)):
+            assignments[i % len(members)].append(tp)
+        for member, partitions in zip(members, assignments):
+            member._assign(partitions)
+
+    def _commit(
+        self, group_id: str, offsets: dict[TopicPartition, int]
+    ) -> None:
+        for tp, offset in offsets.items():
+            self._committed[(group_id, tp)] = offset
+
+    def _fetch(
+        self, tp: TopicPartition, position: int, limit: int
+    ) -> list[Message]:
+        return self._logs[tp][position : position + limit]
+
+
+class InMemoryConsumer:
+    """Consumer de um grupo no `InMemoryBroker`."""
+
+    poll_interval_s = 0.01
+
+    def __init__(self, broker: InMemoryBroker, topic: str, group_id: str):
+        self.broker = broker
+        self.topic = topic
+        self.group_id = group_id
+        self._positions: dict[TopicPartition, int] = {}
+
+    async def start(self) -> None:
+        self.broker._join(self)
+
+    async def stop(self) -> None:
+        self.broker._leave(self)
+
+    def assignment(self) -> list[TopicPartition]:
+        return list(self._positions)
+
+    def _assign(self, partitions: list[TopicPartition]) -> None:
+        # Após rebalance a leitura recomeça do último offset confirmado
+        self._positions = {
+            tp: self.broker.committed(self.group_id, tp) for tp in partitions
+        }
+
+    async def getmany(
+        self, timeout_ms: int = 0, max_records: Optional[int] = None
+    ) -> dict[TopicPartition, list[Message]]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_ms / 1000
+        while True:
+            batches = self._poll(max_records or 500)
+            if batches or loop.time() >= deadline:
+                return batches
+            await asyncio.sleep(self.poll_interval_s)
+
+    def _poll(self, max_records: int) -> dict[TopicPartition, list[Message]]:
+        batches: dict[TopicPartition, list[Message]] = {}
+        for tp, position in self._positions.items():
+            if max_records <= 0:
+                break
+            messages = self.broker._fetch(tp, position, max_records)
+            if messages:
+                batches[tp] = messages
+                self._positions[tp] = position + len(messages)
+                max_records -= len(messages)
+        return batches
+
+    async def commit(self) -> None:
+        self.broker._commit(self.group_id, dict(self._positions))
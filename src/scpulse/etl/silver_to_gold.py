@@ -1,122 +1,114 @@
+import re
+import time
+from datetime import date
 from pathlib import Path
+from typing import Optional
+
 import polars as pl
-from ..storage import crud
+
+from ..storage import copy_loader, crud
+from ..storage.dimensions import warm_dimension_caches
+from ..storage.generation import bump_db_generation, write_generation
 from ..storage.postgres import SessionLocal
+from ..storage.rollups import refresh_rollups
+from .gold_metrics import GOLD_METRICS, build_gold_frames, write_gold_frames
+
+
+_GOLD_PARTITION = re.compile(r"^events_(\d{4}-\d{2}-\d{2})$")
+
+
+def partition_day(output_dir: Path) -> Optional[date]:
+    """Dia da partição Gold `events_<dia>` (None fora desse layout)."""
+    match = _GOLD_PARTITION.match(output_dir.name)
+    return date.fromisoformat(match.group(1)) if match else None
+
+
+def with_partition_day(
+    frames: dict[str, pl.DataFrame], day: Optional[date]
+) -> dict[str, pl.DataFrame]:
+    """Preenche `date` com o dia da partição nas métricas sem data.
+
+    `orders_delayed` e `inventory_alerts` são agregadas só por dimensão;
+    sem `date` o banco gravaria o dia da carga (`date.today()`), enquanto
+    a leitura do lake (`storage.duck`) usa o dia da partição. Com o dia da
+    partição nos dois lados, `day`, filtros e cursores são os mesmos em
+    qualquer `API_READ_BACKEND`.
+    """
+    if day is None:
+        return frames
+    return {
+        name: (
+            df if "date" in df.columns else df.with_columns(date=pl.lit(day))
+        )
+        for name, df in frames.items()
+    }
+
+
+def _loaded_days(frames: dict[str, pl.DataFrame]) -> set[date]:
+    """Dias gravados nas tabelas diárias (sem `date` = snapshot de hoje)."""
+    days: set[date] = set()
+    for df in frames.values():
+        if "date" in df.columns:
+            days.update(
+                d for d in df.get_column("date").cast(pl.Date).unique() if d
+            )
+        elif df.height:
+            days.add(date.today())
+    return days
 
 
 def silver_to_gold(input_path: Path, output_dir: Path) -> None:
     """
     Converte dados da camada Silver para a camada Gold, gerando métricas
     agregadas por tipo de evento (pedidos criados, atrasados e alertas).
-    """
 
-    print(f"[SILVER→GOLD] Lendo arquivo Silver: {input_path}")
-    df = pl.read_parquet(input_path)
-    print(f"[SILVER→GOLD] {df.shape[0]} linhas carregadas do Silver")
-
-    # 🔹 Converte colunas obrigatórias
-    if "timestamp" in df.columns and df["timestamp"].dtype == pl.Utf8:
-        print("[SILVER→GOLD] Convertendo coluna timestamp para datetime UTC")
-        df = df.with_columns(
-            pl.col("timestamp")
-            .str.strptime(
-                pl.Datetime("ns"),
-                format="%Y-%m-%dT%H:%M:%S%z",
-                strict=False,
-            )
-            .dt.convert_time_zone("UTC")
-        )
+    Todas as métricas de `GOLD_METRICS` saem de um único plano lazy sobre a
+    Silver (um scan), os Parquets são gravados em paralelo e as linhas são
+    persistidas no Postgres em uma transação, junto com os rollups
+    semana/mês/total dos períodos tocados. Métricas sem `date` são
+    gravadas no banco com o dia da partição `events_<dia>`.
+    """
 
-    # 🔹 Converte colunas de entrega se existirem
-    if {"old_delivery", "new_delivery"}.issubset(df.columns):
-        print("[SILVER→GOLD] Convertendo colunas old_delivery/new_delivery")
-        df = df.with_columns(
-            [
-                pl.col("old_delivery")
-                .str.strptime(
-                    pl.Datetime("ns"), "%Y-%m-%dT%H:%M:%S%z", strict=False
-                )
-                .dt.convert_time_zone("UTC"),
-                pl.col("new_delivery")
-                .str.strptime(
-                    pl.Datetime("ns"), "%Y-%m-%dT%H:%M:%S%z", strict=False
-                )
-                .dt.convert_time_zone("UTC"),
-            ]
-        )
+    print(f"[SILVER→GOLD] Lendo Silver: {input_path}")
+    started = time.perf_counter()
+    frames = build_gold_frames(input_path)
+    write_gold_frames(frames, output_dir)
+    for name, df in frames.items():
+        print(f"[{name.upper()}] {df.shape[0]} linhas geradas")
+    print(
+        f"[SILVER→GOLD] {len(frames)} métricas em "
+        f"{time.perf_counter() - started:.2f}s"
+    )
 
-    output_dir.mkdir(parents=True, exist_ok=True)
+    frames = with_partition_day(frames, partition_day(output_dir))
 
     # Abre sessão do banco
     db = SessionLocal()
 
     try:
-        # --- Orders Created ---
-        if "supplier" in df.columns and "qty" in df.columns:
-            orders_created = (
-                df.filter(pl.col("event_type") == "order_created")
-                .group_by(
-                    pl.col("supplier"),
-                    pl.col("timestamp").dt.date().alias("date"),
-                )
-                .agg(
-                    total_orders=pl.count(),
-                    total_qty=pl.col("qty").sum(),
-                )
-            )
-            print(f"[ORDERS_CREATED] {orders_created.shape[0]} linhas geradas")
-            orders_created.write_parquet(
-                output_dir / "gold_orders_created.parquet",
-                compression="snappy",
-            )
-            print("[ORDERS_CREATED] Gravando no banco...")
-            crud.save_orders_created(db, orders_created.to_dicts())
-
-        # --- Orders Delayed ---
-        if {"supplier", "old_delivery", "new_delivery"}.issubset(df.columns):
-            orders_delayed = (
-                df.filter(pl.col("event_type") == "order_delayed")
-                .with_columns(
-                    (pl.col("new_delivery") - pl.col("old_delivery"))
-                    .dt.total_days()
-                    .alias("delay_days")
-                )
-                .group_by("supplier")
-                .agg(
-                    delayed_orders=pl.count(),
-                    avg_delay_days=pl.col("delay_days").mean(),
-                )
-            )
-            print(f"[ORDERS_DELAYED] {orders_delayed.shape[0]} linhas geradas")
-            orders_delayed.write_parquet(
-                output_dir / "gold_orders_delayed.parquet",
-                compression="snappy",
-            )
-            print("[ORDERS_DELAYED] Gravando no banco...")
-            crud.save_orders_delayed(db, orders_delayed.to_dicts())
-
-        # --- Inventory Alerts ---
-        if {"sku", "threshold"}.issubset(df.columns):
-            inventory_alerts = (
-                df.filter(pl.col("event_type") == "inventory_low")
-                .group_by("sku")
-                .agg(
-                    low_stock_alerts=pl.count(),
-                    min_threshold=pl.col("threshold").min(),
-                )
-            )
-            print(
-                f"[INVENTORY_ALERTS] {inventory_alerts.shape[0]} linhas geradas"
-            )
-            inventory_alerts.write_parquet(
-                output_dir / "gold_inventory_alerts.parquet",
-                compression="snappy",
-            )
-            print("[INVENTORY_ALERTS] Gravando no banco...")
-            crud.save_inventory_alerts(db, inventory_alerts.to_dicts())
+        warm_dimension_caches(db)
+        for name, df in frames.items():
+            metric = GOLD_METRICS[name]
+            if metric.save is None:
+                continue
+            print(f"[{name.upper()}] Gravando no banco...")
+            if (
+                copy_loader.GOLD_LOADER == "copy"
+                and name in copy_loader.GOLD_TABLES
+            ):
+                copy_loader.load_gold_frame(db, name, df)
+            else:
+                getattr(crud, metric.save)(db, df.to_dicts())
 
+        saved = {n: df for n, df in frames.items() if GOLD_METRICS[n].save}
+        refresh_rollups(db, _loaded_days(saved))
+        # 🔹 Nova geração na mesma transação: caches da API (todas as
+        # réplicas) só a veem junto com os dados
+        generation = bump_db_generation(db)
         db.commit()
         print("[DB] Commit realizado com sucesso ✅")
+        write_generation(generation)  # espelho local para o dashboard
+        print(f"[GOLD] Geração {generation}")
 
     except Exception as e:
         print(f"[DB ERROR] Falha ao persistir no banco: {e}")
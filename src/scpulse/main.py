@@ -1,13 +1,50 @@
-from fastapi import FastAPI
-from src.scpulse.api.routes import orders, inventory, suppliers, users, auth
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from src.scpulse.api.routes import (
+    orders,
+    inventory,
+    suppliers,
+    users,
+    auth,
+    exports,
+    aggregates,
+)
+from src.scpulse.core.executor import ExecutorSaturated
+from src.scpulse.storage.postgres import async_engine
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Fecha as conexões do pool assíncrono no shutdown
+    await async_engine.dispose()
+
+
+app = FastAPI(title="SupplyChain Pulse API", lifespan=lifespan)
+
+
+@app.exception_handler(ExecutorSaturated)
+async def executor_saturated_handler(
+    request: Request, exc: ExecutorSaturated
+) -> JSONResponse:
+    """Pool do bcrypt cheio: back-pressure para o cliente."""
+    return JSONResponse(
+        status_code=429,
+        content={"detail": "Servidor ocupado, tente novamente"},
+        headers={"Retry-After": "1"},
+    )
 
-app = FastAPI(title="SupplyChain Pulse API")
 
 app.include_router(orders.router)
 app.include_router(inventory.router)
 app.include_router(suppliers.router)
 app.include_router(users.router)
 app.include_router(auth.router)
+app.include_router(exports.router)
+app.include_router(aggregates.router)
 
 
 @app.get("/health")
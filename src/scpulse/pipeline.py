@@ -1,17 +1,27 @@
 """Orquestrador do pipeline Bronze → Silver → Gold."""
 
 import asyncio
+import shutil
 from pathlib import Path
 from datetime import datetime
 
 from scpulse.etl.ingest_stream import consume_kafka, consume_from_file
-from scpulse.etl.bronze_to_silver import bronze_to_silver
+from scpulse.etl.bronze_layout import bronze_days
+from scpulse.etl.bronze_to_silver import (
+    SILVER_DEDUP_KEEP,
+    bronze_to_silver,
+    silver_part_name,
+)
+from scpulse.etl.dedup import DedupIndex
+from scpulse.etl.manifest import TransformManifest
 from scpulse.etl.silver_to_gold import silver_to_gold
 
 # Diretórios
 BRONZE_DIR = Path("data/bronze")
 SILVER_DIR = Path("data/silver")
+DEDUP_DIR = SILVER_DIR / "_dedup"
 GOLD_DIR = Path("data/gold")
+MANIFEST_PATH = Path("data/manifest/transform_manifest.json")
 
 BRONZE_DIR.mkdir(parents=True, exist_ok=True)
 SILVER_DIR.mkdir(parents=True, exist_ok=True)
@@ -28,37 +38,77 @@ async def run_ingest() -> None:
     await consume_kafka()  # loop infinito
 
 
-def run_transform() -> None:
+def run_transform(incremental: bool = True) -> None:
     """Executa a pipeline Bronze → Silver → Gold em micro-batch.
 
-    Percorre os arquivos Parquet na camada Bronze,
-    transforma em Silver e gera métricas Gold.
+    Agrupa os part files do Bronze (`event_type=*/date=*`) por dia,
+    transforma cada dia em Silver e gera métricas Gold.
+
+    No modo incremental, um manifest registra os arquivos de cada dia já
+    processado; dias sem arquivos novos, alterados ou removidos são pulados
+    (e não reenviam suas linhas Gold ao Postgres). Quando um dia só ganhou
+    arquivos novos, apenas eles viram um novo part em
+    `silver/date=<dia>/`, deduplicado contra o índice de `event_id` do dia.
+    Se algum arquivo já processado mudou (ex.: compactação), a partição
+    Silver e o índice do dia são reconstruídos do zero.
+
+    Args:
+        incremental (bool, optional): Usa o manifest para pular dias sem
+            mudanças. Com False, reprocessa todo o histórico. Default = True.
 
     Raises:
+        ValueError: Se `SILVER_DEDUP_KEEP` não for "first" (o índice de
+            `event_id` mantém a primeira versão gravada).
         Exception: Se houver falha em Bronze→Silver ou Silver→Gold,
-        mas a execução continua para os demais arquivos.
+        mas a execução continua para os demais dias.
     """
+    # 🔹 Falha de configuração não é falha de um dia: aborta antes do loop
+    if SILVER_DEDUP_KEEP != "first":
+        raise ValueError(
+            f"SILVER_DEDUP_KEEP={SILVER_DEDUP_KEEP!r} não é suportado pelo "
+            "pipeline incremental (índice de dedup mantém a primeira versão)"
+        )
     print("▶️ Rodando transformações Bronze → Silver → Gold...")
 
-    for bronze_file in BRONZE_DIR.glob("events_*.parquet"):
-        silver_file: Path = SILVER_DIR / f"silver_{bronze_file.name}"
-        gold_dir: Path = GOLD_DIR / bronze_file.stem
+    manifest = TransformManifest(MANIFEST_PATH)
+    days = bronze_days(BRONZE_DIR)
+    pending = manifest.pending(days) if incremental else days
+    print(f"[PIPELINE] {len(pending)}/{len(days)} dias a processar")
+
+    for day, bronze_parts in pending.items():
+        silver_dir: Path = SILVER_DIR / f"date={day}"
+        gold_dir: Path = GOLD_DIR / f"events_{day}"
         gold_dir.mkdir(parents=True, exist_ok=True)
+        dedup_index = DedupIndex(day, DEDUP_DIR)
 
         # Bronze → Silver
         try:
-            bronze_to_silver(bronze_file, silver_file)
+            snapshot = manifest.snapshot(bronze_parts)
+            new_parts = None
+            if incremental and silver_dir.exists():
+                new_parts = manifest.new_files(day, bronze_parts)
+            if new_parts is None:
+                # 🔹 Reconstrução completa do dia
+                shutil.rmtree(silver_dir, ignore_errors=True)
+                dedup_index.reset()
+                new_parts = bronze_parts
+
+            silver_dir.mkdir(parents=True, exist_ok=True)
+            silver_file = silver_dir / silver_part_name(new_parts)
+            bronze_to_silver(new_parts, silver_file, dedup_index=dedup_index)
         except Exception as e:
-            print(f"⚠️ Erro Bronze→Silver em {bronze_file}: {e}")
+            print(f"⚠️ Erro Bronze→Silver no dia {day}: {e}")
             continue
 
-        # Silver → Gold
+        # Silver → Gold (sempre sobre a partição inteira do dia)
         try:
-            silver_to_gold(silver_file, gold_dir)
+            silver_to_gold(silver_dir, gold_dir)
         except Exception as e:
-            print(f"⚠️ Erro Silver→Gold em {silver_file}: {e}")
+            print(f"⚠️ Erro Silver→Gold em {silver_dir}: {e}")
             continue
 
+        manifest.mark_processed(day, snapshot)
+
 
 async def scheduler(interval: int = 5) -> None:
     """Agenda transformações periódicas Bronze→Silver→Gold.
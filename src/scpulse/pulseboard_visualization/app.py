@@ -1,9 +1,24 @@
-import streamlit as st
-import polars as pl
+import os
+from datetime import date, timedelta
+from typing import Optional
+
 import altair as alt
-from pathlib import Path
+import pandas as pd
+import streamlit as st
+
+from scpulse.pulseboard_visualization import gold_data
+from scpulse.pulseboard_visualization.gold_data import Partition
+from scpulse.storage.generation import GenerationWatcher
+
+try:
+    from streamlit_autorefresh import st_autorefresh
+except ImportError:  # pragma: no cover
+    st_autorefresh = None
 
-GOLD_DIR = Path("data/gold")
+PULSEBOARD_DEFAULT_DAYS = int(os.getenv("PULSEBOARD_DEFAULT_DAYS", "30"))
+PULSEBOARD_CACHE_ENTRIES = int(os.getenv("PULSEBOARD_CACHE_ENTRIES", "64"))
+PULSEBOARD_REFRESH_MS = int(os.getenv("PULSEBOARD_REFRESH_MS", "5000"))
+PULSEBOARD_MAX_POINTS = int(os.getenv("PULSEBOARD_MAX_POINTS", "2000"))
 
 st.set_page_config(
     page_title="SupplyChain Pulse",
@@ -11,11 +26,112 @@ st.set_page_config(
     layout="wide",
 )
 
+
+# 🔹 Caches por processo (compartilhados entre sessões)
+@st.cache_resource
+def kpi_cache() -> gold_data.KpiCache:
+    return gold_data.KpiCache()
+
+
+@st.cache_resource
+def frame_cache() -> gold_data.FrameCache:
+    return gold_data.FrameCache()
+
+
+@st.cache_resource
+def generation_watcher() -> GenerationWatcher:
+    return GenerationWatcher()
+
+
+# 🔹 Listagem das partições só muda quando o ETL publica uma nova geração
+@st.cache_data(max_entries=PULSEBOARD_CACHE_ENTRIES, show_spinner=False)
+def partitions_at(
+    metric: str, start: Optional[date], end: Optional[date], generation: int
+) -> tuple[Partition, ...]:
+    return tuple(gold_data.list_partitions(metric, start=start, end=end))
+
+
+def metric_partitions(
+    metric: str, start: Optional[date] = None, end: Optional[date] = None
+) -> tuple[Partition, ...]:
+    if not generation:  # sem marcador: lista a cada rerun
+        return tuple(gold_data.list_partitions(metric, start=start, end=end))
+    return tuple(partitions_at(metric, start, end, generation))
+
+
+# 🔹 A tupla de partições (com mtime) é a chave: dia regravado = cache novo;
+# o FrameCache só lê do disco as partições novas ou alteradas
+@st.cache_data(max_entries=PULSEBOARD_CACHE_ENTRIES, show_spinner=False)
+def chart_frame(
+    metric: str, partitions: tuple[Partition, ...]
+) -> pd.DataFrame:
+    return gold_data.chart_data(
+        metric,
+        partitions,
+        frames=frame_cache(),
+        max_points=PULSEBOARD_MAX_POINTS,
+    ).to_pandas()
+
+
+def fmt(value: Optional[float], pattern: str = "{:.1f}") -> str:
+    return "-" if value is None else pattern.format(value)
+
+
 st.title("📊 SupplyChain Pulse Dashboard")
 st.caption(
     "Monitoramento em tempo real da cadeia de suprimentos (Orders, Delays, Inventory)"
 )
 
+live = st.sidebar.toggle("🔴 Modo ao vivo", value=False)
+if live:
+    if st_autorefresh is None:
+        st.sidebar.error(
+            "Modo ao vivo requer streamlit-autorefresh "
+            "(poetry add streamlit-autorefresh)"
+        )
+    else:
+        st_autorefresh(interval=PULSEBOARD_REFRESH_MS, key="pulse_live")
+
+generation = generation_watcher().current()
+days = sorted(
+    {p.day for metric in gold_data.METRICS for p in metric_partitions(metric)}
+)
+if not days:
+    st.warning(
+        f"Nenhuma partição Gold em {gold_data.GOLD_DIR}. Rode o pipeline."
+    )
+    st.stop()
+
+if live:
+    # janela deslizante que acompanha o último dia publicado
+    window = st.sidebar.number_input(
+        "Janela (dias)", min_value=1, value=PULSEBOARD_DEFAULT_DAYS
+    )
+    start, end = days[-1] - timedelta(days=int(window) - 1), days[-1]
+else:
+    default_start = max(
+        days[0], days[-1] - timedelta(days=PULSEBOARD_DEFAULT_DAYS - 1)
+    )
+    selected = st.sidebar.date_input(
+        "Período",
+        value=(default_start, days[-1]),
+        min_value=days[0],
+        max_value=days[-1],
+    )
+    if not isinstance(selected, tuple) or len(selected) != 2:
+        st.stop()  # intervalo ainda sendo escolhido
+    start, end = selected
+
+kpis = kpi_cache()
+parts = {
+    metric: metric_partitions(metric, start, end)
+    for metric in gold_data.METRICS
+}
+st.sidebar.caption(
+    f"{len(parts['orders_created'])} dias com pedidos entre {start} e {end}"
+    f" · geração Gold {generation}"
+)
+
 # --- Tabs ---
 tab1, tab2, tab3 = st.tabs(["📦 Orders", "⏳ Delays", "⚠️ Inventory"])
 
@@ -23,86 +139,77 @@ tab1, tab2, tab3 = st.tabs(["📦 Orders", "⏳ Delays", "⚠️ Inventory"])
 # ------------------- ORDERS -------------------
 with tab1:
     st.header("📦 Pedidos Criados")
-    df_orders = pl.read_parquet(
-        GOLD_DIR / "events_2025-09-17" / "gold_orders_created.parquet"
-    )
-
-    # KPIs
-    total_orders = int(df_orders["total_orders"].sum())
-    total_qty = int(df_orders["total_qty"].sum())
-    avg_per_supplier = (
-        df_orders.group_by("supplier")
-        .agg(pl.sum("total_orders").alias("supplier_orders"))[
-            "supplier_orders"
-        ]
-        .mean()
-    )
+    k = kpis.kpis("orders_created", parts["orders_created"])
 
     col1, col2, col3 = st.columns(3)
-    col1.metric("Total de Pedidos", total_orders)
-    col2.metric("Quantidade Total de Produtos x Pedido", total_qty)
-    col3.metric("Média por Fornecedor", f"{avg_per_supplier:.1f}")
+    col1.metric("Total de Pedidos", int(k["total_orders"]))
+    col2.metric("Quantidade Total de Produtos x Pedido", int(k["total_qty"]))
+    col3.metric("Média por Fornecedor", fmt(k["avg_per_supplier"]))
 
     # Evolução temporal
     st.subheader("📈 Evolução de Pedidos por Fornecedor")
-    chart = (
-        alt.Chart(df_orders.to_pandas())
-        .mark_line(point=True)
-        .encode(
-            x="date:T",
-            y="total_orders:Q",
-            color="supplier:N",
-            tooltip=["supplier", "date", "total_orders", "total_qty"],
+    if parts["orders_created"]:
+        chart = (
+            alt.Chart(chart_frame("orders_created", parts["orders_created"]))
+            .mark_line(point=True)
+            .encode(
+                x="day:T",
+                y="total_orders:Q",
+                color="supplier:N",
+                tooltip=["supplier", "day", "total_orders", "total_qty"],
+            )
+            .properties(width="container", height=400)
         )
-        .properties(width="container", height=400)
-    )
-    st.altair_chart(chart, use_container_width=True)
+        st.altair_chart(chart, use_container_width=True)
+    else:
+        st.info("Sem pedidos no período.")
 
 
 # ------------------- DELAYS -------------------
 with tab2:
     st.header("⏳ Pedidos Atrasados")
-    df_delays = pl.read_parquet(
-        GOLD_DIR / "events_2025-09-17" / "gold_orders_delayed.parquet"
-    )
-
-    # KPIs
-    total_delayed = int(df_delays["delayed_orders"].sum())
-    avg_delay = float(df_delays["avg_delay_days"].mean())
+    k = kpis.kpis("orders_delayed", parts["orders_delayed"])
 
     col1, col2 = st.columns(2)
-    col1.metric("Pedidos Atrasados", total_delayed)
-    col2.metric("Atraso Médio (dias)", f"{avg_delay:.1f}")
+    col1.metric("Pedidos Atrasados", int(k["delayed_orders"]))
+    col2.metric("Atraso Médio (dias)", fmt(k["avg_delay_days"]))
 
     # Ranking de fornecedores mais críticos
     st.subheader("🏭 Ranking de Fornecedores com Mais Atrasos")
-    st.bar_chart(df_delays.to_pandas(), x="supplier", y="delayed_orders")
+    if parts["orders_delayed"]:
+        st.bar_chart(
+            chart_frame("orders_delayed", parts["orders_delayed"]),
+            x="supplier",
+            y="delayed_orders",
+        )
+    else:
+        st.info("Sem atrasos no período.")
 
 
 # ------------------- INVENTORY -------------------
 with tab3:
     st.header("⚠️ Alertas de Estoque")
-    df_inventory = pl.read_parquet(
-        GOLD_DIR / "events_2025-09-17" / "gold_inventory_alerts.parquet"
-    )
-
-    total_alerts = int(df_inventory["low_stock_alerts"].sum())
-    min_threshold = int(df_inventory["min_threshold"].min())
+    k = kpis.kpis("inventory_alerts", parts["inventory_alerts"])
 
     col1, col2 = st.columns(2)
-    col1.metric("Total de Alertas", total_alerts)
-    col2.metric("Threshold Mínimo", min_threshold)
+    col1.metric("Total de Alertas", int(k["low_stock_alerts"]))
+    col2.metric("Threshold Mínimo", fmt(k["min_threshold"], "{:.0f}"))
 
     st.subheader("📊 Alertas por SKU")
-    chart_inv = (
-        alt.Chart(df_inventory.to_pandas())
-        .mark_bar()
-        .encode(
-            x="sku:N",
-            y="low_stock_alerts:Q",
-            color="sku:N",
-            tooltip=["sku", "low_stock_alerts", "min_threshold"],
+    if parts["inventory_alerts"]:
+        chart_inv = (
+            alt.Chart(
+                chart_frame("inventory_alerts", parts["inventory_alerts"])
+            )
+            .mark_bar()
+            .encode(
+                x="sku:N",
+                y="low_stock_alerts:Q",
+                color="sku:N",
+                tooltip=["sku", "low_stock_alerts", "min_threshold"],
+            )
+            .properties(width="container", height=400)
         )
-        .properties(width="container", height=400)
-    )
-    st.altair_chart(chart_inv, use_container_width=True)
+        st.altair_chart(chart_inv, use_container_width=True)
+    else:
+        st.info("Sem alertas no período.")
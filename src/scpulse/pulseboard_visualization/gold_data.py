@@ -0,0 +1,410 @@
+"""Camada de dados do pulseboard: partições Gold por intervalo de datas.
+
+O dashboard lia três Parquets fixos (`events_2025-09-17`) a cada rerun.
+Aqui as partições `events_<dia>/gold_<métrica>.parquet` são listadas para
+o intervalo escolhido e identificadas por `(mtime_ns, tamanho)`:
+
+- `Partition` é uma tupla (hashable): a lista de partições é a chave dos
+  caches do Streamlit e muda sozinha quando o ETL regrava um dia;
+- `scan_metric` faz um scan lazy só dos dias pedidos, com a coluna `day`
+  tirada do nome da partição;
+- `KpiCache` guarda agregados parciais por partição (LRU) e só relê as
+  partições novas ou alteradas; os KPIs do intervalo somam os parciais;
+- `FrameCache` faz o mesmo com as linhas dos gráficos (modo ao vivo: a
+  cada nova geração Gold só os dias regravados são lidos);
+- `downsample` reduz séries longas com LTTB antes de irem ao navegador.
+
+Sem dependência do Streamlit: `app.py` aplica `st.cache_data` /
+`st.cache_resource` por cima destas funções.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Callable, Iterable, NamedTuple, Optional, Sequence
+
+import polars as pl
+
+from ..core.cache import LRUCache
+
+GOLD_DIR = Path(os.getenv("LAKE_GOLD_DIR", "data/gold"))
+PULSEBOARD_KPI_CACHE_MAX = int(os.getenv("PULSEBOARD_KPI_CACHE_MAX", "4096"))
+PULSEBOARD_FRAME_CACHE_MAX = int(
+    os.getenv("PULSEBOARD_FRAME_CACHE_MAX", "2048")
+)
+
+_GOLD_PARTITION = re.compile(r"^events_(\d{4}-\d{2}-\d{2})$")
+
+
+class Partition(NamedTuple):
+    day: date
+    path: str
+    mtime_ns: int
+    size: int
+
+
+@dataclass(frozen=True)
+class Totals:
+    """Agregados parciais de uma ou mais partições (somáveis)."""
+
+    rows: int = 0
+    sums: dict[str, float] = field(default_factory=dict)
+    mins: dict[str, float] = field(default_factory=dict)
+    keys: frozenset[str] = frozenset()
+
+    def __add__(self, other: "Totals") -> "Totals":
+        sums = dict(self.sums)
+        for name, value in other.sums.items():
+            sums[name] = sums.get(name, 0) + value
+        mins = dict(self.mins)
+        for name, value in other.mins.items():
+            mins[name] = min(mins.get(name, value), value)
+        return Totals(
+            rows=self.rows + other.rows,
+            sums=sums,
+            mins=mins,
+            keys=self.keys | other.keys,
+        )
+
+
+@dataclass(frozen=True)
+class MetricSpec:
+    """Como resumir uma métrica Gold.
+
+    Args:
+        key (str): Dimensão da métrica (`supplier` / `sku`).
+        sums (tuple[str, ...]): Colunas somadas nos KPIs.
+        mins (tuple[str, ...]): Colunas reduzidas por mínimo.
+        kpis (Callable[[Totals], dict]): KPIs finais a partir dos totais.
+        chart (Callable[[pl.LazyFrame], pl.LazyFrame]): Dados do gráfico.
+        series (Optional[tuple[str, str, str]]): `(x, y, série)` do gráfico
+            de linhas, reduzido por `downsample`; None = sem redução.
+    """
+
+    key: str
+    sums: tuple[str, ...]
+    mins: tuple[str, ...]
+    kpis: Callable[[Totals], dict[str, Optional[float]]]
+    chart: Callable[[pl.LazyFrame], pl.LazyFrame]
+    series: Optional[tuple[str, str, str]] = None
+
+
+def _ratio(num: float, den: float) -> Optional[float]:
+    return num / den if den else None
+
+
+METRICS: dict[str, MetricSpec] = {
+    "orders_created": MetricSpec(
+        key="supplier",
+        sums=("total_orders", "total_qty"),
+        mins=(),
+        kpis=lambda t: {
+            "total_orders": t.sums.get("total_orders", 0),
+            "total_qty": t.sums.get("total_qty", 0),
+            "avg_per_supplier": _ratio(
+                t.sums.get("total_orders", 0), len(t.keys)
+            ),
+        },
+        # 🔹 Série diária por fornecedor (gráfico de linhas)
+        chart=lambda lf: lf.select(
+            "day", "supplier", "total_orders", "total_qty"
+        ).sort("day", "supplier"),
+        series=("day", "total_orders", "supplier"),
+    ),
+    "orders_delayed": MetricSpec(
+        key="supplier",
+        sums=("delayed_orders", "avg_delay_days"),
+        mins=(),
+        kpis=lambda t: {
+            "delayed_orders": t.sums.get("delayed_orders", 0),
+            # média das linhas (fornecedor x dia), como no dashboard original
+            "avg_delay_days": _ratio(t.sums.get("avg_delay_days", 0), t.rows),
+        },
+        chart=lambda lf: lf.group_by("supplier")
+        .agg(pl.col("delayed_orders").sum())
+        .sort("delayed_orders", "supplier", descending=[True, False]),
+    ),
+    "inventory_alerts": MetricSpec(
+        key="sku",
+        sums=("low_stock_alerts",),
+        mins=("min_threshold",),
+        kpis=lambda t: {
+            "low_stock_alerts": t.sums.get("low_stock_alerts", 0),
+            "min_threshold": t.mins.get("min_threshold"),
+        },
+        chart=lambda lf: lf.group_by("sku")
+        .agg(
+            pl.col("low_stock_alerts").sum(),
+            pl.col("min_threshold").min(),
+        )
+        .sort("sku"),
+    ),
+}
+
+
+def _spec(metric: str) -> MetricSpec:
+    try:
+        return METRICS[metric]
+    except KeyError:
+        raise ValueError(
+            f"Métrica desconhecida: {metric!r}. Use {sorted(METRICS)}"
+        ) from None
+
+
+def list_partitions(
+    metric: str,
+    gold_dir: Path = GOLD_DIR,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> tuple[Partition, ...]:
+    """Partições da métrica em [start, end], ordenadas por dia.
+
+    Só faz `stat` nos arquivos: nenhum Parquet é aberto.
+    """
+    _spec(metric)
+    if not gold_dir.is_dir():
+        return ()
+    found = []
+    for child in gold_dir.iterdir():
+        match = _GOLD_PARTITION.match(child.name)
+        if not match:
+            continue
+        day = date.fromisoformat(match.group(1))
+        if (start and day < start) or (end and day > end):
+            continue
+        path = child / f"gold_{metric}.parquet"
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        found.append(Partition(day, str(path), st.st_mtime_ns, st.st_size))
+    return tuple(sorted(found))
+
+
+def available_days(gold_dir: Path = GOLD_DIR) -> list[date]:
+    """Dias com ao menos uma métrica Gold escrita."""
+    days = {
+        p.day for metric in METRICS for p in list_partitions(metric, gold_dir)
+    }
+    return sorted(days)
+
+
+def scan_metric(
+    metric: str, partitions: Iterable[Partition]
+) -> Optional[pl.LazyFrame]:
+    """Scan lazy das partições com a coluna `day`; None se não houver."""
+    _spec(metric)
+    scans = [
+        pl.scan_parquet(p.path).with_columns(day=pl.lit(p.day))
+        for p in partitions
+    ]
+    if not scans:
+        return None
+    return pl.concat(scans, how="diagonal_relaxed")
+
+
+def chart_data(
+    metric: str,
+    partitions: Iterable[Partition],
+    frames: Optional[FrameCache] = None,
+    max_points: Optional[int] = None,
+) -> pl.DataFrame:
+    """Dados do gráfico da métrica no intervalo (já agregados).
+
+    Args:
+        metric (str): Métrica Gold.
+        partitions (Iterable[Partition]): Partições do intervalo.
+        frames (Optional[FrameCache]): Cache de partições; None = scan
+            lazy direto dos arquivos.
+        max_points (Optional[int]): Limite de pontos das séries de linha
+            (LTTB); None = todos os pontos.
+    """
+    spec = _spec(metric)
+    if frames is not None:
+        df = frames.frame(metric, partitions)
+        lf = None if df.is_empty() else df.lazy()
+    else:
+        lf = scan_metric(metric, partitions)
+    if lf is None:
+        return pl.DataFrame()
+    df = spec.chart(lf).collect()
+    if max_points is not None and spec.series is not None:
+        x, y, by = spec.series
+        df = downsample(df, x, y, max_points, by=by)
+    return df
+
+
+def lttb(
+    xs: Sequence[float], ys: Sequence[float], threshold: int
+) -> list[int]:
+    """Índices mantidos pelo Largest-Triangle-Three-Buckets.
+
+    Mantém o primeiro e o último ponto e, em cada um dos `threshold - 2`
+    baldes intermediários, o ponto que forma o maior triângulo com o ponto
+    escolhido no balde anterior e a média do próximo: picos e vales
+    sobrevivem à redução. `xs` deve estar ordenado.
+    """
+    n = len(xs)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+    every = (n - 2) / (threshold - 2)
+    keep = [0]
+    a = 0
+    for i in range(threshold - 2):
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        span = next_end - next_start
+        avg_x = sum(xs[next_start:next_end]) / span
+        avg_y = sum(ys[next_start:next_end]) / span
+        ax, ay = xs[a], ys[a]
+        a = max(
+            range(int(i * every) + 1, next_start),
+            key=lambda j: abs(
+                (ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay)
+            ),
+        )
+        keep.append(a)
+    keep.append(n - 1)
+    return keep
+
+
+def downsample(
+    df: pl.DataFrame,
+    x: str,
+    y: str,
+    max_points: int,
+    by: Optional[str] = None,
+) -> pl.DataFrame:
+    """Reduz `df` a ~`max_points` linhas com LTTB (por série, se `by`).
+
+    O orçamento é dividido igualmente entre as séries, com no mínimo 3
+    pontos cada (com mais de `max_points / 3` séries o total passa do
+    limite). `x` pode ser data/datetime (usa o valor físico).
+    """
+    if df.height <= max_points:
+        return df
+    groups = (
+        [df.sort(x)]
+        if by is None
+        else [g.sort(x) for _, g in df.group_by(by, maintain_order=True)]
+    )
+    budget = max(max_points // len(groups), 3)
+    reduced = []
+    for g in groups:
+        xs = g[x].to_physical().cast(pl.Float64).to_list()
+        ys = g[y].cast(pl.Float64).fill_null(0).to_list()
+        reduced.append(g[lttb(xs, ys, budget)])
+    out = pl.concat(reduced)
+    return out.sort(x, by) if by is not None else out
+
+
+def partition_totals(metric: str, partition: Partition) -> Totals:
+    """Agregados parciais de uma partição (lê só as colunas usadas)."""
+    spec = _spec(metric)
+    df = (
+        pl.scan_parquet(partition.path)
+        .select(spec.key, *spec.sums, *spec.mins)
+        .collect()
+    )
+    if df.is_empty():
+        return Totals()
+    lows = {name: df.select(pl.col(name).min()).item() for name in spec.mins}
+    return Totals(
+        rows=df.height,
+        sums={name: float(df[name].sum()) for name in spec.sums},
+        mins={name: float(v) for name, v in lows.items() if v is not None},
+        keys=frozenset(df[spec.key].drop_nulls().to_list()),
+    )
+
+
+class KpiCache:
+    """Agregados parciais por partição, recalculados só quando ela muda.
+
+    A entrada de cada `(métrica, arquivo)` guarda o `(mtime_ns, tamanho)`
+    com que foi calculada: um dia regravado pelo ETL é relido, os demais
+    não. Partições removidas saem por LRU.
+
+    Args:
+        maxsize (int): Partições mantidas em cache (todas as métricas).
+    """
+
+    def __init__(self, maxsize: int = PULSEBOARD_KPI_CACHE_MAX) -> None:
+        self.cache: LRUCache[tuple[str, str], tuple[int, int, Totals]] = (
+            LRUCache(maxsize)
+        )
+        self.computed = 0
+
+    def totals(self, metric: str, partitions: Iterable[Partition]) -> Totals:
+        partitions = list(partitions)
+        keys = [(metric, p.path) for p in partitions]
+        cached = self.cache.get_many(keys)
+        total = Totals()
+        fresh = []
+        for key, p in zip(keys, partitions):
+            entry = cached.get(key)
+            if entry is not None and entry[:2] == (p.mtime_ns, p.size):
+                part = entry[2]
+            else:
+                part = partition_totals(metric, p)
+                fresh.append((key, (p.mtime_ns, p.size, part)))
+                self.computed += 1
+            total = total + part
+        self.cache.set_many(fresh)
+        return total
+
+    def kpis(
+        self, metric: str, partitions: Iterable[Partition]
+    ) -> dict[str, Optional[float]]:
+        """KPIs da métrica no intervalo coberto por `partitions`."""
+        return _spec(metric).kpis(self.totals(metric, partitions))
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+
+class FrameCache:
+    """Linhas Gold por partição, lidas uma vez e mescladas sob demanda.
+
+    Mesma chave de `KpiCache` (`(mtime_ns, tamanho)` por arquivo): quando
+    o ETL grava uma nova geração, só os dias novos ou regravados são
+    lidos; o resto do intervalo vem da memória.
+
+    Args:
+        maxsize (int): Partições mantidas em cache (todas as métricas).
+    """
+
+    def __init__(self, maxsize: int = PULSEBOARD_FRAME_CACHE_MAX) -> None:
+        self.cache: LRUCache[
+            tuple[str, str], tuple[int, int, pl.DataFrame]
+        ] = LRUCache(maxsize)
+        self.loaded = 0
+
+    def frame(
+        self, metric: str, partitions: Iterable[Partition]
+    ) -> pl.DataFrame:
+        _spec(metric)
+        partitions = list(partitions)
+        keys = [(metric, p.path) for p in partitions]
+        cached = self.cache.get_many(keys)
+        frames = []
+        fresh = []
+        for key, p in zip(keys, partitions):
+            entry = cached.get(key)
+            if entry is not None and entry[:2] == (p.mtime_ns, p.size):
+                df = entry[2]
+            else:
+                df = pl.read_parquet(p.path).with_columns(day=pl.lit(p.day))
+                fresh.append((key, (p.mtime_ns, p.size, df)))
+                self.loaded += 1
+            frames.append(df)
+        self.cache.set_many(fresh)
+        if not frames:
+            return pl.DataFrame()
+        return pl.concat(frames, how="diagonal_relaxed")
+
+    def clear(self) -> None:
+        self.cache.clear()
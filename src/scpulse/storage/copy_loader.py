@@ -0,0 +1,186 @@
+"""Carga Gold via `COPY ... FROM STDIN` + merge a partir de tabela temporária.
+
+Caminho alternativo a `crud.save_*` (selecionado por `GOLD_LOADER=copy`):
+o agregado Polars é serializado em CSV por fatias e enviado ao Postgres por
+`COPY`, sem criar um dict Python por linha. Em seguida um único
+`INSERT ... SELECT ... ON CONFLICT DO UPDATE` faz o merge na tabela Gold.
+
+    dimensões (cache) → DataFrame tipado → COPY → tabela temp → merge
+"""
+
+from __future__ import annotations
+
+import io
+import os
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Iterator
+
+import polars as pl
+from sqlalchemy.orm import Session
+
+from .dimensions import SKUS, SUPPLIERS, DimensionCache
+
+GOLD_LOADER = os.getenv("GOLD_LOADER", "upsert")  # ou "copy"
+COPY_SLICE_ROWS = int(os.getenv("COPY_SLICE_ROWS", "50000"))
+
+
+@dataclass(frozen=True)
+class GoldTableSpec:
+    """Como um agregado Gold vira linhas de uma tabela do Postgres.
+
+    Attributes:
+        table (str): Tabela de destino.
+        constraint (str): Unique constraint usada no `ON CONFLICT`.
+        dimension (DimensionCache): Dimensão da chave natural.
+        natural_key (str): Coluna do agregado com o valor natural.
+        surrogate_key (str): Coluna de destino com o id da dimensão.
+        values (dict[str, pl.DataType]): Colunas de métrica e seus tipos.
+    """
+
+    table: str
+    constraint: str
+    dimension: DimensionCache
+    natural_key: str
+    surrogate_key: str
+    values: dict[str, Any]
+
+    @property
+    def columns(self) -> list[str]:
+        return ["day", self.surrogate_key, *self.values]
+
+
+GOLD_TABLES = {
+    "orders_created": GoldTableSpec(
+        table="orders_created_daily",
+        constraint="uq_ocd_day_supplier",
+        dimension=SUPPLIERS,
+        natural_key="supplier",
+        surrogate_key="supplier_id",
+        values={"total_orders": pl.Int64, "total_qty": pl.Int64},
+    ),
+    "orders_delayed": GoldTableSpec(
+        table="orders_delayed_daily",
+        constraint="uq_odd_day_supplier",
+        dimension=SUPPLIERS,
+        natural_key="supplier",
+        surrogate_key="supplier_id",
+        values={"delayed_orders": pl.Int64, "avg_delay_days": pl.Float64},
+    ),
+    "inventory_alerts": GoldTableSpec(
+        table="inventory_alerts_daily",
+        constraint="uq_iad_day_sku",
+        dimension=SKUS,
+        natural_key="sku",
+        surrogate_key="sku_id",
+        values={"low_stock_alerts": pl.Int64, "min_threshold": pl.Int64},
+    ),
+}
+
+
+def prepare_frame(
+    df: pl.DataFrame, spec: GoldTableSpec, keys: dict[str, int]
+) -> pl.DataFrame:
+    """Converte o agregado Gold nas colunas da tabela de destino.
+
+    Mesmas regras de `crud.save_*`: linhas sem chave natural são
+    descartadas, `date` ausente vira o dia atual, métricas nulas viram 0 e
+    chaves repetidas ficam com a última linha.
+    """
+    day = (
+        pl.col("date").cast(pl.Date).fill_null(date.today())
+        if "date" in df.columns
+        else pl.lit(date.today())
+    )
+    return (
+        df.filter(pl.col(spec.natural_key).is_not_null())
+        .select(
+            day.alias("day"),
+            pl.col(spec.natural_key)
+            .replace_strict(keys, return_dtype=pl.Int64)
+            .alias(spec.surrogate_key),
+            *(
+                pl.col(c).cast(dtype).fill_null(0).alias(c)
+                for c, dtype in spec.values.items()
+            ),
+        )
+        .unique(subset=["day", spec.surrogate_key], keep="last")
+    )
+
+
+class CsvStream(io.RawIOBase):
+    """Arquivo somente-leitura que gera o CSV de um DataFrame sob demanda.
+
+    O `copy_expert` do psycopg2 lê em blocos; cada fatia de `slice_rows`
+    linhas só é serializada quando o bloco anterior foi consumido.
+    """
+
+    def __init__(
+        self, df: pl.DataFrame, slice_rows: int = COPY_SLICE_ROWS
+    ) -> None:
+        self._slices: Iterator[pl.DataFrame] = df.iter_slices(slice_rows)
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._pending:
+            chunk = next(self._slices, None)
+            if chunk is None:
+                return 0
+            self._pending = chunk.write_csv(include_header=False).encode()
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def copy_frame(db: Session, df: pl.DataFrame, table: str) -> None:
+    """`COPY table (colunas) FROM STDIN` na conexão da sessão."""
+    columns = ", ".join(df.columns)
+    raw = db.connection().connection.driver_connection
+    if raw is None:
+        raise RuntimeError("Sessão sem conexão DBAPI ativa para o COPY")
+    with raw.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)",
+            io.BufferedReader(CsvStream(df)),
+        )
+
+
+def load_gold_frame(db: Session, name: str, df: pl.DataFrame) -> int:
+    """Carrega um agregado Gold via COPY + merge, na transação da sessão.
+
+    Args:
+        db (Session): Sessão síncrona (psycopg2).
+        name (str): Métrica Gold (chave de `GOLD_TABLES`).
+        df (pl.DataFrame): Agregado produzido por `build_gold_frames`.
+
+    Returns:
+        int: Linhas enviadas ao banco.
+    """
+    spec = GOLD_TABLES[name]
+    keys = spec.dimension.resolve(
+        db, df[spec.natural_key].drop_nulls().unique().to_list()
+    )
+    rows = prepare_frame(df, spec, keys)
+    if rows.is_empty():
+        return 0
+
+    stage = f"_stage_{spec.table}"
+    columns = ", ".join(spec.columns)
+    updates = ", ".join(f"{c} = EXCLUDED.{c}" for c in spec.values)
+    conn = db.connection()
+    conn.exec_driver_sql(f"DROP TABLE IF EXISTS {stage}")
+    conn.exec_driver_sql(
+        f"CREATE TEMP TABLE {stage} ON COMMIT DROP AS "
+        f"SELECT {columns} FROM {spec.table} WITH NO DATA"
+    )
+    copy_frame(db, rows, stage)
+    conn.exec_driver_sql(
+        f"INSERT INTO {spec.table} ({columns}) "
+        f"SELECT {columns} FROM {stage} "
+        f"ON CONFLICT ON CONSTRAINT {spec.constraint} DO UPDATE SET {updates}"
+    )
+    return int(rows.height)
@@ -1,102 +1,123 @@
 from __future__ import annotations
 
-from datetime import date
-from typing import Iterable, Any, Sequence
+import os
+from datetime import date, datetime
+from typing import Iterable, Iterator, Any, Sequence, cast
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.dialects.postgresql import insert
 
+from .dimensions import SKUS, SUPPLIERS
 from .models.entities import (
-    Supplier,
-    Sku,
     OrdersCreatedDaily,
     OrdersDelayedDaily,
     InventoryAlertsDaily,
 )
 
 
+# Máximo de linhas por statement multi-row (Postgres aceita até 65535
+# parâmetros por statement; 5000 linhas x 4 colunas fica bem abaixo)
+UPSERT_CHUNK_ROWS = int(os.getenv("UPSERT_CHUNK_ROWS", "5000"))
+
+
+def _chunks(rows: list, size: int = UPSERT_CHUNK_ROWS) -> Iterator[list]:
+    for i in range(0, len(rows), size):
+        yield rows[i : i + size]
+
+
+def _as_date(value: Any, default: date | None = None) -> date | None:
+    """Normaliza date, datetime ou str YYYY-MM-DD para `date`."""
+    if value is None:
+        return default
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        return date.fromisoformat(value)
+    return cast(date, value)
+
+
 # -----------------------------
-# Helpers de dimensão (upsert)
+# Helpers de dimensão (cache + upsert)
 # -----------------------------
+def _ensure_suppliers(
+    db: Session, names: Iterable[str | None]
+) -> dict[str, int]:
+    return SUPPLIERS.resolve(db, names)
+
+
+def _ensure_skus(
+    db: Session, sku_codes: Iterable[str | None]
+) -> dict[str, int]:
+    return SKUS.resolve(db, sku_codes)
+
+
 def _ensure_supplier(db: Session, name: str) -> int:
-    # tenta rápido no cache/DB
-    sup = db.execute(
-        select(Supplier).where(Supplier.name == name)
-    ).scalar_one_or_none()
-    if sup:
-        return int(sup.id)
-
-    stmt = (
-        insert(Supplier)
-        .values(name=name)
-        .on_conflict_do_update(
-            index_elements=[Supplier.name],
-            set_={"name": name},
-        )
-        .returning(Supplier.id)
-    )
-    return int(db.execute(stmt).scalar_one())
+    return _ensure_suppliers(db, [name])[name]
 
 
 def _ensure_sku(db: Session, sku_code: str) -> int:
-    sku = db.execute(
-        select(Sku).where(Sku.sku_code == sku_code)
-    ).scalar_one_or_none()
-    if sku:
-        return int(sku.id)
-
-    stmt = (
-        insert(Sku)
-        .values(sku_code=sku_code)
-        .on_conflict_do_update(
-            index_elements=[Sku.sku_code],
-            set_={"sku_code": sku_code},
-        )
-        .returning(Sku.id)
+    return _ensure_skus(db, [sku_code])[sku_code]
+
+
+def _bulk_upsert(
+    db: Session,
+    model: Any,
+    rows: list[dict],
+    constraint: str,
+    key_cols: tuple[str, ...],
+) -> int:
+    """Upsert multi-row: um `INSERT ... ON CONFLICT DO UPDATE` por chunk.
+
+    Linhas repetidas na mesma chave são reduzidas à última (o Postgres
+    rejeita um statement que atualiza a mesma linha duas vezes).
+
+    Returns:
+        int: Linhas enviadas ao banco.
+    """
+    unique_rows = list(
+        {tuple(r[k] for k in key_cols): r for r in rows}.values()
     )
-    return int(db.execute(stmt).scalar_one())
+    if not unique_rows:
+        return 0
+
+    update_cols = [c for c in unique_rows[0] if c not in key_cols]
+    for chunk in _chunks(unique_rows):
+        stmt = insert(model).values(chunk)
+        stmt = stmt.on_conflict_do_update(
+            constraint=constraint,
+            set_={c: stmt.excluded[c] for c in update_cols},
+        )
+        db.execute(stmt)
+    return len(unique_rows)
 
 
 # -------------------------------------------
 # Save: gold_orders_created.parquet (agregado)
 # Espera rows com: supplier, date, total_orders, total_qty
 # -------------------------------------------
-def save_orders_created(db: Session, rows: Iterable[dict]) -> None:
-    for r in rows:
-        supplier_name = r.get("supplier")
-        day_value = r.get("date")
-        total_orders = int(r.get("total_orders", 0) or 0)
-        total_qty = int(r.get("total_qty", 0) or 0)
-
-        if supplier_name is None or day_value is None:
-            continue
-
-        # day_value pode ser date, datetime ou str YYYY-MM-DD
-        if isinstance(day_value, str):
-            day_value = date.fromisoformat(day_value)
-
-        supplier_id = _ensure_supplier(db, supplier_name)
-
-        stmt = (
-            insert(OrdersCreatedDaily)
-            .values(
-                day=day_value,
-                supplier_id=supplier_id,
-                total_orders=total_orders,
-                total_qty=total_qty,
-            )
-            .on_conflict_do_update(
-                constraint="uq_ocd_day_supplier",
-                set_={
-                    "total_orders": total_orders,
-                    "total_qty": total_qty,
-                },
-            )
-            .returning(OrdersCreatedDaily.id)
-        )
-        result = db.execute(stmt)
-        inserted_id = result.scalar_one_or_none()
-        print(f"[DEBUG] ✅ Inserido/Atualizado com id = {inserted_id}")
+def save_orders_created(db: Session, rows: Iterable[dict]) -> int:
+    rows = [
+        r
+        for r in rows
+        if r.get("supplier") is not None and r.get("date") is not None
+    ]
+    supplier_ids = _ensure_suppliers(db, (r["supplier"] for r in rows))
+    return _bulk_upsert(
+        db,
+        OrdersCreatedDaily,
+        [
+            {
+                "day": _as_date(r["date"]),
+                "supplier_id": supplier_ids[r["supplier"]],
+                "total_orders": int(r.get("total_orders", 0) or 0),
+                "total_qty": int(r.get("total_qty", 0) or 0),
+            }
+            for r in rows
+        ],
+        constraint="uq_ocd_day_supplier",
+        key_cols=("day", "supplier_id"),
+    )
 
 
 # -------------------------------------------
@@ -104,40 +125,25 @@ def save_orders_created(db: Session, rows: Iterable[dict]) -> None:
 # Espera rows com: supplier, delayed_orders, avg_delay_days
 # Usa snapshot do dia atual (ou ajuste se fornecer "date")
 # -------------------------------------------
-def save_orders_delayed(db: Session, rows: Iterable[dict]) -> None:
-    for r in rows:
-        supplier_name = r.get("supplier")
-        delayed_orders = int(r.get("delayed_orders", 0) or 0)
-        avg_delay_days = float(r.get("avg_delay_days", 0.0) or 0.0)
-        # Permite opcionalmente passar 'date' no agregado de delays; caso contrário, usa hoje
-        day_value = r.get("date")
-        if isinstance(day_value, str):
-            day_value = date.fromisoformat(day_value)
-        if day_value is None:
-            day_value = date.today()
-
-        if supplier_name is None:
-            continue
-
-        supplier_id = _ensure_supplier(db, supplier_name)
-
-        stmt = (
-            insert(OrdersDelayedDaily)
-            .values(
-                day=day_value,
-                supplier_id=supplier_id,
-                delayed_orders=delayed_orders,
-                avg_delay_days=avg_delay_days,
-            )
-            .on_conflict_do_update(
-                constraint="uq_odd_day_supplier",
-                set_={
-                    "delayed_orders": delayed_orders,
-                    "avg_delay_days": avg_delay_days,
-                },
-            )
-        )
-        db.execute(stmt)
+def save_orders_delayed(db: Session, rows: Iterable[dict]) -> int:
+    rows = [r for r in rows if r.get("supplier") is not None]
+    supplier_ids = _ensure_suppliers(db, (r["supplier"] for r in rows))
+    today = date.today()
+    return _bulk_upsert(
+        db,
+        OrdersDelayedDaily,
+        [
+            {
+                "day": _as_date(r.get("date"), today),
+                "supplier_id": supplier_ids[r["supplier"]],
+                "delayed_orders": int(r.get("delayed_orders", 0) or 0),
+                "avg_delay_days": float(r.get("avg_delay_days", 0.0) or 0.0),
+            }
+            for r in rows
+        ],
+        constraint="uq_odd_day_supplier",
+        key_cols=("day", "supplier_id"),
+    )
 
 
 # -------------------------------------------
@@ -145,39 +151,84 @@ def save_orders_delayed(db: Session, rows: Iterable[dict]) -> None:
 # Espera rows com: sku, low_stock_alerts, min_threshold
 # Usa snapshot do dia atual (ou ajuste se fornecer "date")
 # -------------------------------------------
-def save_inventory_alerts(db: Session, rows: Iterable[dict]) -> None:
-    for r in rows:
-        sku_code = r.get("sku")
-        low_stock_alerts = int(r.get("low_stock_alerts", 0) or 0)
-        min_threshold = int(r.get("min_threshold", 0) or 0)
-        day_value = r.get("date")
-        if isinstance(day_value, str):
-            day_value = date.fromisoformat(day_value)
-        if day_value is None:
-            day_value = date.today()
-
-        if sku_code is None:
-            continue
-
-        sku_id = _ensure_sku(db, sku_code)
-
-        stmt = (
-            insert(InventoryAlertsDaily)
-            .values(
-                day=day_value,
-                sku_id=sku_id,
-                low_stock_alerts=low_stock_alerts,
-                min_threshold=min_threshold,
-            )
-            .on_conflict_do_update(
-                constraint="uq_iad_day_sku",
-                set_={
-                    "low_stock_alerts": low_stock_alerts,
-                    "min_threshold": min_threshold,
-                },
-            )
-        )
-        db.execute(stmt)
+def save_inventory_alerts(db: Session, rows: Iterable[dict]) -> int:
+    rows = [r for r in rows if r.get("sku") is not None]
+    sku_ids = _ensure_skus(db, (r["sku"] for r in rows))
+    today = date.today()
+    return _bulk_upsert(
+        db,
+        InventoryAlertsDaily,
+        [
+            {
+                "day": _as_date(r.get("date"), today),
+                "sku_id": sku_ids[r["sku"]],
+                "low_stock_alerts": int(r.get("low_stock_alerts", 0) or 0),
+                "min_threshold": int(r.get("min_threshold", 0) or 0),
+            }
+            for r in rows
+        ],
+        constraint="uq_iad_day_sku",
+        key_cols=("day", "sku_id"),
+    )
+
+
+# -------------------------------------------
+# GET: statements compartilhados (sync/async)
+# -------------------------------------------
+def _daily_stmt(
+    model: Any,
+    key_col: Any = None,
+    key_id: int | None = None,
+    start: date | None = None,
+    end: date | None = None,
+) -> Select:
+    """SELECT de uma tabela diária filtrada por dimensão e intervalo."""
+    stmt = select(model)
+    if key_id is not None:
+        stmt = stmt.where(key_col == key_id)
+    if start:
+        stmt = stmt.where(model.day >= start)
+    if end:
+        stmt = stmt.where(model.day <= end)
+    return stmt.order_by(model.day.desc())
+
+
+def orders_created_stmt(
+    supplier_id: int | None = None,
+    start: date | None = None,
+    end: date | None = None,
+) -> Select:
+    return _daily_stmt(
+        OrdersCreatedDaily,
+        OrdersCreatedDaily.supplier_id,
+        supplier_id,
+        start,
+        end,
+    )
+
+
+def orders_delayed_stmt(
+    supplier_id: int | None = None,
+    start: date | None = None,
+    end: date | None = None,
+) -> Select:
+    return _daily_stmt(
+        OrdersDelayedDaily,
+        OrdersDelayedDaily.supplier_id,
+        supplier_id,
+        start,
+        end,
+    )
+
+
+def inventory_alerts_stmt(
+    sku_id: int | None = None,
+    start: date | None = None,
+    end: date | None = None,
+) -> Select:
+    return _daily_stmt(
+        InventoryAlertsDaily, InventoryAlertsDaily.sku_id, sku_id, start, end
+    )
 
 
 # -------------------------------------------
@@ -189,15 +240,37 @@ def get_orders_created(
     start: date | None = None,
     end: date | None = None,
 ) -> Sequence[OrdersCreatedDaily] | Any:
-    stmt = select(OrdersCreatedDaily).join(Supplier)
-    if supplier:
-        stmt = stmt.where(Supplier.name == supplier)
-    if start:
-        stmt = stmt.where(OrdersCreatedDaily.day >= start)
-    if end:
-        stmt = stmt.where(OrdersCreatedDaily.day <= end)
-    stmt = stmt.order_by(OrdersCreatedDaily.day.desc())
-    return db.scalars(stmt).all()
+    supplier_id = SUPPLIERS.id_of(db, supplier) if supplier else None
+    if supplier and supplier_id is None:
+        return []
+    return db.scalars(orders_created_stmt(supplier_id, start, end)).all()
+
+
+async def orders_created_query_async(
+    db: AsyncSession,
+    supplier: str | None = None,
+    start: date | None = None,
+    end: date | None = None,
+) -> Select | None:
+    """Statement filtrado; None se o supplier não existe (resultado vazio)."""
+    supplier_id = (
+        await SUPPLIERS.id_of_async(db, supplier) if supplier else None
+    )
+    if supplier and supplier_id is None:
+        return None
+    return orders_created_stmt(supplier_id, start, end)
+
+
+async def get_orders_created_async(
+    db: AsyncSession,
+    supplier: str | None = None,
+    start: date | None = None,
+    end: date | None = None,
+) -> Sequence[OrdersCreatedDaily] | Any:
+    stmt = await orders_created_query_async(db, supplier, start, end)
+    if stmt is None:
+        return []
+    return (await db.scalars(stmt)).all()
 
 
 # -------------------------------------------
@@ -209,15 +282,37 @@ def get_orders_delayed(
     start: date | None = None,
     end: date | None = None,
 ) -> Sequence[OrdersDelayedDaily] | Any:
-    stmt = select(OrdersDelayedDaily).join(Supplier)
-    if supplier:
-        stmt = stmt.where(Supplier.name == supplier)
-    if start:
-        stmt = stmt.where(OrdersDelayedDaily.day >= start)
-    if end:
-        stmt = stmt.where(OrdersDelayedDaily.day <= end)
-    stmt = stmt.order_by(OrdersDelayedDaily.day.desc())
-    return db.scalars(stmt).all()
+    supplier_id = SUPPLIERS.id_of(db, supplier) if supplier else None
+    if supplier and supplier_id is None:
+        return []
+    return db.scalars(orders_delayed_stmt(supplier_id, start, end)).all()
+
+
+async def orders_delayed_query_async(
+    db: AsyncSession,
+    supplier: str | None = None,
+    start: date | None = None,
+    end: date | None = None,
+) -> Select | None:
+    """Statement filtrado; None se o supplier não existe (resultado vazio)."""
+    supplier_id = (
+        await SUPPLIERS.id_of_async(db, supplier) if supplier else None
+    )
+    if supplier and supplier_id is None:
+        return None
+    return orders_delayed_stmt(supplier_id, start, end)
+
+
+async def get_orders_delayed_async(
+    db: AsyncSession,
+    supplier: str | None = None,
+    start: date | None = None,
+    end: date | None = None,
+) -> Sequence[OrdersDelayedDaily] | Any:
+    stmt = await orders_delayed_query_async(db, supplier, start, end)
+    if stmt is None:
+        return []
+    return (await db.scalars(stmt)).all()
 
 
 # -------------------------------------------
@@ -229,12 +324,32 @@ def get_inventory_alerts(
     start: date | None = None,
     end: date | None = None,
 ) -> Sequence[InventoryAlertsDaily] | Any:
-    stmt = select(InventoryAlertsDaily).join(Sku)
-    if sku:
-        stmt = stmt.where(Sku.sku_code == sku)
-    if start:
-        stmt = stmt.where(InventoryAlertsDaily.day >= start)
-    if end:
-        stmt = stmt.where(InventoryAlertsDaily.day <= end)
-    stmt = stmt.order_by(InventoryAlertsDaily.day.desc())
-    return db.scalars(stmt).all()
+    sku_id = SKUS.id_of(db, sku) if sku else None
+    if sku and sku_id is None:
+        return []
+    return db.scalars(inventory_alerts_stmt(sku_id, start, end)).all()
+
+
+async def inventory_alerts_query_async(
+    db: AsyncSession,
+    sku: str | None = None,
+    start: date | None = None,
+    end: date | None = None,
+) -> Select | None:
+    """Statement filtrado; None se o sku não existe (resultado vazio)."""
+    sku_id = await SKUS.id_of_async(db, sku) if sku else None
+    if sku and sku_id is None:
+        return None
+    return inventory_alerts_stmt(sku_id, start, end)
+
+
+async def get_inventory_alerts_async(
+    db: AsyncSession,
+    sku: str | None = None,
+    start: date | None = None,
+    end: date | None = None,
+) -> Sequence[InventoryAlertsDaily] | Any:
+    stmt = await inventory_alerts_query_async(db, sku, start, end)
+    if stmt is None:
+        return []
+    return (await db.scalars(stmt)).all()
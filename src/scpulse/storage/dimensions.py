@@ -0,0 +1,162 @@
+"""Cache em processo das chaves das dimensões (fornecedor/SKU → id).
+
+Os catálogos `suppliers` e `skus` são pequenos e quase nunca mudam, mas
+toda carga Gold e todo filtro da API precisam traduzir nome → id. Cada
+dimensão tem um `LRUCache` compartilhado pelo ETL e pela API:
+
+- `warm` carrega o catálogo inteiro (até `maxsize`) em uma consulta, no
+  início da carga Gold;
+- `resolve` consulta o banco só para as chaves ausentes e cria as que não
+  existem;
+- chaves criadas em uma transação só entram no cache após o commit (um
+  rollback não deixa ids inexistentes no cache).
+"""
+
+from __future__ import annotations
+
+import os
+from itertools import batched
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..core.cache import LRUCache
+from .models.entities import Sku, Supplier
+
+DIM_CACHE_MAX_SUPPLIERS = int(os.getenv("DIM_CACHE_MAX_SUPPLIERS", "10000"))
+DIM_CACHE_MAX_SKUS = int(os.getenv("DIM_CACHE_MAX_SKUS", "100000"))
+DIM_CACHE_TTL_S = float(os.getenv("DIM_CACHE_TTL_S", "0")) or None
+# Máximo de valores por IN (...) / INSERT multi-row
+DIM_CHUNK_ROWS = int(os.getenv("DIM_CHUNK_ROWS", "5000"))
+
+_PENDING_KEY = "pending_dimension_keys"
+
+
+class DimensionCache:
+    """Mapa `valor natural → id` de uma dimensão, com fallback no banco."""
+
+    def __init__(
+        self,
+        model: Any,
+        column: Any,
+        maxsize: int,
+        ttl_seconds: Optional[float] = DIM_CACHE_TTL_S,
+    ) -> None:
+        self.model = model
+        self.column = column
+        self.cache: LRUCache[str, int] = LRUCache(maxsize, ttl_seconds)
+        self.warmed = False
+
+    def warm(self, db: Session, force: bool = False) -> int:
+        """Carrega o catálogo em uma consulta (uma vez por processo).
+
+        Returns:
+            int: Entradas no cache.
+        """
+        if self.warmed and not force:
+            return len(self.cache)
+        stmt = select(self.column, self.model.id).limit(self.cache.maxsize)
+        self.cache.set_many(db.execute(stmt).tuples())
+        self.warmed = True
+        return len(self.cache)
+
+    def id_of(self, db: Session, value: str) -> Optional[int]:
+        """Id de um valor existente, ou None (nunca cria; uso da API)."""
+        found = self.cache.get(value)
+        if found is not None:
+            return found
+        found = db.execute(
+            select(self.model.id).where(self.column == value)
+        ).scalar_one_or_none()
+        if found is not None:
+            self.cache.set(value, int(found))
+        return int(found) if found is not None else None
+
+    async def id_of_async(self, db: AsyncSession, value: str) -> Optional[int]:
+        """Variante assíncrona de `id_of` (sessões da API)."""
+        found = self.cache.get(value)
+        if found is not None:
+            return found
+        result = await db.execute(
+            select(self.model.id).where(self.column == value)
+        )
+        found = result.scalar_one_or_none()
+        if found is not None:
+            self.cache.set(value, int(found))
+        return int(found) if found is not None else None
+
+    def resolve(
+        self, db: Session, values: Iterable[Optional[str]]
+    ) -> dict[str, int]:
+        """Resolve `valor → id` para um lote, criando os que faltam.
+
+        Sem consultas quando todas as chaves estão em cache; caso contrário
+        no máximo um SELECT e um INSERT multi-row por chunk de ausentes. O
+        `ON CONFLICT DO UPDATE` torna o INSERT seguro contra cargas
+        concorrentes e faz o `RETURNING` devolver também as linhas criadas
+        por outra transação.
+        """
+        wanted = sorted({v for v in values if v is not None})
+        keys = self.cache.get_many(wanted)
+        pending: dict[str, int] = db.info.setdefault(
+            _PENDING_KEY, {}
+        ).setdefault(self.column.key, {})
+        keys.update((v, pending[v]) for v in wanted if v in pending)
+
+        missing = [v for v in wanted if v not in keys]
+        found: dict[str, int] = {}
+        for chunk in batched(missing, DIM_CHUNK_ROWS):
+            found.update(
+                db.execute(
+                    select(self.column, self.model.id).where(
+                        self.column.in_(chunk)
+                    )
+                ).tuples()
+            )
+        self.cache.set_many(found.items())
+        keys.update(found)
+
+        missing = [v for v in missing if v not in found]
+        for chunk in batched(missing, DIM_CHUNK_ROWS):
+            rows = insert(self.model).values(
+                [{self.column.key: v} for v in chunk]
+            )
+            stmt = rows.on_conflict_do_update(
+                index_elements=[self.column],
+                set_={self.column.key: rows.excluded[self.column.key]},
+            ).returning(self.column, self.model.id)
+            created: dict[str, int] = dict(db.execute(stmt).tuples())
+            pending.update(created)
+            keys.update(created)
+        return keys
+
+    def clear(self) -> None:
+        self.cache.clear()
+        self.warmed = False
+
+
+SUPPLIERS = DimensionCache(Supplier, Supplier.name, DIM_CACHE_MAX_SUPPLIERS)
+SKUS = DimensionCache(Sku, Sku.sku_code, DIM_CACHE_MAX_SKUS)
+DIMENSIONS = {"suppliers": SUPPLIERS, "skus": SKUS}
+
+
+def warm_dimension_caches(db: Session) -> None:
+    for dimension in DIMENSIONS.values():
+        dimension.warm(db)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending_keys(session: Session) -> None:
+    """Promove para o cache as chaves criadas pela transação confirmada."""
+    pending = session.info.pop(_PENDING_KEY, {})
+    for dimension in DIMENSIONS.values():
+        created = pending.get(dimension.column.key, {})
+        dimension.cache.set_many(created.items())
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_keys(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
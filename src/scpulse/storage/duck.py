@@ -0,0 +1,490 @@
+"""Leitura analítica com DuckDB direto dos Parquets Silver e Gold.
+
+Consultas de intervalo / group-by não precisam passar pelo Postgres: o
+DuckDB lê as colunas necessárias dos part files, em paralelo, sem carregar
+nada antes. Layout lido (o mesmo que `pipeline.run_transform` escreve):
+
+    data/silver/date=<dia>/part-*.parquet        (partição hive)
+    data/gold/events_<dia>/gold_<métrica>.parquet
+
+- `DuckLake` mantém uma conexão persistente por processo e um cursor por
+  thread (os cursores compartilham catálogo, cache de metadados e pool de
+  threads do DuckDB);
+- os filtros de data são resolvidos pela lista de partições antes da
+  consulta (partition pruning): um intervalo de 3 dias abre 3 diretórios,
+  não o histórico;
+- `get_*` espelham `crud.get_*` e devolvem linhas tipadas;
+- `sql` expõe as views `silver_events` e `gold_<métrica>` para consultas
+  ad hoc.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterable, Optional, Sequence
+
+import duckdb
+
+LAKE_SILVER_DIR = Path(os.getenv("LAKE_SILVER_DIR", "data/silver"))
+LAKE_GOLD_DIR = Path(os.getenv("LAKE_GOLD_DIR", "data/gold"))
+DUCKDB_PATH = os.getenv("DUCKDB_PATH", ":memory:")
+DUCKDB_THREADS = int(os.getenv("DUCKDB_THREADS", "0"))  # 0 = nº de CPUs
+DUCKDB_MEMORY_LIMIT = os.getenv("DUCKDB_MEMORY_LIMIT", "")
+
+GOLD_METRIC_NAMES = ("orders_created", "orders_delayed", "inventory_alerts")
+_SILVER_PARTITION = re.compile(r"^date=(\d{4}-\d{2}-\d{2})$")
+_GOLD_PARTITION = re.compile(r"^events_(\d{4}-\d{2}-\d{2})$")
+# dia da partição Gold, extraído do caminho do arquivo
+_GOLD_DAY = (
+    r"CAST(regexp_extract(filename, 'events_(\d{4}-\d{2}-\d{2})', 1) "
+    "AS DATE)"
+)
+
+
+# -----------------------------
+# Linhas tipadas
+# -----------------------------
+@dataclass(frozen=True)
+class OrdersCreatedRow:
+    day: date
+    supplier: str
+    total_orders: int
+    total_qty: int
+
+
+@dataclass(frozen=True)
+class OrdersDelayedRow:
+    day: date
+    supplier: str
+    delayed_orders: int
+    avg_delay_days: float
+
+
+@dataclass(frozen=True)
+class InventoryAlertRow:
+    day: date
+    sku: str
+    low_stock_alerts: int
+    min_threshold: int
+
+
+def _partitions(
+    root: Path,
+    pattern: re.Pattern[str],
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> list[tuple[date, Path]]:
+    """Partições `(dia, diretório)` de `root` dentro de [start, end]."""
+    if not root.is_dir():
+        return []
+    found = []
+    for child in root.iterdir():
+        match = pattern.match(child.name)
+        if not match or not child.is_dir():
+            continue
+        day = date.fromisoformat(match.group(1))
+        if (start and day < start) or (end and day > end):
+            continue
+        found.append((day, child))
+    return sorted(found)
+
+
+class DuckLake:
+    """Conexão DuckDB sobre o lake Silver/Gold.
+
+    Args:
+        silver_dir (Path): Raiz da Silver (`date=<dia>/`).
+        gold_dir (Path): Raiz da Gold (`events_<dia>/`).
+        database (str): Arquivo do DuckDB (":memory:" = só em memória).
+        threads (int): Threads do DuckDB (0 = padrão, nº de CPUs).
+        memory_limit (str): Ex.: "2GB" (vazio = padrão do DuckDB).
+    """
+
+    def __init__(
+        self,
+        silver_dir: Path = LAKE_SILVER_DIR,
+        gold_dir: Path = LAKE_GOLD_DIR,
+        database: str = DUCKDB_PATH,
+        threads: int = DUCKDB_THREADS,
+        memory_limit: str = DUCKDB_MEMORY_LIMIT,
+    ) -> None:
+        self.silver_dir = silver_dir
+        self.gold_dir = gold_dir
+        config: dict[str, Any] = {}
+        if threads:
+            config["threads"] = threads
+        if memory_limit:
+            config["memory_limit"] = memory_limit
+        self._conn = duckdb.connect(database, config=config)
+        # 🔹 GLOBAL: vale também para os cursores (conexões derivadas).
+        # Metadados Parquet em cache entre consultas; dias em UTC como no ETL
+        self._conn.execute("SET GLOBAL parquet_metadata_cache = true")
+        self._conn.execute("SET GLOBAL TimeZone = 'UTC'")
+        self._local = threading.local()
+        self._cursors: list[duckdb.DuckDBPyConnection] = []
+        self._lock = threading.Lock()
+        self._views: set[str] = set()
+
+    def cursor(self) -> duckdb.DuckDBPyConnection:
+        """Cursor da thread atual (criado na primeira chamada)."""
+        cursor = getattr(self._local, "cursor", None)
+        if cursor is None:
+            with self._lock:
+                cursor = self._conn.cursor()
+                self._cursors.append(cursor)
+            self._local.cursor = cursor
+        return cursor
+
+    def close(self) -> None:
+        with self._lock:
+            for cursor in self._cursors:
+                cursor.close()
+            self._cursors.clear()
+            self._conn.close()
+
+    # -----------------------------
+    # Partições
+    # -----------------------------
+    def silver_files(
+        self, start: Optional[date] = None, end: Optional[date] = None
+    ) -> list[str]:
+        return [
+            str(part)
+            for _, directory in _partitions(
+                self.silver_dir, _SILVER_PARTITION, start, end
+            )
+            for part in sorted(directory.glob("*.parquet"))
+        ]
+
+    def gold_files(
+        self,
+        metric: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> list[str]:
+        if metric not in GOLD_METRIC_NAMES:
+            raise ValueError(
+                f"Métrica desconhecida: {metric!r} (use {GOLD_METRIC_NAMES})"
+            )
+        files = []
+        for _, directory in _partitions(
+            self.gold_dir, _GOLD_PARTITION, start, end
+        ):
+            path = directory / f"gold_{metric}.parquet"
+            if path.exists():
+                files.append(str(path))
+        return files
+
+    # -----------------------------
+    # Execução
+    # -----------------------------
+    def query(
+        self, sql: str, params: Optional[dict[str, Any]] = None
+    ) -> list[tuple]:
+        return self.cursor().execute(sql, params or {}).fetchall()
+
+    def query_dicts(
+        self, sql: str, params: Optional[dict[str, Any]] = None
+    ) -> list[dict[str, Any]]:
+        cursor = self.cursor().execute(sql, params or {})
+        names = [d[0] for d in cursor.description]
+        return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+    def register_views(self) -> set[str]:
+        """(Re)cria as views do lake para as bases que já têm arquivos.
+
+        As views guardam o glob, não a lista de arquivos: partições novas
+        aparecem sem recriá-las. `silver_events` usa particionamento hive,
+        então `WHERE date = ...` também poda arquivos no DuckDB.
+        """
+        with self._lock:
+            if "silver_events" not in self._views and self.silver_files():
+                glob = str(self.silver_dir / "date=*" / "*.parquet")
+                self._conn.execute(
+                    "CREATE OR REPLACE VIEW silver_events AS "
+                    f"SELECT * FROM read_parquet('{glob}', "
+                    "hive_partitioning = true, union_by_name = true)"
+                )
+                self._views.add("silver_events")
+            for metric in GOLD_METRIC_NAMES:
+                view = f"gold_{metric}"
+                if view in self._views or not self.gold_files(metric):
+                    continue
+                glob = str(self.gold_dir / "events_*" / f"{view}.parquet")
+                self._conn.execute(
+                    f"CREATE OR REPLACE VIEW {view} AS "
+                    f"SELECT *, {_GOLD_DAY} AS day FROM read_parquet("
+                    f"'{glob}', filename = true, union_by_name = true)"
+                )
+                self._views.add(view)
+            return set(self._views)
+
+    def sql(
+        self, sql: str, params: Optional[dict[str, Any]] = None
+    ) -> list[dict[str, Any]]:
+        """Consulta ad hoc sobre `silver_events` / `gold_<métrica>`."""
+        self.register_views()
+        return self.query_dicts(sql, params)
+
+
+_GOLD_SOURCE = "read_parquet($files, filename = true, union_by_name = true)"
+
+
+@dataclass(frozen=True)
+class GoldQuery:
+    """Como ler uma métrica Gold do lake.
+
+    Attributes:
+        select (str): SELECT sobre `_GOLD_SOURCE` com as colunas de `row`.
+        key (str): Coluna da dimensão (filtro e desempate do keyset).
+        row (type): Dataclass das linhas.
+    """
+
+    select: str
+    key: str
+    row: type
+
+
+GOLD_QUERIES: dict[str, GoldQuery] = {
+    "orders_created": GoldQuery(
+        "SELECT CAST(date AS DATE) AS day, supplier, "
+        "CAST(total_orders AS BIGINT) AS total_orders, "
+        "CAST(total_qty AS BIGINT) AS total_qty "
+        f"FROM {_GOLD_SOURCE}",
+        "supplier",
+        OrdersCreatedRow,
+    ),
+    "orders_delayed": GoldQuery(
+        f"SELECT {_GOLD_DAY} AS day, supplier, "
+        "CAST(delayed_orders AS BIGINT) AS delayed_orders, "
+        "CAST(avg_delay_days AS DOUBLE) AS avg_delay_days "
+        f"FROM {_GOLD_SOURCE}",
+        "supplier",
+        OrdersDelayedRow,
+    ),
+    "inventory_alerts": GoldQuery(
+        f"SELECT {_GOLD_DAY} AS day, sku, "
+        "CAST(low_stock_alerts AS BIGINT) AS low_stock_alerts, "
+        "CAST(min_threshold AS BIGINT) AS min_threshold "
+        f"FROM {_GOLD_SOURCE}",
+        "sku",
+        InventoryAlertRow,
+    ),
+}
+
+
+def _gold_filter(
+    spec: GoldQuery,
+    key: Optional[str],
+    start: Optional[date],
+    end: Optional[date],
+) -> tuple[str, dict[str, Any]]:
+    clauses = ["true"]
+    params: dict[str, Any] = {}
+    if start:
+        clauses.append("day >= $start")
+        params["start"] = start
+    if end:
+        clauses.append("day <= $end")
+        params["end"] = end
+    if key is not None:
+        clauses.append(f"{spec.key} = $key")
+        params["key"] = key
+    return " AND ".join(clauses), params
+
+
+def query_gold(
+    metric: str,
+    key: Optional[str] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    after: Optional[tuple[date, str]] = None,
+    limit: Optional[int] = None,
+    lake: Optional[DuckLake] = None,
+) -> list[tuple]:
+    """Linhas de uma métrica Gold em `(day DESC, dimensão ASC)`.
+
+    Args:
+        metric (str): Chave de `GOLD_QUERIES`.
+        key (Optional[str]): Fornecedor / SKU.
+        start, end (Optional[date]): Intervalo (poda as partições lidas).
+        after (Optional[tuple[date, str]]): Última `(day, dimensão)` da
+            página anterior (keyset).
+        limit (Optional[int]): Máximo de linhas.
+    """
+    lake = lake or get_lake()
+    spec = GOLD_QUERIES[metric]
+    files = lake.gold_files(metric, start, end)
+    if not files:
+        return []
+    where, params = _gold_filter(spec, key, start, end)
+    params["files"] = files
+    if after is not None:
+        where += (
+            f" AND (day < $after_day OR "
+            f"(day = $after_day AND {spec.key} > $after_key))"
+        )
+        params["after_day"], params["after_key"] = after
+    sql = (
+        f"SELECT * FROM ({spec.select}) WHERE {where} "
+        f"ORDER BY day DESC, {spec.key}"
+    )
+    if limit is not None:
+        sql += f" LIMIT {int(limit)}"
+    return lake.query(sql, params)
+
+
+def count_gold(
+    metric: str,
+    key: Optional[str] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    lake: Optional[DuckLake] = None,
+) -> int:
+    lake = lake or get_lake()
+    spec = GOLD_QUERIES[metric]
+    files = lake.gold_files(metric, start, end)
+    if not files:
+        return 0
+    where, params = _gold_filter(spec, key, start, end)
+    params["files"] = files
+    return int(
+        lake.query(
+            f"SELECT COUNT(*) FROM ({spec.select}) WHERE {where}", params
+        )[0][0]
+    )
+
+
+def list_dimension(column: str, lake: Optional[DuckLake] = None) -> list[str]:
+    """Valores distintos de `supplier` ou `sku` nas métricas Gold."""
+    lake = lake or get_lake()
+    sources: list[str] = []
+    params: dict[str, Any] = {}
+    for name, spec in GOLD_QUERIES.items():
+        files = lake.gold_files(name) if spec.key == column else []
+        if files:
+            params[f"files_{len(sources)}"] = files
+            sources.append(
+                f"SELECT {column} AS value FROM read_parquet("
+                f"$files_{len(sources)}, union_by_name = true)"
+            )
+    if not sources:
+        return []
+    rows = lake.query(
+        f"SELECT DISTINCT value FROM ({' UNION ALL '.join(sources)}) "
+        "WHERE value IS NOT NULL ORDER BY value",
+        params,
+    )
+    return [value for (value,) in rows]
+
+
+_lake: Optional[DuckLake] = None
+_lake_lock = threading.Lock()
+
+
+def get_lake() -> DuckLake:
+    """`DuckLake` do processo (criado na primeira chamada)."""
+    global _lake
+    with _lake_lock:
+        if _lake is None:
+            _lake = DuckLake()
+        return _lake
+
+
+# -----------------------------
+# Espelhos de crud.get_*
+# -----------------------------
+def get_orders_created(
+    supplier: Optional[str] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    lake: Optional[DuckLake] = None,
+) -> list[OrdersCreatedRow]:
+    rows = query_gold("orders_created", supplier, start, end, lake=lake)
+    return [OrdersCreatedRow(*row) for row in rows]
+
+
+def get_orders_delayed(
+    supplier: Optional[str] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    lake: Optional[DuckLake] = None,
+) -> list[OrdersDelayedRow]:
+    rows = query_gold("orders_delayed", supplier, start, end, lake=lake)
+    return [OrdersDelayedRow(*row) for row in rows]
+
+
+def get_inventory_alerts(
+    sku: Optional[str] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    lake: Optional[DuckLake] = None,
+) -> list[InventoryAlertRow]:
+    rows = query_gold("inventory_alerts", sku, start, end, lake=lake)
+    return [InventoryAlertRow(*row) for row in rows]
+
+
+# -----------------------------
+# Agregações direto da Silver
+# -----------------------------
+_SILVER_GROUPS = {
+    "day": 'CAST("timestamp" AS DATE)',
+    "week": "CAST(date_trunc('week', \"timestamp\") AS DATE)",
+    "month": "CAST(date_trunc('month', \"timestamp\") AS DATE)",
+    "event_type": "event_type",
+    "supplier": "supplier",
+    "sku": "sku",
+}
+
+
+def silver_summary(
+    by: Sequence[str] = ("event_type",),
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    event_types: Optional[Iterable[str]] = None,
+    lake: Optional[DuckLake] = None,
+) -> list[dict[str, Any]]:
+    """Contagem de eventos e soma de `qty` na Silver, agrupadas por `by`.
+
+    Args:
+        by (Sequence[str]): Chaves de `_SILVER_GROUPS` (day, week, month,
+            event_type, supplier, sku).
+        start, end (Optional[date]): Partições `date=` lidas.
+        event_types (Optional[Iterable[str]]): Filtra tipos de evento.
+    """
+    unknown = [b for b in by if b not in _SILVER_GROUPS]
+    if unknown or not by:
+        raise ValueError(
+            f"Agrupamento inválido: {unknown} (use {list(_SILVER_GROUPS)})"
+        )
+    lake = lake or get_lake()
+    files = lake.silver_files(start, end)
+    if not files:
+        return []
+    cursor = lake.cursor().execute(
+        "SELECT * FROM read_parquet($files, union_by_name = true) LIMIT 0",
+        {"files": files},
+    )
+    columns = {d[0] for d in cursor.description}
+    missing = {b for b in by if b in ("supplier", "sku")} - columns
+    if missing:
+        raise ValueError(f"Colunas ausentes na Silver: {sorted(missing)}")
+
+    keys = ", ".join(f"{_SILVER_GROUPS[b]} AS {b}" for b in by)
+    qty = "COALESCE(SUM(qty), 0)" if "qty" in columns else "0"
+    params: dict[str, Any] = {"files": files}
+    where = "true"
+    if event_types is not None:
+        where = "event_type IN (SELECT unnest($event_types))"
+        params["event_types"] = list(event_types)
+    return lake.query_dicts(
+        f"SELECT {keys}, COUNT(*) AS events, {qty} AS total_qty "
+        "FROM read_parquet($files, union_by_name = true) "
+        f"WHERE {where} GROUP BY ALL ORDER BY ALL",
+        params,
+    )
@@ -0,0 +1,164 @@
+"""Marcador de "geração" da camada Gold.
+
+Os dados Gold só mudam quando `silver_to_gold` confirma uma carga. O ETL
+incrementa um contador; quem serve ou cacheia dados Gold compara a geração
+atual com a que viu da última vez em vez de reler os dados.
+
+- `gold_generation` (Postgres) é a fonte da verdade: incrementada por
+  `bump_db_generation` na mesma transação da carga Gold, vale para todas
+  as réplicas da API e para um ETL rodando em outro host;
+- `_generation.json` ao lado dos Parquets é um espelho local, gravado
+  depois do commit, para quem lê o lake do mesmo filesystem (dashboard).
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime, UTC
+from pathlib import Path
+from typing import Callable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+GOLD_GENERATION_PATH = Path(
+    os.getenv("GOLD_GENERATION_PATH", "data/gold/_generation.json")
+)
+GOLD_GENERATION_POLL_S = float(os.getenv("GOLD_GENERATION_POLL_S", "1"))
+
+
+def read_generation(path: Path = GOLD_GENERATION_PATH) -> int:
+    """Geração atual (0 se o ETL ainda não gravou nenhuma)."""
+    try:
+        return int(json.loads(path.read_text(encoding="utf-8"))["generation"])
+    except (FileNotFoundError, ValueError, KeyError):
+        return 0
+
+
+def bump_generation(path: Path = GOLD_GENERATION_PATH) -> int:
+    """Incrementa a geração do marcador local."""
+    return write_generation(read_generation(path) + 1, path)
+
+
+def write_generation(
+    generation: int, path: Path = GOLD_GENERATION_PATH
+) -> int:
+    """Grava `generation` no marcador local (chamar após o commit).
+
+    A escrita é atômica (`os.replace`); leitores nunca veem um JSON
+    parcial. Há um único escritor (o ETL).
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(
+        json.dumps(
+            {
+                "generation": generation,
+                "updated_at": datetime.now(UTC).isoformat(),
+            }
+        ),
+        encoding="utf-8",
+    )
+    os.replace(tmp_path, path)
+    return generation
+
+
+class GenerationWatcher:
+    """Lê a geração com no máximo um `stat` a cada `poll_interval_s`."""
+
+    def __init__(
+        self,
+        path: Path = GOLD_GENERATION_PATH,
+        poll_interval_s: float = GOLD_GENERATION_POLL_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.path = path
+        self.poll_interval_s = poll_interval_s
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._checked_at = float("-inf")
+        self._mtime_ns = -1
+        self._generation = 0
+
+    def current(self) -> int:
+        with self._lock:
+            now = self._clock()
+            if now - self._checked_at < self.poll_interval_s:
+                return self._generation
+            self._checked_at = now
+            try:
+                mtime_ns = self.path.stat().st_mtime_ns
+            except FileNotFoundError:
+                mtime_ns = 0
+            if mtime_ns != self._mtime_ns:
+                self._mtime_ns = mtime_ns
+                self._generation = read_generation(self.path)
+            return self._generation
+
+
+# -----------------------------
+# Geração no Postgres
+# -----------------------------
+_BUMP_SQL = text(
+    "INSERT INTO gold_generation (id, generation) VALUES (1, 1) "
+    "ON CONFLICT (id) DO UPDATE "
+    "SET generation = gold_generation.generation + 1, updated_at = now() "
+    "RETURNING generation"
+)
+_READ_SQL = text("SELECT generation FROM gold_generation WHERE id = 1")
+
+
+def bump_db_generation(db: Session) -> int:
+    """Incrementa a geração na transação de `db` (sem commit).
+
+    Chamar antes do `commit` da carga Gold: a nova geração fica visível
+    exatamente junto com os dados, e some com eles em caso de rollback.
+    """
+    return int(db.execute(_BUMP_SQL).scalar_one())
+
+
+async def read_db_generation_async(db: AsyncSession) -> int:
+    """Geração atual no Postgres (0 se o ETL ainda não gravou nenhuma)."""
+    found = (await db.execute(_READ_SQL)).scalar_one_or_none()
+    return int(found) if found is not None else 0
+
+
+class DbGenerationWatcher:
+    """Lê a geração do Postgres com no máximo uma consulta por intervalo.
+
+    Requisições concorrentes durante uma consulta usam o último valor
+    visto. Falhas do banco mantêm o último valor (o cache nunca derruba a
+    API). A sessão só é criada no primeiro uso: importar este módulo não
+    exige `DATABASE_URL`.
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+        poll_interval_s: float = GOLD_GENERATION_POLL_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.session_factory = session_factory
+        self.poll_interval_s = poll_interval_s
+        self._clock = clock
+        self._checked_at = float("-inf")
+        self._generation = 0
+
+    async def current(self) -> int:
+        now = self._clock()
+        if now - self._checked_at < self.poll_interval_s:
+            return self._generation
+        self._checked_at = now
+        if self.session_factory is None:
+            from .postgres import AsyncSessionLocal
+
+            self.session_factory = AsyncSessionLocal
+        try:
+            async with self.session_factory() as db:
+                self._generation = await read_db_generation_async(db)
+        except (SQLAlchemyError, OSError) as e:
+            print(f"[GENERATION WARN] Falha ao ler gold_generation: {e}")
+        return self._generation
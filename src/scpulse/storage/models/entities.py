@@ -11,7 +11,7 @@ from sqlalchemy import (
     Index,
     Numeric,
 )
-from src.scpulse.storage.postgres import Base
+from ..postgres import Base
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 
@@ -69,8 +69,9 @@ class OrdersCreatedDaily(Base):
 
     __table_args__ = (
         UniqueConstraint("day", "supplier_id", name="uq_ocd_day_supplier"),
-        Index("idx_ocd_day", day.desc()),
-        Index("idx_ocd_supplier", supplier_id),
+        # Paginação keyset em (day DESC, id DESC), com e sem filtro
+        Index("idx_ocd_day_id", day.desc(), id.desc()),
+        Index("idx_ocd_supplier_day_id", supplier_id, day.desc(), id.desc()),
     )
 
 
@@ -100,8 +101,9 @@ class OrdersDelayedDaily(Base):
 
     __table_args__ = (
         UniqueConstraint("day", "supplier_id", name="uq_odd_day_supplier"),
-        Index("idx_odd_day", day.desc()),
-        Index("idx_odd_supplier", supplier_id),
+        # Paginação keyset em (day DESC, id DESC), com e sem filtro
+        Index("idx_odd_day_id", day.desc(), id.desc()),
+        Index("idx_odd_supplier_day_id", supplier_id, day.desc(), id.desc()),
     )
 
 
@@ -125,6 +127,117 @@ class InventoryAlertsDaily(Base):
 
     __table_args__ = (
         UniqueConstraint("day", "sku_id", name="uq_iad_day_sku"),
-        Index("idx_iad_day", day.desc()),
-        Index("idx_iad_sku", sku_id),
+        # Paginação keyset em (day DESC, id DESC), com e sem filtro
+        Index("idx_iad_day_id", day.desc(), id.desc()),
+        Index("idx_iad_sku_day_id", sku_id, day.desc(), id.desc()),
+    )
+
+
+# =======================================================
+# Rollups (semana / mês / total), mantidos pelo ETL
+# =======================================================
+# `grain` ∈ {"week", "month", "total"}; `period_start` é o início do
+# período (segunda-feira, dia 1 ou 1970-01-01 para "total"). As medidas
+# são somas/mínimos, então semana e mês saem das linhas diárias e "total"
+# sai dos meses sem reler o histórico.
+class OrdersCreatedRollup(Base):
+    __tablename__ = "orders_created_rollup"
+
+    id: Mapped[int] = mapped_column(
+        BigInteger, primary_key=True, autoincrement=True
+    )
+    grain: Mapped[str] = mapped_column(Text, nullable=False)
+    period_start: Mapped[object] = mapped_column(Date, nullable=False)
+    supplier_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("suppliers.id", ondelete="RESTRICT"),
+        nullable=False,
+    )
+    total_orders: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    total_qty: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    days: Mapped[int] = mapped_column(Integer, nullable=False)
+    updated_at: Mapped[object] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=False, server_default="now()"
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "grain", "period_start", "supplier_id", name="uq_ocr_period"
+        ),
+        Index("idx_ocr_supplier", grain, supplier_id, period_start.desc()),
+    )
+
+
+class OrdersDelayedRollup(Base):
+    __tablename__ = "orders_delayed_rollup"
+
+    id: Mapped[int] = mapped_column(
+        BigInteger, primary_key=True, autoincrement=True
+    )
+    grain: Mapped[str] = mapped_column(Text, nullable=False)
+    period_start: Mapped[object] = mapped_column(Date, nullable=False)
+    supplier_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("suppliers.id", ondelete="RESTRICT"),
+        nullable=False,
+    )
+    delayed_orders: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    # soma de avg_delay_days * delayed_orders → média ponderada no período
+    delay_days_sum: Mapped[object] = mapped_column(
+        Numeric(18, 4), nullable=False
+    )
+    days: Mapped[int] = mapped_column(Integer, nullable=False)
+    updated_at: Mapped[object] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=False, server_default="now()"
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "grain", "period_start", "supplier_id", name="uq_odr_period"
+        ),
+        Index("idx_odr_supplier", grain, supplier_id, period_start.desc()),
+    )
+
+
+class InventoryAlertsRollup(Base):
+    __tablename__ = "inventory_alerts_rollup"
+
+    id: Mapped[int] = mapped_column(
+        BigInteger, primary_key=True, autoincrement=True
+    )
+    grain: Mapped[str] = mapped_column(Text, nullable=False)
+    period_start: Mapped[object] = mapped_column(Date, nullable=False)
+    sku_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("skus.id", ondelete="RESTRICT"), nullable=False
+    )
+    low_stock_alerts: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    min_threshold: Mapped[int] = mapped_column(Integer, nullable=False)
+    days: Mapped[int] = mapped_column(Integer, nullable=False)
+    updated_at: Mapped[object] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=False, server_default="now()"
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "grain", "period_start", "sku_id", name="uq_iar_period"
+        ),
+        Index("idx_iar_sku", grain, sku_id, period_start.desc()),
+    )
+
+
+class GoldGeneration(Base):
+    """Contador de cargas Gold (linha única, id = 1).
+
+    Incrementado pelo ETL na transação de cada carga; a API usa o valor
+    como chave do cache de respostas e ETag (`storage.generation`).
+    """
+
+    __tablename__ = "gold_generation"
+
+    id: Mapped[int] = mapped_column(
+        Integer, primary_key=True, autoincrement=False
+    )
+    generation: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    updated_at: Mapped[object] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=False, server_default="now()"
     )
@@ -1,4 +1,4 @@
-from sqlalchemy import BigInteger, Text, Boolean
+from sqlalchemy import BigInteger, Integer, Text, Boolean
 from sqlalchemy.orm import Mapped, mapped_column
 from ..postgres import Base
 
@@ -15,3 +15,7 @@ class User(Base):
     is_active: Mapped[bool] = mapped_column(
         Boolean, default=True, nullable=False
     )
+    # Incrementado para revogar todos os tokens já emitidos do usuário
+    token_version: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
@@ -1,8 +1,13 @@
 """Configuração de conexão com PostgreSQL."""
 
-from collections.abc import Generator
-
-from sqlalchemy import create_engine, text
+from collections.abc import AsyncGenerator, Generator
+
+from sqlalchemy import URL, create_engine, make_url, text
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import sessionmaker, DeclarativeBase, Session
 import os
 from dotenv import load_dotenv
@@ -10,16 +15,53 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
-DATABASE_URL = os.getenv("DATABASE_URL")
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() in ("1", "true", "yes", "on")
+
+
+# Vazio = não configurado: o create_engine falha já no import
+DATABASE_URL = os.getenv("DATABASE_URL", "")
+# Driver asyncpg para a API; por padrão o mesmo banco do DATABASE_URL
+ASYNC_DATABASE_URL: str | URL = os.getenv("ASYNC_DATABASE_URL") or (
+    make_url(DATABASE_URL).set(drivername="postgresql+asyncpg")
+    if DATABASE_URL
+    else ""
+)
+
+SQL_ECHO = _env_flag("SQL_ECHO", "false")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = _env_flag("DB_POOL_PRE_PING", "true")
+
+POOL_OPTIONS = {
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_MAX_OVERFLOW,
+    "pool_timeout": DB_POOL_TIMEOUT,
+    "pool_recycle": DB_POOL_RECYCLE,
+    "pool_pre_ping": DB_POOL_PRE_PING,
+}
 
 
 class Base(DeclarativeBase):
     """Classe base para models SQLAlchemy."""
 
 
-engine = create_engine(DATABASE_URL, echo=True, future=True)
+# Engine síncrona: ETL (Gold), scripts e migrações
+engine = create_engine(
+    DATABASE_URL, echo=SQL_ECHO, future=True, **POOL_OPTIONS
+)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 
+# Engine assíncrona (asyncpg): API FastAPI
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL, echo=SQL_ECHO, **POOL_OPTIONS
+)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
 
 def get_session() -> Generator[Session, None, None]:
     """Dependency FastAPI para injetar sessão do banco."""
@@ -30,6 +72,12 @@ def get_session() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency FastAPI para injetar sessão assíncrona do banco."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def reset_database() -> None:
     with engine.begin() as conn:
         conn.execute(text("DROP VIEW IF EXISTS v_inventory_risk CASCADE;"))
@@ -0,0 +1,312 @@
+"""Rollups Gold por semana, mês e total, mantidos incrementalmente.
+
+As tabelas diárias crescem com o histórico; agregados como "pedidos por
+mês" ou "top fornecedores com atraso" não precisam relê-lo. A cada carga o
+ETL chama `refresh_rollups` na mesma transação dos dados diários:
+
+    dias tocados → semanas/meses afetados → recalculados a partir do diário
+    meses afetados → "total" dos fornecedores/SKUs desses meses
+
+O custo de uma atualização é proporcional aos períodos tocados, e a leitura
+(API) é proporcional ao número de grupos, não ao histórico.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Callable, Iterable, Optional
+
+from sqlalchemy import (
+    TIMESTAMP,
+    Date,
+    Select,
+    cast,
+    func,
+    literal,
+    select,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from .models.entities import (
+    InventoryAlertsDaily,
+    InventoryAlertsRollup,
+    OrdersCreatedDaily,
+    OrdersCreatedRollup,
+    OrdersDelayedDaily,
+    OrdersDelayedRollup,
+    Sku,
+    Supplier,
+)
+
+GRAINS = ("week", "month", "total")
+# `period_start` das linhas "total"
+ALL_TIME = date(1970, 1, 1)
+
+
+@dataclass(frozen=True)
+class RollupSpec:
+    """Como uma tabela diária vira rollups.
+
+    Attributes:
+        daily: Tabela diária de origem.
+        rollup: Tabela de rollup (colunas grain/period_start/days).
+        dimension (str): Coluna da dimensão (`supplier_id` / `sku_id`).
+        constraint (str): Unique (grain, period_start, dimensão).
+        measures (dict): medida → (agregação, expressão sobre o diário).
+            A mesma agregação combina rollups (soma de somas, mín. de mín.).
+        dimension_model: Tabela da dimensão (`Supplier` / `Sku`).
+        label: Coluna com o nome da dimensão (para a API).
+        derived (dict): Colunas calculadas na leitura a partir das medidas.
+    """
+
+    daily: Any
+    rollup: Any
+    dimension: str
+    constraint: str
+    measures: dict[str, tuple[Callable, Callable[[Any], Any]]]
+    dimension_model: Any
+    label: Any
+    derived: dict[str, Callable[[Any], Any]]
+
+
+ROLLUPS: dict[str, RollupSpec] = {
+    "orders_created": RollupSpec(
+        daily=OrdersCreatedDaily,
+        rollup=OrdersCreatedRollup,
+        dimension="supplier_id",
+        constraint="uq_ocr_period",
+        measures={
+            "total_orders": (func.sum, lambda t: t.total_orders),
+            "total_qty": (func.sum, lambda t: t.total_qty),
+        },
+        dimension_model=Supplier,
+        label=Supplier.name.label("supplier"),
+        derived={},
+    ),
+    "orders_delayed": RollupSpec(
+        daily=OrdersDelayedDaily,
+        rollup=OrdersDelayedRollup,
+        dimension="supplier_id",
+        constraint="uq_odr_period",
+        measures={
+            "delayed_orders": (func.sum, lambda t: t.delayed_orders),
+            "delay_days_sum": (
+                func.sum,
+                lambda t: t.avg_delay_days * t.delayed_orders,
+            ),
+        },
+        dimension_model=Supplier,
+        label=Supplier.name.label("supplier"),
+        derived={
+            "avg_delay_days": lambda r: func.round(
+                r.delay_days_sum / func.nullif(r.delayed_orders, 0), 4
+            )
+        },
+    ),
+    "inventory_alerts": RollupSpec(
+        daily=InventoryAlertsDaily,
+        rollup=InventoryAlertsRollup,
+        dimension="sku_id",
+        constraint="uq_iar_period",
+        measures={
+            "low_stock_alerts": (func.sum, lambda t: t.low_stock_alerts),
+            "min_threshold": (func.min, lambda t: t.min_threshold),
+        },
+        dimension_model=Sku,
+        label=Sku.sku_code.label("sku"),
+        derived={},
+    ),
+}
+
+
+def period_start(day: date, grain: str) -> date:
+    """Início do período de `day` (igual ao `date_trunc` do Postgres)."""
+    if grain == "week":
+        return day - timedelta(days=day.weekday())
+    if grain == "month":
+        return day.replace(day=1)
+    if grain == "total":
+        return ALL_TIME
+    raise ValueError(f"grain inválido: {grain!r} (use {GRAINS})")
+
+
+def _period_end(start: date, grain: str) -> date:
+    if grain == "week":
+        return start + timedelta(days=7)
+    return (start + timedelta(days=32)).replace(day=1)
+
+
+def _upsert(spec: RollupSpec, query: Select) -> Any:
+    columns = [
+        "grain",
+        "period_start",
+        spec.dimension,
+        *spec.measures,
+        "days",
+    ]
+    stmt = insert(spec.rollup).from_select(columns, query)
+    return stmt.on_conflict_do_update(
+        constraint=spec.constraint,
+        set_={
+            **{c: stmt.excluded[c] for c in [*spec.measures, "days"]},
+            "updated_at": func.now(),
+        },
+    )
+
+
+def refresh_from_daily(
+    spec: RollupSpec, grain: str, periods: Optional[set[date]] = None
+) -> Any:
+    """Upsert dos rollups semana/mês de `periods` (None = todos)."""
+    daily = spec.daily
+    period = cast(
+        func.date_trunc(grain, cast(daily.day, TIMESTAMP)), Date
+    ).label("period_start")
+    dim = getattr(daily, spec.dimension)
+    query = select(
+        literal(grain),
+        period,
+        dim,
+        *[agg(expr(daily)) for agg, expr in spec.measures.values()],
+        func.count(),
+    ).group_by(period, dim)
+    if periods:
+        # 🔹 Intervalo de datas usa o índice por dia; IN descarta os buracos
+        query = query.where(
+            daily.day >= min(periods),
+            daily.day < _period_end(max(periods), grain),
+            period.in_(sorted(periods)),
+        )
+    return _upsert(spec, query)
+
+
+def refresh_totals(
+    spec: RollupSpec, months: Optional[set[date]] = None
+) -> Any:
+    """Upsert do grain "total" a partir dos meses (não do diário)."""
+    rollup = spec.rollup
+    dim = getattr(rollup, spec.dimension)
+    query = (
+        select(
+            literal("total"),
+            literal(ALL_TIME, Date),
+            dim,
+            *[
+                agg(getattr(rollup, name))
+                for name, (agg, _) in spec.measures.items()
+            ],
+            func.sum(rollup.days),
+        )
+        .where(rollup.grain == "month")
+        .group_by(dim)
+    )
+    if months:
+        touched = select(dim).where(
+            rollup.grain == "month", rollup.period_start.in_(sorted(months))
+        )
+        query = query.where(dim.in_(touched))
+    return _upsert(spec, query)
+
+
+def refresh_rollups(
+    db: Session,
+    days: Optional[Iterable[date]] = None,
+    names: Optional[Iterable[str]] = None,
+) -> None:
+    """Atualiza os rollups dos períodos que contêm `days`.
+
+    Deve rodar na mesma transação da carga diária, depois dela.
+
+    Args:
+        db (Session): Sessão da carga Gold.
+        days (Optional[Iterable[date]]): Dias gravados nesta carga. None =
+            reconstrução completa.
+        names (Optional[Iterable[str]]): Métricas de `ROLLUPS` (padrão:
+            todas).
+    """
+    touched = set(days) if days is not None else None
+    if touched is not None and not touched:
+        return
+    for name in names or ROLLUPS:
+        spec = ROLLUPS[name]
+        periods: dict[str, Optional[set[date]]] = {
+            grain: None
+            if touched is None
+            else {period_start(d, grain) for d in touched}
+            for grain in ("week", "month")
+        }
+        for grain, starts in periods.items():
+            db.execute(refresh_from_daily(spec, grain, starts))
+        db.execute(refresh_totals(spec, periods["month"]))
+
+
+# -----------------------------
+# Leitura (API)
+# -----------------------------
+def _select_rollup(spec: RollupSpec) -> Select:
+    rollup = spec.rollup
+    dim = getattr(rollup, spec.dimension)
+    columns = [
+        rollup.grain,
+        rollup.period_start,
+        spec.label,
+        *[getattr(rollup, name) for name in spec.measures],
+        *[expr(rollup).label(name) for name, expr in spec.derived.items()],
+        rollup.days,
+    ]
+    return select(*columns).join(
+        spec.dimension_model, spec.dimension_model.id == dim
+    )
+
+
+def rollup_stmt(
+    name: str,
+    grain: str,
+    key_id: Optional[int] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> Select:
+    """Série de um rollup: períodos de `grain` que começam entre as datas."""
+    spec = ROLLUPS[name]
+    rollup = spec.rollup
+    query = _select_rollup(spec).where(rollup.grain == grain)
+    if key_id is not None:
+        query = query.where(getattr(rollup, spec.dimension) == key_id)
+    if start:
+        query = query.where(rollup.period_start >= period_start(start, grain))
+    if end:
+        query = query.where(rollup.period_start <= end)
+    return query.order_by(
+        rollup.period_start.desc(), getattr(rollup, spec.dimension)
+    )
+
+
+def top_stmt(
+    name: str,
+    grain: str,
+    period: date,
+    by: str,
+    limit: int,
+) -> Select:
+    """Top-N da dimensão em um período, ordenado pela medida `by`."""
+    spec = ROLLUPS[name]
+    rollup = spec.rollup
+    query = _select_rollup(spec).where(
+        rollup.grain == grain,
+        rollup.period_start == period_start(period, grain),
+    )
+    if by in spec.derived:
+        order = spec.derived[by](rollup)
+    else:
+        order = getattr(rollup, by)
+    return query.order_by(
+        order.desc().nulls_last(), getattr(rollup, spec.dimension)
+    ).limit(limit)
+
+
+def sort_measures(name: str) -> list[str]:
+    """Colunas aceitas em `by=` para o top-N de `name`."""
+    spec = ROLLUPS[name]
+    return [*spec.measures, *spec.derived]
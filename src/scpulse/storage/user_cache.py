@@ -0,0 +1,158 @@
+"""Cache em processo dos usuários autenticados (email → usuário).
+
+Toda requisição autenticada resolvia o `sub` do JWT com um SELECT em
+`users`. Os usuários resolvidos ficam em um `LRUCache` com TTL curto:
+
+- o login já grava o usuário (a primeira requisição com o token é hit);
+- alterações em `User` feitas pelo ORM invalidam a entrada após o commit
+  (mesma mecânica de `dimensions`: nada muda no cache se houver rollback);
+- o TTL limita a defasagem quando outro processo altera o usuário;
+- o estado de revogação (`token_version`, `is_active`) de cada `uid` fica
+  num mapa à parte, sem TTL, que as alterações confirmadas atualizam em
+  vez de apagar: com `AUTH_TRUST_CLAIMS`, um token revogado neste
+  processo continua recusado mesmo após a entrada do usuário sair do
+  cache.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
+
+from ..core.cache import LRUCache
+from .models.users import User
+
+AUTH_USER_CACHE_MAX = int(os.getenv("AUTH_USER_CACHE_MAX", "10000"))
+AUTH_USER_CACHE_TTL_S = float(os.getenv("AUTH_USER_CACHE_TTL_S", "30"))
+
+_CHANGED_KEY = "changed_user_emails"
+_STATES_KEY = "changed_user_states"
+
+
+@dataclass(frozen=True)
+class CachedUser:
+    """Cópia imutável dos campos de `User` usados na autenticação."""
+
+    id: int
+    name: str
+    email: str
+    is_active: bool
+    token_version: int
+
+    @classmethod
+    def from_model(cls, user: User) -> "CachedUser":
+        return cls(
+            id=user.id,
+            name=user.name,
+            email=user.email,
+            is_active=user.is_active,
+            token_version=user.token_version,
+        )
+
+
+@dataclass(frozen=True)
+class UserState:
+    """Campos que revogam tokens já emitidos."""
+
+    token_version: int
+    is_active: bool
+
+
+class UserCache:
+    def __init__(
+        self,
+        maxsize: int = AUTH_USER_CACHE_MAX,
+        ttl_seconds: Optional[float] = AUTH_USER_CACHE_TTL_S,
+    ) -> None:
+        self.cache: LRUCache[str, CachedUser] = LRUCache(maxsize, ttl_seconds)
+        self.states: LRUCache[int, UserState] = LRUCache(maxsize)
+
+    def peek(self, email: str) -> Optional[CachedUser]:
+        """Usuário em cache, sem consultar o banco."""
+        return self.cache.get(email)
+
+    async def get_by_email_async(
+        self, db: AsyncSession, email: str
+    ) -> Optional[CachedUser]:
+        found = self.cache.get(email)
+        if found is not None:
+            return found
+        user = (
+            await db.execute(select(User).where(User.email == email))
+        ).scalar_one_or_none()
+        if user is None:
+            return None
+        return self.put(user)
+
+    def put(self, user: User | CachedUser) -> CachedUser:
+        cached = (
+            user
+            if isinstance(user, CachedUser)
+            else CachedUser.from_model(user)
+        )
+        self.cache.set(cached.email, cached)
+        self.record_state(
+            cached.id, UserState(cached.token_version, cached.is_active)
+        )
+        return cached
+
+    def record_state(self, user_id: int, state: UserState) -> None:
+        self.states.set(user_id, state)
+
+    def state_of(self, user_id: int) -> Optional[UserState]:
+        """Último estado de revogação conhecido neste processo."""
+        return self.states.get(user_id)
+
+    def invalidate(self, email: str) -> None:
+        self.cache.delete(email)
+
+    def clear(self) -> None:
+        self.cache.clear()
+        self.states.clear()
+
+
+USERS = UserCache()
+
+
+# 🔹 Alterações via ORM marcam o email (antigo e novo) na sessão...
+def _mark_changed_user(target: User, is_active: bool) -> None:
+    session = object_session(target)
+    if session is None:
+        return
+    history = inspect(target).attrs.email.history
+    emails = {target.email, *history.deleted}
+    session.info.setdefault(_CHANGED_KEY, set()).update(emails)
+    session.info.setdefault(_STATES_KEY, {})[target.id] = UserState(
+        target.token_version, is_active
+    )
+
+
+@event.listens_for(User, "after_update")
+def _mark_updated_user(mapper: Any, connection: Any, target: User) -> None:
+    _mark_changed_user(target, target.is_active)
+
+
+@event.listens_for(User, "after_delete")
+def _mark_deleted_user(mapper: Any, connection: Any, target: User) -> None:
+    # usuário removido: tokens ainda válidos passam a ser recusados
+    _mark_changed_user(target, False)
+
+
+# 🔹 ... e a entrada só sai do cache quando a mudança está confirmada
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_users(session: Session) -> None:
+    for email in session.info.pop(_CHANGED_KEY, ()):
+        USERS.invalidate(email)
+    for user_id, state in session.info.pop(_STATES_KEY, {}).items():
+        USERS.record_state(user_id, state)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session: Session) -> None:
+    session.info.pop(_CHANGED_KEY, None)
+    session.info.pop(_STATES_KEY, None)
@@ -1,7 +1,11 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from .models.users import User
 from src.scpulse.api.schemas.users import UserCreate
-from src.scpulse.core.security import get_password_hash
+from src.scpulse.core.security import (
+    get_password_hash,
+    get_password_hash_async,
+)
 
 
 def create_user(db: Session, user: UserCreate) -> User:
@@ -15,3 +19,16 @@ def create_user(db: Session, user: UserCreate) -> User:
     db.commit()
     db.refresh(db_user)
     return db_user
+
+
+async def create_user_async(db: AsyncSession, user: UserCreate) -> User:
+    db_user = User(
+        name=user.name,
+        email=user.email,
+        is_active=True,
+        hashed_password=await get_password_hash_async(user.password),
+    )
+    db.add(db_user)
+    await db.commit()
+    await db.refresh(db_user)
+    return db_user
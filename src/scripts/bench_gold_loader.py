@@ -0,0 +1,91 @@
+"""Benchmark: `crud.save_*` (multi-row upsert) vs `copy_loader` (COPY).
+
+Gera agregados `orders_created` sintéticos com chaves (dia, fornecedor)
+únicas e mede o tempo de carga de cada caminho no Postgres de
+`DATABASE_URL`. Cada medição roda em uma transação desfeita ao final, então
+o banco não é alterado (exceto fornecedores `BENCH_*` criados na
+dimensão).
+
+Uso:
+    PYTHONPATH=.:src python src/scripts/bench_gold_loader.py \\
+        --rows 10000 100000 1000000
+"""
+
+import argparse
+import time
+from datetime import date
+
+import polars as pl
+
+from src.scpulse.storage import copy_loader, crud
+from src.scpulse.storage.dimensions import SUPPLIERS
+from src.scpulse.storage.postgres import SessionLocal
+
+SUPPLIER_COUNT = 1000
+
+
+def _make_frame(rows: int) -> pl.DataFrame:
+    """Agregado Gold com `rows` pares (dia, fornecedor) distintos."""
+    start = date(2000, 1, 1)
+    return pl.DataFrame({"i": pl.int_range(0, rows, eager=True)}).select(
+        (
+            pl.lit("BENCH_") + (pl.col("i") % SUPPLIER_COUNT).cast(pl.Utf8)
+        ).alias("supplier"),
+        (
+            pl.lit(start) + pl.duration(days=pl.col("i") // SUPPLIER_COUNT)
+        ).alias("date"),
+        (pl.col("i") % 97 + 1).alias("total_orders"),
+        (pl.col("i") % 5000).alias("total_qty"),
+    )
+
+
+def _crud(df: pl.DataFrame) -> None:
+    db = SessionLocal()
+    try:
+        crud.save_orders_created(db, df.to_dicts())
+    finally:
+        db.rollback()
+        db.close()
+
+
+def _copy(df: pl.DataFrame) -> None:
+    db = SessionLocal()
+    try:
+        copy_loader.load_gold_frame(db, "orders_created", df)
+    finally:
+        db.rollback()
+        db.close()
+
+
+LOADERS = {"crud_upsert": _crud, "copy": _copy}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # Fornecedores criados e em cache antes das medições
+    db = SessionLocal()
+    SUPPLIERS.resolve(db, [f"BENCH_{i}" for i in range(SUPPLIER_COUNT)])
+    db.commit()
+    db.close()
+
+    print(f"{'rows':>10} {'loader':>12} {'best_s':>9} {'rows/s':>12}")
+    for rows in args.rows:
+        df = _make_frame(rows)
+        for name, load in LOADERS.items():
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                load(df)
+                timings.append(time.perf_counter() - start)
+            best = min(timings)
+            print(f"{rows:>10} {name:>12} {best:>9.3f} {rows / best:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark: buffer de lista de dicts vs buffer colunar no Bronze.
+
+Compara eventos/s (acúmulo + materialização + encode Parquet) e o pico de
+RSS de cada estratégia. Cada medição roda em um processo novo para que o
+pico de memória de uma não contamine a outra.
+
+Uso:
+    PYTHONPATH=src python src/scripts/bench_ingest_buffer.py --events 200000
+"""
+
+import argparse
+import io
+import multiprocessing as mp
+import random
+import resource
+import time
+from typing import Any, Optional
+
+import polars as pl
+
+from scripts.factories import (
+    OrderCreatedFactory,
+    OrderDelayedFactory,
+    InventoryLowFactory,
+)
+
+FACTORIES: list[Any] = [
+    OrderCreatedFactory,
+    OrderDelayedFactory,
+    InventoryLowFactory,
+]
+
+
+def _make_events(n: int, seed: int = 42) -> list[dict[str, Any]]:
+    random.seed(seed)
+    templates = [factory_cls() for factory_cls in FACTORIES for _ in range(50)]
+    # Copia templates para não medir o custo do Factory Boy
+    return [dict(random.choice(templates)) for _ in range(n)]
+
+
+def _list_of_dicts(events: list[dict[str, Any]]) -> pl.DataFrame:
+    """Caminho antigo: lista de dicts → pl.DataFrame inferido."""
+    buffer: list[dict[str, Any]] = []
+    for event in events:
+        buffer.append(event)
+    return pl.DataFrame(buffer).with_columns(
+        pl.col("timestamp")
+        .str.strptime(pl.Datetime("ns"), "%Y-%m-%dT%H:%M:%S%.f%z")
+        .dt.convert_time_zone("UTC")
+    )
+
+
+def _columnar(events: list[dict[str, Any]]) -> pl.DataFrame:
+    """Caminho novo: ColumnarEventBuffer com schema declarado."""
+    from scpulse.etl.ingest_buffer import ColumnarEventBuffer
+
+    buffer = ColumnarEventBuffer()
+    for event in events:
+        buffer.append(event)
+    df: Optional[pl.DataFrame] = buffer.to_frame()
+    assert df is not None
+    return df
+
+
+STRATEGIES = {"list_of_dicts": _list_of_dicts, "columnar": _columnar}
+
+
+def _run(strategy: str, n: int, batch: int, queue: Any) -> None:
+    events = _make_events(n)
+    baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    build = STRATEGIES[strategy]
+
+    start = time.perf_counter()
+    for i in range(0, n, batch):
+        df = build(events[i : i + batch])
+        df.write_parquet(io.BytesIO(), compression="snappy")
+    elapsed = time.perf_counter() - start
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((n / elapsed, (peak_rss - baseline_rss) / 1024))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--batch", type=int, default=50_000)
+    args = parser.parse_args()
+
+    ctx = mp.get_context("spawn")
+    print(f"[BENCH] {args.events} eventos, flush a cada {args.batch}")
+    for strategy in STRATEGIES:
+        queue = ctx.Queue()
+        proc = ctx.Process(
+            target=_run, args=(strategy, args.events, args.batch, queue)
+        )
+        proc.start()
+        rate, rss_mb = queue.get()
+        proc.join()
+        print(
+            f"[BENCH] {strategy:<14} {rate:>12,.0f} eventos/s   "
+            f"pico RSS +{rss_mb:,.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
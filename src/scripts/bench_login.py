@@ -0,0 +1,110 @@
+"""Benchmark de throughput de login (verificação bcrypt).
+
+Simula uma "tempestade de logins": `--requests` verificações disparadas
+de uma vez por corrotinas em um único event loop, comparando
+
+- inline:  bcrypt chamado direto no handler (bloqueia o event loop);
+- pool:    `verify_password_async` (pool limitado de `core.security`).
+
+Para cada modo mede logins/s, latência p50/p99 e quantas chamadas foram
+recusadas por saturação (viram HTTP 429 na API). Também mede a latência
+de uma tarefa "leve" concorrente (ex.: /health), que mostra o quanto o
+event loop fica travado. Não usa banco.
+
+Uso:
+    PYTHONPATH=.:src BCRYPT_WORKERS=4 BCRYPT_MAX_PENDING=32 \\
+        python src/scripts/bench_login.py --requests 64
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable
+
+from src.scpulse.core.executor import ExecutorSaturated
+from src.scpulse.core.security import (
+    BCRYPT_MAX_PENDING,
+    BCRYPT_WORKERS,
+    get_password_hash,
+    verify_password,
+    verify_password_async,
+)
+
+PASSWORD = "s3nh4-de-teste"
+
+
+async def _inline_verify(plain: str, hashed: str) -> bool:
+    return verify_password(plain, hashed)
+
+
+async def _heartbeat(stop: asyncio.Event, lags: list[float]) -> None:
+    """Mede o atraso do event loop a cada 10ms."""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.01)
+        lags.append(time.perf_counter() - started - 0.01)
+
+
+async def _storm(
+    verify: Callable[[str, str], Awaitable[bool]], hashed: str, requests: int
+) -> dict[str, float]:
+    latencies: list[float] = []
+    rejected = 0
+
+    async def one() -> None:
+        # 🔹 Todos os logins "chegam" juntos: latência conta desde o início
+        nonlocal rejected
+        try:
+            assert await verify(PASSWORD, hashed)
+        except ExecutorSaturated:
+            rejected += 1
+            return
+        latencies.append(time.perf_counter() - started)
+
+    stop = asyncio.Event()
+    lags: list[float] = []
+    heartbeat = asyncio.create_task(_heartbeat(stop, lags))
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await heartbeat
+
+    latencies.sort()
+    return {
+        "ok": len(latencies),
+        "rejected": rejected,
+        "rate": len(latencies) / elapsed,
+        "p50": statistics.median(latencies) if latencies else 0.0,
+        "p99": latencies[int(len(latencies) * 0.99) - 1] if latencies else 0.0,
+        "loop_lag_max": max(lags, default=0.0),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=64)
+    args = parser.parse_args()
+
+    hashed = get_password_hash(PASSWORD)
+    print(
+        f"[BENCH] {args.requests} logins, workers={BCRYPT_WORKERS}, "
+        f"max_pending={BCRYPT_MAX_PENDING}"
+    )
+    for label, verify in (
+        ("inline", _inline_verify),
+        ("pool", verify_password_async),
+    ):
+        r = await _storm(verify, hashed, args.requests)
+        print(
+            f"[{label.upper():6}] {r['ok']:>4} ok, {r['rejected']:>4} 429, "
+            f"{r['rate']:6.1f} logins/s, p50 {r['p50'] * 1000:7.1f}ms, "
+            f"p99 {r['p99'] * 1000:7.1f}ms, "
+            f"loop travado até {r['loop_lag_max'] * 1000:7.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,249 @@
+"""Benchmark dos backends de leitura da API: Postgres vs DuckDB (Parquet).
+
+Gera um dataset Gold sintético local (`--days` x `--suppliers` / `--skus`),
+grava-o como lake Parquet (layout `events_<dia>/gold_<métrica>.parquet`)
+e, se o backend `postgres` for pedido, nas tabelas diárias do Postgres de
+`DATABASE_URL` (fornecedores/SKUs `BENCH_*`, removidos ao final).
+
+Para cada backend e nível de concorrência dispara `--requests` leituras
+pelos mesmos métodos usados pelas rotas (`GoldRepository`): métrica
+aleatória, filtro por fornecedor/SKU em metade das chamadas, janela de 30
+dias, página de 100 linhas. Reporta req/s e latência p50/p95/p99.
+
+Uso:
+    PYTHONPATH=.:src python src/scripts/bench_read_backends.py \\
+        --backends duckdb postgres --concurrency 1 8 32 --requests 500
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Awaitable, Callable
+
+import polars as pl
+
+from src.scpulse.api.pagination import PageParams
+from src.scpulse.api.repository import (
+    DuckDBRepository,
+    GoldRepository,
+    PostgresRepository,
+)
+from src.scpulse.storage import crud, duck
+
+START_DAY = date(2024, 1, 1)
+METRICS = ("orders_created", "orders_delayed", "inventory_alerts")
+
+
+def _frames(
+    day: date, suppliers: int, skus: int, rng: random.Random
+) -> dict[str, pl.DataFrame]:
+    supplier_names = [f"BENCH_S{i:04d}" for i in range(suppliers)]
+    sku_codes = [f"BENCH_SKU{i:05d}" for i in range(skus)]
+    return {
+        "orders_created": pl.DataFrame(
+            {
+                "supplier": supplier_names,
+                "date": [day] * suppliers,
+                "total_orders": [rng.randint(1, 50) for _ in supplier_names],
+                "total_qty": [rng.randint(1, 5000) for _ in supplier_names],
+            }
+        ),
+        "orders_delayed": pl.DataFrame(
+            {
+                "supplier": supplier_names,
+                "date": [day] * suppliers,
+                "delayed_orders": [rng.randint(0, 10) for _ in supplier_names],
+                "avg_delay_days": [
+                    round(rng.uniform(0, 7), 4) for _ in supplier_names
+                ],
+            }
+        ),
+        "inventory_alerts": pl.DataFrame(
+            {
+                "sku": sku_codes,
+                "date": [day] * skus,
+                "low_stock_alerts": [rng.randint(0, 5) for _ in sku_codes],
+                "min_threshold": [rng.randint(1, 20) for _ in sku_codes],
+            }
+        ),
+    }
+
+
+def build_dataset(
+    root: Path, days: int, suppliers: int, skus: int
+) -> list[dict[str, pl.DataFrame]]:
+    rng = random.Random(42)
+    dataset = []
+    for offset in range(days):
+        day = START_DAY + timedelta(days=offset)
+        frames = _frames(day, suppliers, skus, rng)
+        out = root / "gold" / f"events_{day}"
+        out.mkdir(parents=True, exist_ok=True)
+        for name, df in frames.items():
+            df.write_parquet(out / f"gold_{name}.parquet")
+        dataset.append(frames)
+    return dataset
+
+
+def load_postgres(dataset: list[dict[str, pl.DataFrame]]) -> None:
+    from src.scpulse.storage.postgres import SessionLocal
+
+    with SessionLocal() as db:
+        for frames in dataset:
+            for name, df in frames.items():
+                getattr(crud, f"save_{name}")(db, df.to_dicts())
+        db.commit()
+
+
+def cleanup_postgres() -> None:
+    from sqlalchemy import delete, select
+
+    from src.scpulse.storage.dimensions import SKUS, SUPPLIERS
+    from src.scpulse.storage.models.entities import (
+        InventoryAlertsDaily,
+        OrdersCreatedDaily,
+        OrdersDelayedDaily,
+        Sku,
+        Supplier,
+    )
+    from src.scpulse.storage.postgres import SessionLocal
+
+    with SessionLocal() as db:
+        bench_suppliers = select(Supplier.id).where(
+            Supplier.name.like("BENCH_S%")
+        )
+        bench_skus = select(Sku.id).where(Sku.sku_code.like("BENCH_SKU%"))
+        for model in (OrdersCreatedDaily, OrdersDelayedDaily):
+            db.execute(
+                delete(model).where(model.supplier_id.in_(bench_suppliers))
+            )
+        db.execute(
+            delete(InventoryAlertsDaily).where(
+                InventoryAlertsDaily.sku_id.in_(bench_skus)
+            )
+        )
+        db.execute(delete(Supplier).where(Supplier.name.like("BENCH_S%")))
+        db.execute(delete(Sku).where(Sku.sku_code.like("BENCH_SKU%")))
+        db.commit()
+    SUPPLIERS.clear()
+    SKUS.clear()
+
+
+def _random_call(
+    args: argparse.Namespace, rng: random.Random
+) -> Callable[[GoldRepository], Awaitable[object]]:
+    metric = rng.choice(METRICS)
+    start = START_DAY + timedelta(days=rng.randrange(max(args.days - 30, 1)))
+    end = start + timedelta(days=29)
+    key = None
+    if rng.random() < 0.5:
+        key = (
+            f"BENCH_SKU{rng.randrange(args.skus):05d}"
+            if metric == "inventory_alerts"
+            else f"BENCH_S{rng.randrange(args.suppliers):04d}"
+        )
+    page = PageParams(limit=100, cursor=None, fields=None, include_total=False)
+    return lambda repo: getattr(repo, metric)(key, start, end, page)
+
+
+async def run_load(
+    backend: str,
+    args: argparse.Namespace,
+    lake: duck.DuckLake,
+    concurrency: int,
+) -> dict[str, float]:
+    rng = random.Random(concurrency)
+    calls = [_random_call(args, rng) for _ in range(args.requests)]
+    queue: asyncio.Queue = asyncio.Queue()
+    for call in calls:
+        queue.put_nowait(call)
+    latencies: list[float] = []
+
+    async def worker() -> None:
+        if backend == "postgres":
+            from src.scpulse.storage.postgres import AsyncSessionLocal
+        while not queue.empty():
+            call = queue.get_nowait()
+            started = time.perf_counter()
+            if backend == "duckdb":
+                await call(DuckDBRepository(lake))
+            else:
+                async with AsyncSessionLocal() as db:
+                    await call(PostgresRepository(db))
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+
+    def pct(p: float) -> float:
+        return latencies[min(int(len(latencies) * p), len(latencies) - 1)]
+
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50": statistics.median(latencies),
+        "p95": pct(0.95),
+        "p99": pct(0.99),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=["duckdb", "postgres"],
+        default=["duckdb", "postgres"],
+    )
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--suppliers", type=int, default=200)
+    parser.add_argument("--skus", type=int, default=500)
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[1, 8, 32]
+    )
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="scpulse-bench-") as tmp:
+        root = Path(tmp)
+        started = time.perf_counter()
+        dataset = build_dataset(root, args.days, args.suppliers, args.skus)
+        rows = sum(df.height for frames in dataset for df in frames.values())
+        print(
+            f"[BENCH] Lake com {rows} linhas Gold em "
+            f"{time.perf_counter() - started:.1f}s"
+        )
+        lake = duck.DuckLake(root / "silver", root / "gold")
+
+        backends = list(args.backends)
+        if "postgres" in backends:
+            try:
+                load_postgres(dataset)
+            except Exception as e:
+                print(f"[BENCH] Postgres indisponível, pulando: {e}")
+                backends.remove("postgres")
+
+        try:
+            for backend in backends:
+                for concurrency in args.concurrency:
+                    r = await run_load(backend, args, lake, concurrency)
+                    print(
+                        f"[{backend.upper():8}] concorrência {concurrency:>3}: "
+                        f"{r['rps']:8.1f} req/s, p50 {r['p50'] * 1000:7.2f}ms, "
+                        f"p95 {r['p95'] * 1000:7.2f}ms, "
+                        f"p99 {r['p99'] * 1000:7.2f}ms"
+                    )
+        finally:
+            lake.close()
+            if "postgres" in backends:
+                cleanup_postgres()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,5 +1,6 @@
 import factory
 import random
+import uuid
 from datetime import datetime, timedelta, UTC
 
 
@@ -9,9 +10,9 @@ class BaseEventFactory(factory.Factory):
     class Meta:
         model = dict
 
-    event_id = factory.LazyAttribute(
-        lambda _: f"EVT-{random.randint(1000,9999)}"
-    )
+    # UUID: ids aleatórios de 4 dígitos colidiam e viravam "duplicatas"
+    # na deduplicação por event_id da Silver
+    event_id = factory.LazyFunction(lambda: f"EVT-{uuid.uuid4().hex}")
     timestamp = factory.LazyFunction(lambda: datetime.now(UTC).isoformat())
     supplier = factory.Iterator(
         ["Fornecedor_A", "Fornecedor_B", "Fornecedor_C"]
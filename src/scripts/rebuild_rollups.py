@@ -0,0 +1,52 @@
+"""Reconstrói os rollups Gold (semana/mês/total) a partir das tabelas diárias.
+
+O ETL mantém os rollups incrementalmente; este script serve para a carga
+inicial de um banco que já tinha histórico diário (ou após correções
+manuais nas tabelas diárias).
+
+Uso:
+    PYTHONPATH=.:src python src/scripts/rebuild_rollups.py [--dataset ...]
+"""
+
+import argparse
+import time
+
+from src.scpulse.storage.generation import (
+    bump_db_generation,
+    write_generation,
+)
+from src.scpulse.storage.postgres import SessionLocal
+from src.scpulse.storage.rollups import ROLLUPS, refresh_rollups
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--dataset",
+        nargs="+",
+        choices=list(ROLLUPS),
+        default=list(ROLLUPS),
+        help="Rollups a reconstruir (padrão: todos)",
+    )
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        refresh_rollups(db, days=None, names=args.dataset)
+        generation = bump_db_generation(db)
+        db.commit()
+        write_generation(generation)
+        print(
+            f"[ROLLUPS] {', '.join(args.dataset)} reconstruídos em "
+            f"{time.perf_counter() - started:.2f}s (geração {generation})"
+        )
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,43 @@
-"""Producer de eventos para Kafka."""
+"""Producer de eventos para Kafka.
 
+Dois modos:
+
+- padrão: um evento por vez (`send_and_wait`) a cada 1–3s, para
+  acompanhar o pipeline sem pressa;
+- carga (`--rate`): gerador de alta taxa para achar o ponto de saturação
+  do pipeline. A taxa alvo segue um perfil (`steady`, `ramp`, `step`,
+  `burst`) controlado por token bucket; o tipo de evento segue `--mix` e
+  fornecedores/SKUs saem de `--suppliers` / `--skus` valores distintos.
+  Os envios são assíncronos (`send`, não `send_and_wait`), agrupados pelo
+  producer com `--linger-ms` / `--compression` e limitados a
+  `--max-in-flight` sem ack. No final reporta a taxa alcançada e os
+  percentis da latência de envio (até o ack do broker).
+
+As factories do Factory Boy custam ~100µs por evento: no modo carga elas
+montam um pool de modelos por tipo e cada envio só troca `event_id`,
+`timestamp`, fornecedor e SKU.
+
+Uso:
+    PYTHONPATH=src python src/scripts/simulate_suppliers.py
+    PYTHONPATH=src python src/scripts/simulate_suppliers.py \\
+        --rate 5000 --duration 60 --profile step \\
+        --mix order_created=0.7,order_delayed=0.2,inventory_low=0.1 \\
+        --suppliers 500 --skus 5000 --linger-ms 20 --compression gzip
+    # teto do gerador, sem Kafka
+    PYTHONPATH=src python src/scripts/simulate_suppliers.py \\
+        --rate 50000 --duration 10 --dry-run
+"""
+
+import argparse
 import asyncio
 import json
 import os
 import random
-from typing import Any
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, UTC
+from typing import Any, Callable, Optional
 
 from aiokafka import AIOKafkaProducer
 from scripts.factories import (
@@ -22,6 +55,15 @@ FACTORIES: list[Any] = [
     InventoryLowFactory,
 ]
 
+EVENT_FACTORIES: dict[str, Any] = {
+    "order_created": OrderCreatedFactory,
+    "order_delayed": OrderDelayedFactory,
+    "inventory_low": InventoryLowFactory,
+}
+DEFAULT_MIX = "order_created=0.6,order_delayed=0.2,inventory_low=0.2"
+PROFILES = ("steady", "ramp", "step", "burst")
+TICK_S = 0.005
+
 
 async def produce_events() -> None:
     """
@@ -46,5 +88,324 @@ async def produce_events() -> None:
         await producer.stop()
 
 
+# -----------------------------
+# Modo carga
+# -----------------------------
+def parse_mix(spec: str) -> dict[str, float]:
+    """`"order_created=0.7,inventory_low=0.3"` → pesos por tipo."""
+    mix: dict[str, float] = {}
+    for part in spec.split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in EVENT_FACTORIES:
+            raise ValueError(
+                f"Tipo de evento desconhecido: {name!r}. "
+                f"Use {sorted(EVENT_FACTORIES)}"
+            )
+        mix[name] = float(weight) if weight else 1.0
+        if mix[name] < 0:
+            raise ValueError(f"Peso negativo para {name!r}")
+    if sum(mix.values()) <= 0:
+        raise ValueError(f"Mix sem nenhum peso positivo: {spec!r}")
+    return mix
+
+
+def rate_profile(
+    name: str,
+    rate: float,
+    duration_s: float,
+    burst_factor: float = 5.0,
+    burst_every_s: float = 10.0,
+    burst_len_s: float = 1.0,
+) -> Callable[[float], float]:
+    """Taxa alvo (eventos/s) em função do tempo desde o início.
+
+    - steady: `rate` constante;
+    - ramp:   sobe linearmente de 0 a `rate` ao longo de `duration_s`;
+    - step:   4 degraus de 25% de `rate` (acha a saturação por patamar);
+    - burst:  `rate`, com `burst_factor` x `rate` durante `burst_len_s`
+      a cada `burst_every_s`.
+    """
+    if name == "steady":
+        return lambda t: rate
+    if name == "ramp":
+        return lambda t: rate * min(max(t / duration_s, 0.0), 1.0)
+    if name == "step":
+        step_s = duration_s / 4
+        return lambda t: rate * min(int(t / step_s) + 1, 4) / 4
+    if name == "burst":
+        return lambda t: (
+            rate * burst_factor if t % burst_every_s < burst_len_s else rate
+        )
+    raise ValueError(f"Perfil desconhecido: {name!r}. Use {PROFILES}")
+
+
+class TokenBucket:
+    """Tokens acumulam à taxa corrente até `capacity`; cada evento gasta 1.
+
+    A capacidade limita quanto o gerador "recupera" depois de um atraso
+    (ex.: GC, producer cheio): o atraso vira perda de taxa visível no
+    relatório em vez de uma rajada maior que o perfil pediu.
+    """
+
+    def __init__(
+        self, capacity: float, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.capacity = capacity
+        self._clock = clock
+        self._last = clock()
+        self.tokens = 0.0
+
+    def refill(self, rate: float) -> None:
+        now = self._clock()
+        self.tokens = min(
+            self.capacity, self.tokens + rate * (now - self._last)
+        )
+        self._last = now
+
+    def take(self) -> int:
+        """Retira todos os tokens inteiros disponíveis."""
+        n = int(self.tokens)
+        self.tokens -= n
+        return n
+
+
+class EventGenerator:
+    """Eventos no formato das factories, com mix e cardinalidade dados.
+
+    Args:
+        mix (dict[str, float]): Peso de cada tipo de evento.
+        suppliers (int): Fornecedores distintos (`Fornecedor_00000`...).
+        skus (int): SKUs distintos (`SKU000000`...).
+        pool_size (int): Modelos gerados pelas factories por tipo.
+        rng (Optional[random.Random]): Fonte de aleatoriedade.
+    """
+
+    def __init__(
+        self,
+        mix: dict[str, float],
+        suppliers: int,
+        skus: int,
+        pool_size: int = 256,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        if suppliers <= 0 or skus <= 0:
+            raise ValueError("suppliers e skus devem ser positivos")
+        self.rng = rng or random.Random()
+        self.types = [t for t, w in mix.items() if w > 0]
+        self.weights = [mix[t] for t in self.types]
+        self.suppliers = [f"Fornecedor_{i:05d}" for i in range(suppliers)]
+        self.skus = [f"SKU{i:06d}" for i in range(skus)]
+        self.templates = {
+            t: [EVENT_FACTORIES[t]() for _ in range(pool_size)]
+            for t in self.types
+        }
+
+    def next(self) -> dict[str, Any]:
+        rng = self.rng
+        event_type = rng.choices(self.types, self.weights)[0]
+        return {
+            **rng.choice(self.templates[event_type]),
+            "event_id": f"EVT-{uuid.uuid4().hex}",
+            "timestamp": datetime.now(UTC).isoformat(),
+            "supplier": rng.choice(self.suppliers),
+            "sku": rng.choice(self.skus),
+        }
+
+
+class _NullProducer:
+    """Producer sem broker (`--dry-run`): ack imediato."""
+
+    async def start(self) -> None:
+        pass
+
+    async def send(self, topic: str, value: bytes) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(None)
+        return future
+
+    async def flush(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    """Percentil `p` (0–100) de uma lista já ordenada (nearest-rank)."""
+    if not sorted_values:
+        return 0.0
+    index = max(int(round(p / 100 * len(sorted_values))) - 1, 0)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+async def run_load(args: argparse.Namespace) -> dict[str, Any]:
+    """Gera carga segundo `args` e devolve as métricas do envio."""
+    generator = EventGenerator(
+        parse_mix(args.mix), args.suppliers, args.skus, args.pool_size
+    )
+    profile = rate_profile(
+        args.profile,
+        args.rate,
+        args.duration,
+        args.burst_factor,
+        args.burst_every,
+        args.burst_len,
+    )
+    peak = args.rate * (args.burst_factor if args.profile == "burst" else 1)
+    # 🔹 No máximo ~50ms de eventos acumulados (ver TokenBucket)
+    bucket = TokenBucket(capacity=max(peak * 0.05, 1.0))
+
+    if args.dry_run:
+        producer: Any = _NullProducer()
+    else:
+        producer = AIOKafkaProducer(
+            bootstrap_servers=KAFKA_BOOTSTRAP,
+            linger_ms=args.linger_ms,
+            max_batch_size=args.batch_bytes,
+            compression_type=(
+                None if args.compression == "none" else args.compression
+            ),
+            acks=int(args.acks) if args.acks != "all" else "all",
+        )
+    await producer.start()
+
+    in_flight = asyncio.Semaphore(args.max_in_flight)
+    latencies: list[float] = []
+    sent_per_second: Counter[int] = Counter()
+    failed = 0
+    sent = 0
+    target = 0.0
+
+    def on_ack(started: float, future: asyncio.Future) -> None:
+        nonlocal failed
+        in_flight.release()
+        if future.cancelled() or future.exception() is not None:
+            failed += 1
+        else:
+            latencies.append(time.perf_counter() - started)
+
+    started_at = time.monotonic()
+    last = started_at
+    try:
+        while (now := time.monotonic()) - started_at < args.duration:
+            elapsed = now - started_at
+            rate = profile(elapsed)
+            target += rate * (now - last)
+            last = now
+            bucket.refill(rate)
+            for _ in range(bucket.take()):
+                msg = json.dumps(generator.next()).encode("utf-8")
+                await in_flight.acquire()
+                send_started = time.perf_counter()
+                try:
+                    future = await producer.send(TOPIC, msg)
+                except Exception as e:
+                    in_flight.release()
+                    failed += 1
+                    print(f"[LOAD] Falha no envio: {e}")
+                    continue
+                future.add_done_callback(
+                    lambda f, s=send_started: on_ack(s, f)
+                )
+                sent += 1
+                sent_per_second[int(elapsed)] += 1
+            await asyncio.sleep(TICK_S)
+        await producer.flush()
+        # espera os acks pendentes
+        for _ in range(args.max_in_flight):
+            await in_flight.acquire()
+    finally:
+        await producer.stop()
+    elapsed = time.monotonic() - started_at
+
+    latencies.sort()
+    full_seconds = [sent_per_second[s] for s in range(int(args.duration))] or [
+        sent
+    ]
+    return {
+        "target": int(target),
+        "sent": sent,
+        "acked": len(latencies),
+        "failed": failed,
+        "elapsed": elapsed,
+        "rate": sent / elapsed if elapsed else 0.0,
+        "min_per_second": min(full_seconds),
+        "max_per_second": max(full_seconds),
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "max": latencies[-1] if latencies else 0.0,
+    }
+
+
+def print_report(args: argparse.Namespace, r: dict[str, Any]) -> None:
+    print(
+        f"[LOAD] Perfil {args.profile}, alvo {args.rate:g} ev/s por "
+        f"{args.duration:g}s | mix {args.mix} | {args.suppliers} "
+        f"fornecedores, {args.skus} SKUs"
+        + (" | dry-run" if args.dry_run else "")
+    )
+    print(
+        f"[LOAD] Alvo {r['target']} eventos | enviados {r['sent']} "
+        f"({r['rate']:.1f} ev/s) | confirmados {r['acked']} | "
+        f"falhas {r['failed']}"
+    )
+    print(
+        f"[LOAD] Taxa por segundo: mín {r['min_per_second']} / "
+        f"máx {r['max_per_second']} ev/s"
+    )
+    print(
+        f"[LOAD] Latência de envio (até o ack): "
+        f"p50 {r['p50'] * 1000:.2f}ms, p95 {r['p95'] * 1000:.2f}ms, "
+        f"p99 {r['p99'] * 1000:.2f}ms, máx {r['max'] * 1000:.2f}ms"
+    )
+    if r["sent"] < 0.95 * r["target"]:
+        print(
+            "[LOAD] ⚠️ Abaixo de 95% do alvo: gerador/producer saturado "
+            "(aumente --max-in-flight / --linger-ms ou reduza --rate)"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rate",
+        type=float,
+        help="Eventos/s alvo (ativa o modo carga)",
+    )
+    parser.add_argument("--duration", type=float, default=60.0)
+    parser.add_argument("--profile", choices=PROFILES, default="steady")
+    parser.add_argument("--burst-factor", type=float, default=5.0)
+    parser.add_argument("--burst-every", type=float, default=10.0)
+    parser.add_argument("--burst-len", type=float, default=1.0)
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument("--suppliers", type=int, default=3)
+    parser.add_argument("--skus", type=int, default=4)
+    parser.add_argument("--pool-size", type=int, default=256)
+    parser.add_argument("--linger-ms", type=int, default=10)
+    parser.add_argument("--batch-bytes", type=int, default=64 * 1024)
+    parser.add_argument(
+        "--compression",
+        choices=["none", "gzip", "snappy", "lz4", "zstd"],
+        default="gzip",
+    )
+    parser.add_argument("--acks", choices=["0", "1", "all"], default="1")
+    parser.add_argument("--max-in-flight", type=int, default=10_000)
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Não conecta ao Kafka (mede só o gerador)",
+    )
+    args = parser.parse_args()
+
+    if args.rate is None:
+        asyncio.run(produce_events())
+        return
+    print_report(args, asyncio.run(run_load(args)))
+
+
 if __name__ == "__main__":
-    asyncio.run(produce_events())
+    main()
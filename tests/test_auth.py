@@ -0,0 +1,97 @@
+import os
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+# 🔹 As engines do Postgres só são criadas no import, nunca conectadas
+os.environ.setdefault(
+    "DATABASE_URL", "postgresql+psycopg2://scpulse@localhost/scpulse_test"
+)
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from scpulse.api.dependencies import auth
+from scpulse.api.routes import users as users_routes
+from scpulse.core.security import create_access_token
+from scpulse.storage.user_cache import CachedUser
+
+
+class SessionAdapter:
+    """Expõe uma `Session` síncrona (sqlite) com a API async usada nas rotas.
+
+    Os eventos do ORM (`after_update`, `after_commit`) disparam como no
+    Postgres, já que a `AsyncSession` também delega a uma `Session`.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    async def get(self, model: Any, ident: Any) -> Any:
+        return self.session.get(model, ident)
+
+    async def commit(self) -> None:
+        self.session.commit()
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch) -> Iterator[TestClient]:
+    # as rotas resolvem `src.scpulse.*`: usa os mesmos módulos que elas
+    route_auth = users_routes.get_current_user.__globals__
+    monkeypatch.setitem(route_auth, "AUTH_TRUST_CLAIMS", True)
+    users_cache = route_auth["USERS"]
+    users_cache.clear()
+
+    User = users_routes.User
+    # conexão única: o TestClient roda as rotas em outra thread
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    User.__table__.create(engine)
+    with Session(engine, expire_on_commit=False) as session:
+        session.add(
+            User(
+                id=1,
+                name="Ana",
+                email="ana@example.com",
+                hashed_password="x",
+                is_active=True,
+                token_version=0,
+            )
+        )
+        session.commit()
+
+        async def get_session() -> AsyncIterator[SessionAdapter]:
+            yield SessionAdapter(session)
+
+        app = FastAPI()
+        app.include_router(users_routes.router)
+        app.dependency_overrides[users_routes.get_async_session] = get_session
+        yield TestClient(app)
+    users_cache.clear()
+
+
+def test_revoked_token_is_rejected_with_trusted_claims(
+    client: TestClient,
+) -> None:
+    claims = auth.token_claims(
+        CachedUser(
+            id=1,
+            name="Ana",
+            email="ana@example.com",
+            is_active=True,
+            token_version=0,
+        )
+    )
+    headers = {"Authorization": f"Bearer {create_access_token(claims)}"}
+
+    assert client.get("/me", headers=headers).status_code == 200
+    assert client.post("/me/tokens/revoke", headers=headers).status_code == 204
+    # cache do usuário vazio: sem o estado por uid, as claims do próprio
+    # token revogado (ver=0) seriam aceitas
+    assert client.get("/me", headers=headers).status_code == 401
@@ -0,0 +1,70 @@
+import threading
+
+import pytest
+
+from scpulse.core.cache import LRUCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_evicts_least_recently_used() -> None:
+    cache: LRUCache[str, int] = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "a" passa a ser o mais recente
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+    assert len(cache) == 2
+
+
+def test_entries_expire_after_ttl() -> None:
+    clock = FakeClock()
+    cache: LRUCache[str, int] = LRUCache(10, ttl_seconds=5, clock=clock)
+    cache.set("a", 1)
+
+    clock.now = 4.9
+    assert cache.get("a") == 1
+    clock.now = 5.0
+    assert cache.get("a", -1) == -1
+    assert len(cache) == 0
+
+
+def test_hit_and_miss_counters() -> None:
+    cache: LRUCache[str, int] = LRUCache(10)
+    cache.set_many([("a", 1), ("b", 2)])
+    cache.get_many(["a", "b", "x"])
+
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_concurrent_writers_respect_maxsize() -> None:
+    cache: LRUCache[int, int] = LRUCache(maxsize=100)
+
+    def writer(offset: int) -> None:
+        for i in range(1000):
+            cache.set(offset + i, i)
+            cache.get(offset + i // 2)
+
+    threads = [
+        threading.Thread(target=writer, args=(n * 1000,)) for n in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(cache) == 100
+
+
+def test_rejects_non_positive_maxsize() -> None:
+    with pytest.raises(ValueError):
+        LRUCache(0)
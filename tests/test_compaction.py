@@ -0,0 +1,74 @@
+from pathlib import Path
+
+import polars as pl
+
+from scpulse.etl.bronze_layout import bronze_days
+from scpulse.etl.compaction import compact_bronze, compact_partition
+from scpulse.etl.ingest_stream import BatchPolicy, BronzeBatchWriter
+from scripts.factories import InventoryLowFactory, OrderCreatedFactory
+
+
+def ingest_small_parts(base_dir: Path, n_parts: int) -> None:
+    writer = BronzeBatchWriter(base_dir, BatchPolicy())
+    for i in range(n_parts):
+        writer.add(
+            OrderCreatedFactory(
+                event_id=f"EVT-{i}",
+                timestamp=f"2025-09-17T{23 - i:02d}:00:00+00:00",
+            )
+        )
+        writer.add(
+            InventoryLowFactory(
+                event_id=f"INV-{i}", timestamp="2025-09-17T10:00:00+00:00"
+            )
+        )
+        writer.flush()
+
+
+def test_compaction_merges_small_parts_sorted(tmp_path: Path) -> None:
+    ingest_small_parts(tmp_path, 5)
+    partition = tmp_path / "event_type=order_created" / "date=2025-09-17"
+    assert len(list(partition.glob("*.parquet"))) == 5
+
+    result = compact_partition(partition, target_bytes=10 * 1024**2)
+
+    (compacted,) = partition.glob("*.parquet")
+    df = pl.read_parquet(compacted)
+    assert (result.files_in, result.files_out, result.rows) == (5, 1, 5)
+    assert df["timestamp"].is_sorted()
+    assert not list(partition.glob("*.tmp"))
+
+
+def test_compaction_respects_target_size(tmp_path: Path) -> None:
+    ingest_small_parts(tmp_path, 6)
+    partition = tmp_path / "event_type=order_created" / "date=2025-09-17"
+    part_size = max(f.stat().st_size for f in partition.glob("*.parquet"))
+
+    compact_partition(partition, target_bytes=part_size * 3)
+
+    files = list(partition.glob("*.parquet"))
+    assert 1 < len(files) < 6
+    assert sum(pl.read_parquet(f).height for f in files) == 6
+
+
+def test_compact_bronze_keeps_every_event(tmp_path: Path) -> None:
+    ingest_small_parts(tmp_path, 4)
+
+    results = compact_bronze(tmp_path, target_bytes=10 * 1024**2)
+
+    assert sum(r.files_in for r in results) == 8
+    (day_files,) = bronze_days(tmp_path).values()
+    assert len(day_files) == 2  # um arquivo por event_type
+    df = pl.concat([pl.read_parquet(f) for f in day_files])
+    assert df.height == 8
+
+
+def test_bronze_days_prunes_by_event_type(tmp_path: Path) -> None:
+    ingest_small_parts(tmp_path, 2)
+
+    days = bronze_days(tmp_path, event_types={"inventory_low"})
+
+    assert list(days) == ["2025-09-17"]
+    assert all(
+        "event_type=inventory_low" in str(f) for f in days["2025-09-17"]
+    )
@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+from scpulse.etl.decoding import (
+    EventDecodeError,
+    JsonEventDecoder,
+    TypedEventDecoder,
+    get_decoder,
+)
+from scripts.factories import (
+    OrderCreatedFactory,
+    OrderDelayedFactory,
+    InventoryLowFactory,
+)
+
+
+@pytest.mark.parametrize(
+    "factory_cls",
+    [OrderCreatedFactory, OrderDelayedFactory, InventoryLowFactory],
+)
+def test_typed_decoder_accepts_factory_events(factory_cls: type) -> None:
+    event = factory_cls()
+    decoded = TypedEventDecoder().decode(json.dumps(event).encode())
+
+    assert decoded["event_type"] == event["event_type"]
+    assert decoded["event_id"] == event["event_id"]
+
+
+def test_typed_decoder_rejects_unknown_event_type() -> None:
+    raw = json.dumps(
+        {
+            "event_id": "EVT-1",
+            "event_type": "supplier_audit",
+            "timestamp": "2025-09-17T10:00:00+00:00",
+        }
+    ).encode()
+    with pytest.raises(EventDecodeError):
+        TypedEventDecoder().decode(raw)
+
+
+def test_typed_decoder_rejects_bad_timestamp() -> None:
+    event = InventoryLowFactory(timestamp="17/09/2025 10:00")
+    with pytest.raises(EventDecodeError, match="timestamp"):
+        TypedEventDecoder().decode(json.dumps(event).encode())
+
+
+def test_typed_decoder_rejects_impossible_calendar_date() -> None:
+    # passa no regex, mas derrubaria o strptime(strict=True) do flush
+    event = InventoryLowFactory(timestamp="2025-02-30T10:00:00+00:00")
+    with pytest.raises(EventDecodeError, match="timestamp"):
+        TypedEventDecoder().decode(json.dumps(event).encode())
+
+
+def test_json_decoder_does_not_validate() -> None:
+    raw = b'{"event_type": "supplier_audit"}'
+    assert JsonEventDecoder().decode(raw) == {"event_type": "supplier_audit"}
+    with pytest.raises(EventDecodeError):
+        JsonEventDecoder().decode(b"[1, 2]")
+
+
+def test_get_decoder_rejects_unknown_name() -> None:
+    with pytest.raises(ValueError, match="Decoder desconhecido"):
+        get_decoder("avro")
@@ -0,0 +1,97 @@
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from scpulse.etl.bronze_to_silver import bronze_to_silver, silver_part_name
+from scpulse.etl.dedup import DedupIndex
+
+
+def make_part(path: Path, ids: list[str], qty: int = 1) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pl.DataFrame(
+        {
+            "event_id": ids,
+            "event_type": "order_created",
+            "timestamp": "2025-09-17T12:00:00+00:00",
+            "qty": qty,
+        }
+    ).write_parquet(path)
+    return path
+
+
+def read_silver(silver_dir: Path) -> pl.DataFrame:
+    return pl.concat(
+        [pl.read_parquet(p) for p in sorted(silver_dir.glob("*.parquet"))]
+    )
+
+
+@pytest.mark.parametrize("engine", ["eager", "lazy"])
+def test_redeliveries_across_batches_are_dropped(
+    tmp_path: Path, engine: str
+) -> None:
+    index = DedupIndex("2025-09-17", tmp_path / "_dedup")
+    silver_dir = tmp_path / "silver"
+    silver_dir.mkdir()
+
+    batch_1 = [make_part(tmp_path / "p1.parquet", ["EVT-1", "EVT-2"])]
+    batch_2 = [make_part(tmp_path / "p2.parquet", ["EVT-2", "EVT-3"], 9)]
+    for parts in (batch_1, batch_2):
+        bronze_to_silver(
+            parts,
+            silver_dir / silver_part_name(parts),
+            engine=engine,
+            dedup_index=index,
+        )
+
+    silver = read_silver(silver_dir)
+    assert sorted(silver["event_id"]) == ["EVT-1", "EVT-2", "EVT-3"]
+    # Entre lotes vale a primeira versão gravada
+    assert silver.filter(pl.col("event_id") == "EVT-2")["qty"].item() == 1
+
+    keys = pl.read_parquet(index.path)["event_id"].to_list()
+    assert keys == ["EVT-1", "EVT-2", "EVT-3"]
+
+
+def test_reprocessing_same_batch_is_idempotent(tmp_path: Path) -> None:
+    """Um lote refeito (ex.: falha no Gold) regrava o mesmo part."""
+    index = DedupIndex("2025-09-17", tmp_path / "_dedup")
+    silver_dir = tmp_path / "silver"
+    silver_dir.mkdir()
+    parts = [make_part(tmp_path / "p1.parquet", ["EVT-1", "EVT-2"])]
+    output_path = silver_dir / silver_part_name(parts)
+
+    bronze_to_silver(parts, output_path, dedup_index=index)
+    bronze_to_silver(parts, output_path, dedup_index=index)
+
+    assert len(list(silver_dir.glob("*.parquet"))) == 1
+    assert read_silver(silver_dir).height == 2
+
+
+def test_reset_forgets_seen_keys(tmp_path: Path) -> None:
+    index = DedupIndex("2025-09-17", tmp_path / "_dedup")
+    index.add(pl.Series(["EVT-1"]), "part-a.parquet")
+    assert index.path.exists()
+
+    index.reset()
+
+    lf = pl.LazyFrame({"event_id": ["EVT-1"]})
+    assert index.exclude_seen(lf, "part-b.parquet").collect().height == 1
+
+
+def test_silver_part_name_is_deterministic(tmp_path: Path) -> None:
+    a, b = tmp_path / "a.parquet", tmp_path / "b.parquet"
+    assert silver_part_name([a, b]) == silver_part_name([b, a])
+    assert silver_part_name([a]) != silver_part_name([a, b])
+
+
+def test_latest_is_rejected_with_dedup_index(tmp_path: Path) -> None:
+    """O índice manteria a 1ª versão: `keep="latest"` não pode ser ignorado."""
+    index = DedupIndex("2025-09-17", tmp_path / "_dedup")
+    parts = [make_part(tmp_path / "p1.parquet", ["EVT-1"])]
+    output_path = tmp_path / "silver" / silver_part_name(parts)
+
+    with pytest.raises(ValueError, match="keep='latest'"):
+        bronze_to_silver(parts, output_path, keep="latest", dedup_index=index)
+    assert not output_path.exists()
+    assert not index.path.exists()
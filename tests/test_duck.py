@@ -0,0 +1,161 @@
+import threading
+from datetime import date, datetime, UTC
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from scpulse.etl.gold_metrics import build_gold_frames, write_gold_frames
+from scpulse.storage.duck import (
+    DuckLake,
+    OrdersCreatedRow,
+    count_gold,
+    get_inventory_alerts,
+    get_orders_created,
+    get_orders_delayed,
+    list_dimension,
+    query_gold,
+    silver_summary,
+)
+
+DAYS = [date(2025, 9, 16), date(2025, 9, 17), date(2025, 9, 18)]
+
+
+def _events(day: date) -> list[dict[str, object]]:
+    ts = datetime(day.year, day.month, day.day, 10, tzinfo=UTC)
+    return [
+        {
+            "event_id": f"EVT-{day}-1",
+            "event_type": "order_created",
+            "supplier": "Fornecedor_A",
+            "sku": "SKU1",
+            "qty": day.day,
+            "timestamp": ts,
+        },
+        {
+            "event_id": f"EVT-{day}-2",
+            "event_type": "order_created",
+            "supplier": "Fornecedor_B",
+            "sku": "SKU2",
+            "qty": 1,
+            "timestamp": ts,
+        },
+        {
+            "event_id": f"EVT-{day}-3",
+            "event_type": "order_delayed",
+            "supplier": "Fornecedor_A",
+            "timestamp": ts,
+            "old_delivery": ts,
+            "new_delivery": datetime(
+                day.year, day.month, day.day + 2, 10, tzinfo=UTC
+            ),
+        },
+        {
+            "event_id": f"EVT-{day}-4",
+            "event_type": "inventory_low",
+            "sku": "SKU1",
+            "threshold": 5,
+            "timestamp": ts,
+        },
+    ]
+
+
+@pytest.fixture
+def lake(tmp_path: Path):
+    for day in DAYS:
+        silver_dir = tmp_path / "silver" / f"date={day}"
+        silver_dir.mkdir(parents=True)
+        pl.DataFrame(_events(day)).write_parquet(silver_dir / "part-a.parquet")
+        write_gold_frames(
+            build_gold_frames(silver_dir), tmp_path / "gold" / f"events_{day}"
+        )
+    lake = DuckLake(tmp_path / "silver", tmp_path / "gold")
+    yield lake
+    lake.close()
+
+
+def test_partition_pruning_selects_only_requested_days(lake):
+    assert len(lake.gold_files("orders_created")) == 3
+    files = lake.gold_files("orders_created", DAYS[1], DAYS[1])
+    assert files == [
+        str(
+            lake.gold_dir / f"events_{DAYS[1]}" / "gold_orders_created.parquet"
+        )
+    ]
+    assert len(lake.silver_files(start=DAYS[1])) == 2
+
+
+def test_get_functions_mirror_crud(lake):
+    rows = get_orders_created("Fornecedor_A", lake=lake)
+    assert rows == [
+        OrdersCreatedRow(day, "Fornecedor_A", 1, day.day)
+        for day in reversed(DAYS)
+    ]
+    delayed = get_orders_delayed(start=DAYS[2], lake=lake)
+    assert [(r.day, r.supplier, r.avg_delay_days) for r in delayed] == [
+        (DAYS[2], "Fornecedor_A", 2.0)
+    ]
+    alerts = get_inventory_alerts("SKU1", end=DAYS[0], lake=lake)
+    assert [(r.day, r.low_stock_alerts, r.min_threshold) for r in alerts] == [
+        (DAYS[0], 1, 5)
+    ]
+    assert get_orders_created("Fornecedor_X", lake=lake) == []
+
+
+def test_query_gold_keyset_pages_cover_all_rows(lake):
+    first = query_gold("orders_created", limit=4, lake=lake)
+    day, supplier = first[-1][0], first[-1][1]
+    rest = query_gold("orders_created", after=(day, supplier), lake=lake)
+    keys = [(r[0], r[1]) for r in first + rest]
+    assert len(keys) == count_gold("orders_created", lake=lake) == 6
+    assert len(set(keys)) == 6
+    assert keys == sorted(keys, key=lambda k: (-k[0].toordinal(), k[1]))
+    assert list_dimension("supplier", lake=lake) == [
+        "Fornecedor_A",
+        "Fornecedor_B",
+    ]
+    assert list_dimension("sku", lake=lake) == ["SKU1"]
+
+
+def test_silver_summary_groups_by_requested_keys(lake):
+    rows = silver_summary(
+        by=("supplier",), event_types=["order_created"], lake=lake
+    )
+    assert rows == [
+        {"supplier": "Fornecedor_A", "events": 3, "total_qty": 16 + 17 + 18},
+        {"supplier": "Fornecedor_B", "events": 3, "total_qty": 3},
+    ]
+    by_day = silver_summary(by=("day",), start=DAYS[2], lake=lake)
+    assert by_day == [{"day": DAYS[2], "events": 4, "total_qty": 19}]
+    with pytest.raises(ValueError):
+        silver_summary(by=("nope",), lake=lake)
+
+
+def test_views_and_per_thread_cursors(lake):
+    assert lake.register_views() == {
+        "silver_events",
+        "gold_orders_created",
+        "gold_orders_delayed",
+        "gold_inventory_alerts",
+    }
+    totals = lake.sql(
+        "SELECT day, SUM(total_qty) AS qty FROM gold_orders_created "
+        "GROUP BY day ORDER BY day"
+    )
+    assert [r["qty"] for r in totals] == [17, 18, 19]
+
+    results = {}
+
+    def worker(i):
+        results[i] = (
+            id(lake.cursor()),
+            len(get_orders_created(lake=lake)),
+        )
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert {count for _, count in results.values()} == {6}
+    assert len({cursor for cursor, _ in results.values()}) == 4
@@ -1,6 +1,16 @@
-import polars as pl
+import asyncio
+from datetime import date
+from decimal import Decimal
 from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from scpulse.api.pagination import PageParams
+from scpulse.api.repository import DuckDBRepository, PostgresRepository
 from scpulse.etl.silver_to_gold import silver_to_gold
+from scpulse.storage.duck import DuckLake
+from scpulse.storage.postgres import AsyncSessionLocal
 
 
 def make_silver_file(
@@ -150,3 +160,149 @@ def test_gold_inventory_alerts_metrics(tmp_path: Path) -> None:
     )
     assert df["low_stock_alerts"].sum() == 2
     assert df["min_threshold"][0] == 3  # menor valor
+
+
+def test_gold_rollups_match_daily_rows(tmp_path: Path) -> None:
+    from sqlalchemy import func, select
+
+    from scpulse.storage.models.entities import (
+        OrdersCreatedDaily,
+        OrdersCreatedRollup,
+        Supplier,
+    )
+    from scpulse.storage.postgres import SessionLocal
+
+    input_path: Path = make_silver_file(
+        tmp_path,
+        [
+            {
+                "event_id": "EVT-R1",
+                "event_type": "order_created",
+                "supplier": "Fornecedor_Rollup",
+                "timestamp": "2025-09-17T10:00:00+00:00",
+                "qty": 10,
+            },
+            {
+                "event_id": "EVT-R2",
+                "event_type": "order_created",
+                "supplier": "Fornecedor_Rollup",
+                "timestamp": "2025-10-02T10:00:00+00:00",
+                "qty": 5,
+            },
+        ],
+    )
+    silver_to_gold(input_path, tmp_path / "gold")
+
+    with SessionLocal() as db:
+        supplier_id = db.scalar(
+            select(Supplier.id).where(Supplier.name == "Fornecedor_Rollup")
+        )
+        daily_qty = db.scalar(
+            select(func.sum(OrdersCreatedDaily.total_qty)).where(
+                OrdersCreatedDaily.supplier_id == supplier_id
+            )
+        )
+        rollup = {
+            grain: db.scalar(
+                select(func.sum(OrdersCreatedRollup.total_qty)).where(
+                    OrdersCreatedRollup.supplier_id == supplier_id,
+                    OrdersCreatedRollup.grain == grain,
+                )
+            )
+            for grain in ("week", "month", "total")
+        }
+    assert rollup == {
+        "week": daily_qty,
+        "month": daily_qty,
+        "total": daily_qty,
+    }
+
+
+def test_read_backends_return_same_rows(tmp_path: Path) -> None:
+    """Trocar `API_READ_BACKEND` não muda o contrato das rotas Gold."""
+    day = date(2025, 9, 17)
+    input_path: Path = make_silver_file(
+        tmp_path,
+        [
+            {
+                "event_id": "EVT-B1",
+                "event_type": "order_created",
+                "supplier": "Fornecedor_Backends",
+                "timestamp": "2025-09-17T10:00:00+00:00",
+                "qty": 7,
+            },
+            {
+                "event_id": "EVT-B2",
+                "event_type": "order_delayed",
+                "supplier": "Fornecedor_Backends",
+                "timestamp": "2025-09-17T11:00:00+00:00",
+                "old_delivery": "2025-09-20T10:00:00+00:00",
+                "new_delivery": "2025-09-23T10:00:00+00:00",
+            },
+            {
+                "event_id": "EVT-B3",
+                "event_type": "inventory_low",
+                "sku": "SKU_BACKENDS",
+                "timestamp": "2025-09-17T12:00:00+00:00",
+                "threshold": 4,
+            },
+        ],
+    )
+    silver_to_gold(input_path, tmp_path / "gold" / f"events_{day}")
+    lake = DuckLake(tmp_path / "silver", tmp_path / "gold")
+    postgres_only = {"id", "supplier_id", "sku_id", "created_at"}
+
+    def normalized(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        return [
+            {
+                k: float(v) if isinstance(v, (Decimal, float)) else v
+                for k, v in item.items()
+            }
+            for item in items
+        ]
+
+    async def compare(metric: str, key: str, fields: str) -> None:
+        for projection in (None, fields):
+            page = PageParams(
+                limit=10, cursor=None, fields=projection, include_total=True
+            )
+            async with AsyncSessionLocal() as db:
+                pg = await getattr(PostgresRepository(db), metric)(
+                    key, day, day, page
+                )
+            duck = await getattr(DuckDBRepository(lake), metric)(
+                key, day, day, page
+            )
+            assert pg.total == duck.total == 1
+            [pg_item] = normalized(pg.items)
+            [duck_item] = normalized(duck.items)
+            # mesmas chaves, na mesma ordem, nos dois backends
+            assert list(pg_item) == list(duck_item)
+            assert duck_item["day"] == day
+            for name, value in duck_item.items():
+                if name in postgres_only:
+                    assert value is None and pg_item[name] is not None
+                else:
+                    assert pg_item[name] == value, name
+
+    async def compare_all() -> None:
+        await compare(
+            "orders_created",
+            "Fornecedor_Backends",
+            "day,supplier,total_orders,total_qty",
+        )
+        await compare(
+            "orders_delayed",
+            "Fornecedor_Backends",
+            "day,supplier,delayed_orders,avg_delay_days",
+        )
+        await compare(
+            "inventory_alerts",
+            "SKU_BACKENDS",
+            "day,sku,low_stock_alerts,min_threshold",
+        )
+
+    try:
+        asyncio.run(compare_all())
+    finally:
+        lake.close()
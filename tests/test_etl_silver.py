@@ -1,7 +1,7 @@
 import polars as pl
 from pathlib import Path
 import pytest
-from scpulse.etl.bronze_to_silver import bronze_to_silver
+from scpulse.etl.bronze_to_silver import _dedup_by_key, bronze_to_silver
 
 
 def test_silver_timestamp_is_datetime(tmp_path: Path) -> None:
@@ -157,3 +157,134 @@ def test_silver_integration_pipeline(tmp_path: Path) -> None:
     assert df.shape[0] == 3
     assert sorted(df["event_id"].to_list()) == ["EVT-1", "EVT-2", "EVT-3"]
     assert df.schema["timestamp"] == pl.Datetime("ns", "UTC")
+
+
+def test_silver_reads_partition_with_heterogeneous_parts(
+    tmp_path: Path,
+) -> None:
+    """Partição Bronze com part files de schemas diferentes."""
+    partition = tmp_path / "date=2025-09-17"
+    partition.mkdir()
+    make_bronze_file(
+        partition,
+        [
+            {
+                "event_id": "EVT-1",
+                "event_type": "order_created",
+                "timestamp": "2025-09-17T10:00:00+00:00",
+                "qty": 10,
+            }
+        ],
+        filename="part-1.parquet",
+    )
+    make_bronze_file(
+        partition,
+        [
+            {
+                "event_id": "EVT-2",
+                "event_type": "inventory_low",
+                "timestamp": "2025-09-17T11:00:00+00:00",
+                "threshold": 5,
+            }
+        ],
+        filename="part-2.parquet",
+    )
+    output_path = tmp_path / "silver.parquet"
+
+    bronze_to_silver(partition, output_path)
+    df = pl.read_parquet(output_path)
+
+    assert df.shape[0] == 2
+    assert {"qty", "threshold"}.issubset(df.columns)
+
+
+def test_silver_lazy_and_eager_engines_match(tmp_path: Path) -> None:
+    """Paridade: o plano lazy gera a mesma Silver que o caminho eager."""
+    rows = [
+        {
+            "event_id": f"EVT-{i % 7}",  # chaves repetidas
+            "event_type": "order_created" if i % 2 else "inventory_low",
+            "timestamp": f"2025-09-17T{i % 7:02d}:00:00.123456+00:00",
+            "supplier": "Fornecedor_A",
+            "qty": i % 7,
+        }
+        for i in range(20)
+    ]
+    rows.append(
+        {
+            "event_id": None,
+            "event_type": "order_created",
+            "timestamp": "2025-09-17T10:00:00+00:00",
+            "supplier": "Fornecedor_B",
+            "qty": 1,
+        }
+    )
+    parts = [
+        make_bronze_file(tmp_path, rows[:10], "part-1.parquet"),
+        make_bronze_file(tmp_path, rows[10:], "part-2.parquet"),
+    ]
+
+    bronze_to_silver(parts, tmp_path / "eager.parquet", engine="eager")
+    bronze_to_silver(parts, tmp_path / "lazy.parquet", engine="lazy")
+
+    eager = pl.read_parquet(tmp_path / "eager.parquet").sort(pl.all())
+    lazy = pl.read_parquet(tmp_path / "lazy.parquet").sort(pl.all())
+    assert eager.height == 7
+    assert eager.equals(lazy)
+
+
+def test_silver_rejects_unknown_engine(tmp_path: Path) -> None:
+    input_path = make_bronze_file(
+        tmp_path,
+        [
+            {
+                "event_id": "EVT-1",
+                "event_type": "order_created",
+                "timestamp": "2025-09-17T12:00:00+00:00",
+            }
+        ],
+    )
+    with pytest.raises(ValueError, match="Engine desconhecida"):
+        bronze_to_silver(input_path, tmp_path / "out.parquet", engine="gpu")
+
+
+@pytest.mark.parametrize(
+    ("keep", "expected_qty"), [("first", 10), ("latest", 30)]
+)
+def test_silver_dedup_by_event_id_keeps_by_timestamp(
+    tmp_path: Path, keep: str, expected_qty: int
+) -> None:
+    """Redeliveries com payload diferente: uma linha por event_id."""
+    input_path = make_bronze_file(
+        tmp_path,
+        [
+            {
+                "event_id": "EVT-1",
+                "event_type": "order_created",
+                "timestamp": f"2025-09-17T{hour:02d}:00:00+00:00",
+                "qty": qty,
+            }
+            for hour, qty in [(12, 20), (10, 10), (14, 30)]
+        ],
+    )
+
+    for engine in ("eager", "lazy"):
+        output_path = tmp_path / f"{engine}.parquet"
+        bronze_to_silver(input_path, output_path, engine=engine, keep=keep)
+        df = pl.read_parquet(output_path)
+        assert df["qty"].to_list() == [expected_qty]
+
+
+def test_lazy_dedup_plan_has_no_global_sort(tmp_path: Path) -> None:
+    """O dedup agrega por chave; um sort do dia inteiro não cabe em RAM."""
+    lf = pl.LazyFrame(
+        {
+            "event_id": ["EVT-1", "EVT-1", "EVT-2"],
+            "timestamp": [3, 1, 2],
+            "qty": [30, 10, 20],
+        }
+    )
+    for keep, expected in (("first", [10, 20]), ("latest", [30, 20])):
+        plan = _dedup_by_key(lf, keep)
+        assert "SORT" not in plan.explain()
+        assert plan.sort("event_id").collect()["qty"].to_list() == expected
@@ -0,0 +1,59 @@
+import asyncio
+import threading
+
+import pytest
+
+from scpulse.core.executor import BoundedExecutor, ExecutorSaturated
+
+
+def test_bounded_executor_runs_off_the_event_loop() -> None:
+    pool = BoundedExecutor(workers=2, max_pending=4, name="test")
+
+    async def main() -> None:
+        loop_thread = threading.get_ident()
+        results = await asyncio.gather(
+            *(
+                pool.run(lambda x: (x * 2, threading.get_ident()), i)
+                for i in range(4)
+            )
+        )
+        assert [value for value, _ in results] == [0, 2, 4, 6]
+        assert all(thread != loop_thread for _, thread in results)
+
+    asyncio.run(main())
+    assert pool.pending == 0
+    pool.shutdown()
+
+
+def test_bounded_executor_rejects_when_saturated() -> None:
+    pool = BoundedExecutor(workers=1, max_pending=2, name="test")
+    release = threading.Event()
+
+    async def main() -> None:
+        running = [
+            asyncio.ensure_future(pool.run(release.wait)) for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        with pytest.raises(ExecutorSaturated):
+            await pool.run(release.wait)
+        assert pool.rejected == 1
+
+        release.set()
+        await asyncio.gather(*running)
+        assert await pool.run(lambda: "ok") == "ok"
+
+    asyncio.run(main())
+    assert pool.pending == 0
+    pool.shutdown()
+
+
+def test_bounded_executor_releases_slot_when_submit_fails() -> None:
+    pool = BoundedExecutor(workers=1, max_pending=1, name="test")
+    pool.shutdown()
+
+    async def main() -> None:
+        with pytest.raises(RuntimeError, match="shutdown"):
+            await pool.run(lambda: "never")
+
+    asyncio.run(main())
+    assert pool.pending == 0
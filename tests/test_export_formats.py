@@ -0,0 +1,68 @@
+import asyncio
+import io
+import json
+from collections.abc import AsyncIterator
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+import polars as pl
+import pytest
+from sqlalchemy import BigInteger, Column, Date, Numeric
+
+from scpulse.api.export_formats import EXPORT_FORMATS
+
+COLUMNS = [
+    Column("id", BigInteger),
+    Column("day", Date),
+    Column("avg_delay_days", Numeric(10, 4)),
+]
+BATCHES = [
+    [
+        {"id": 1, "day": date(2025, 9, 17), "avg_delay_days": Decimal("2.5")},
+        {"id": 2, "day": date(2025, 9, 16), "avg_delay_days": None},
+    ],
+    [{"id": 3, "day": date(2025, 9, 15), "avg_delay_days": Decimal("1")}],
+]
+
+
+async def _batches() -> AsyncIterator[list[dict[str, Any]]]:
+    for batch in BATCHES:
+        yield batch
+
+
+def export(fmt: str) -> list[bytes]:
+    encode = EXPORT_FORMATS[fmt][0]
+
+    async def collect() -> list[bytes]:
+        return [chunk async for chunk in encode(_batches(), COLUMNS)]
+
+    return asyncio.run(collect())
+
+
+def test_ndjson_streams_one_chunk_per_batch() -> None:
+    chunks = export("ndjson")
+
+    assert len(chunks) == 2
+    rows = [json.loads(line) for line in b"".join(chunks).splitlines()]
+    assert rows[0] == {"id": 1, "day": "2025-09-17", "avg_delay_days": 2.5}
+    assert [r["id"] for r in rows] == [1, 2, 3]
+
+
+def test_csv_has_header_once() -> None:
+    df = pl.read_csv(io.BytesIO(b"".join(export("csv"))))
+
+    assert df.columns == ["id", "day", "avg_delay_days"]
+    assert df["id"].to_list() == [1, 2, 3]
+
+
+@pytest.mark.parametrize("fmt", ["arrow", "parquet"])
+def test_arrow_formats_round_trip(fmt: str) -> None:
+    pytest.importorskip("pyarrow")
+    data = io.BytesIO(b"".join(export(fmt)))
+
+    df = pl.read_ipc_stream(data) if fmt == "arrow" else pl.read_parquet(data)
+
+    assert df["id"].to_list() == [1, 2, 3]
+    assert df["day"].dtype == pl.Date
+    assert df["avg_delay_days"].to_list() == [2.5, None, 1.0]
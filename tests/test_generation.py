@@ -0,0 +1,77 @@
+import asyncio
+
+from sqlalchemy.exc import OperationalError
+
+from scpulse.storage.generation import (
+    DbGenerationWatcher,
+    GenerationWatcher,
+    bump_generation,
+    read_generation,
+)
+
+
+def test_bump_generation_increments_marker(tmp_path):
+    path = tmp_path / "gold" / "_generation.json"
+    assert read_generation(path) == 0
+    assert bump_generation(path) == 1
+    assert bump_generation(path) == 2
+    assert read_generation(path) == 2
+    assert not path.with_suffix(".tmp").exists()
+
+
+def test_watcher_polls_at_most_once_per_interval(tmp_path):
+    path = tmp_path / "_generation.json"
+    now = [0.0]
+    watcher = GenerationWatcher(
+        path, poll_interval_s=1.0, clock=lambda: now[0]
+    )
+    assert watcher.current() == 0
+
+    bump_generation(path)
+    assert watcher.current() == 0  # ainda dentro do intervalo
+    now[0] = 1.5
+    assert watcher.current() == 1
+
+
+class FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+
+class FakeSession:
+    def __init__(self, db):
+        self.db = db
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt):
+        self.db["queries"] += 1
+        if isinstance(self.db["generation"], Exception):
+            raise self.db["generation"]
+        return FakeResult(self.db["generation"])
+
+
+def test_db_watcher_polls_postgres_and_keeps_last_value_on_error():
+    db = {"generation": None, "queries": 0}
+    now = [0.0]
+    watcher = DbGenerationWatcher(
+        lambda: FakeSession(db), poll_interval_s=1.0, clock=lambda: now[0]
+    )
+    assert asyncio.run(watcher.current()) == 0
+
+    db["generation"] = 7
+    assert asyncio.run(watcher.current()) == 0  # ainda dentro do intervalo
+    now[0] = 1.5
+    assert asyncio.run(watcher.current()) == 7
+    assert db["queries"] == 2
+
+    db["generation"] = OperationalError("SELECT", {}, Exception("down"))
+    now[0] = 3.0
+    assert asyncio.run(watcher.current()) == 7
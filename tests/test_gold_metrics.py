@@ -0,0 +1,92 @@
+from pathlib import Path
+
+import polars as pl
+
+from scpulse.etl.gold_metrics import (
+    GOLD_METRICS,
+    GoldMetric,
+    build_gold_frames,
+    write_gold_frames,
+)
+
+SILVER_ROWS = [
+    {
+        "event_id": "EVT-1",
+        "event_type": "order_created",
+        "supplier": "Fornecedor_A",
+        "sku": "SKU123",
+        "timestamp": "2025-09-17T10:00:00+00:00",
+        "qty": 50,
+    },
+    {
+        "event_id": "EVT-2",
+        "event_type": "order_created",
+        "supplier": "Fornecedor_A",
+        "sku": "SKU456",
+        "timestamp": "2025-09-17T11:00:00+00:00",
+        "qty": 70,
+    },
+    {
+        "event_id": "EVT-3",
+        "event_type": "order_delayed",
+        "supplier": "Fornecedor_B",
+        "timestamp": "2025-09-17T12:00:00+00:00",
+        "old_delivery": "2025-09-20T10:00:00+00:00",
+        "new_delivery": "2025-09-23T10:00:00+00:00",
+    },
+    {
+        "event_id": "EVT-4",
+        "event_type": "inventory_low",
+        "sku": "SKU123",
+        "timestamp": "2025-09-17T15:00:00+00:00",
+        "threshold": 10,
+    },
+]
+
+
+def make_silver_partition(tmp_path: Path) -> Path:
+    """Partição Silver com dois parts de schemas diferentes."""
+    silver_dir = tmp_path / "date=2025-09-17"
+    silver_dir.mkdir()
+    pl.DataFrame(SILVER_ROWS[:2]).write_parquet(silver_dir / "part-a.parquet")
+    pl.DataFrame(SILVER_ROWS[2:]).write_parquet(silver_dir / "part-b.parquet")
+    return silver_dir
+
+
+def test_all_metrics_from_one_plan(tmp_path: Path) -> None:
+    frames = build_gold_frames(make_silver_partition(tmp_path))
+
+    assert set(frames) == set(GOLD_METRICS)
+    created = frames["orders_created"]
+    assert created["total_orders"].sum() == 2
+    assert created["total_qty"].sum() == 120
+    assert frames["orders_delayed"]["avg_delay_days"][0] == 3
+    assert frames["inventory_alerts"]["min_threshold"][0] == 10
+
+
+def test_metric_without_required_columns_is_skipped(tmp_path: Path) -> None:
+    path = tmp_path / "silver.parquet"
+    pl.DataFrame(SILVER_ROWS[:2]).write_parquet(path)
+
+    assert set(build_gold_frames(path)) == {"orders_created"}
+
+
+def test_custom_metric_and_parallel_writes(tmp_path: Path) -> None:
+    by_sku = GoldMetric(
+        name="orders_by_sku",
+        event_type="order_created",
+        required=frozenset({"sku", "qty"}),
+        build=lambda lf: lf.group_by("sku").agg(pl.col("qty").sum()),
+    )
+    frames = build_gold_frames(
+        make_silver_partition(tmp_path),
+        [GOLD_METRICS["orders_created"], by_sku],
+    )
+    paths = write_gold_frames(frames, tmp_path / "gold", workers=2)
+
+    assert sorted(p.name for p in paths) == [
+        "gold_orders_by_sku.parquet",
+        "gold_orders_created.parquet",
+    ]
+    out = pl.read_parquet(tmp_path / "gold" / "gold_orders_by_sku.parquet")
+    assert out.sort("sku")["qty"].to_list() == [50, 70]
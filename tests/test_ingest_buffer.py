@@ -0,0 +1,67 @@
+import polars as pl
+
+from scpulse.domain.events import BRONZE_SCHEMA
+from scpulse.etl.ingest_buffer import ColumnarEventBuffer
+from scripts.factories import (
+    OrderCreatedFactory,
+    OrderDelayedFactory,
+    InventoryLowFactory,
+)
+
+
+def test_buffer_builds_stable_bronze_schema() -> None:
+    buffer = ColumnarEventBuffer()
+    buffer.append(InventoryLowFactory())
+    df = buffer.to_frame()
+
+    assert df is not None
+    # Mesmo um batch só de inventory_low tem todas as colunas do Bronze
+    assert df.schema == pl.Schema(BRONZE_SCHEMA)
+    assert df["order_id"].null_count() == 1
+
+
+def test_buffer_mixes_event_types() -> None:
+    buffer = ColumnarEventBuffer()
+    for factory_cls in (
+        OrderCreatedFactory,
+        OrderDelayedFactory,
+        InventoryLowFactory,
+    ):
+        buffer.append(factory_cls())
+
+    df = buffer.to_frame()
+    assert df is not None
+    assert len(buffer) == 3
+    assert sorted(df["event_type"].to_list()) == [
+        "inventory_low",
+        "order_created",
+        "order_delayed",
+    ]
+    assert df["timestamp"].dtype == pl.Datetime("ns", "UTC")
+
+
+def test_buffer_keeps_unknown_event_types() -> None:
+    buffer = ColumnarEventBuffer()
+    buffer.append(OrderCreatedFactory())
+    buffer.append(
+        {
+            "event_id": "EVT-X",
+            "event_type": "supplier_audit",
+            "timestamp": "2025-09-17T10:00:00+00:00",
+            "score": 7,
+        }
+    )
+
+    df = buffer.to_frame()
+    assert df is not None
+    assert df.height == 2
+    assert "score" in df.columns
+
+
+def test_buffer_clear_and_empty() -> None:
+    buffer = ColumnarEventBuffer()
+    assert buffer.to_frame() is None
+    buffer.append(OrderCreatedFactory())
+    buffer.clear()
+    assert len(buffer) == 0
+    assert buffer.to_frame() is None
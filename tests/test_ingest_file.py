@@ -0,0 +1,92 @@
+import gzip
+import json
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from scpulse.etl.ingest_stream import consume_from_file, consume_from_files
+from scripts.factories import InventoryLowFactory, OrderCreatedFactory
+
+
+def write_landing(path: Path, n: int, start: int = 0) -> list[str]:
+    lines = [
+        json.dumps(OrderCreatedFactory(event_id=f"EVT-{i}"))
+        for i in range(start, start + n)
+    ]
+    data = ("\n".join(lines) + "\n").encode()
+    if path.suffix == ".gz":
+        data = gzip.compress(data)
+    elif path.suffix == ".zst":
+        zstandard = pytest.importorskip("zstandard")
+        data = zstandard.ZstdCompressor().compress(data)
+    path.write_bytes(data)
+    return [f"EVT-{i}" for i in range(start, start + n)]
+
+
+def read_bronze(base_dir: Path) -> pl.DataFrame:
+    return pl.concat(
+        [
+            pl.read_parquet(p)
+            for p in base_dir.glob("event_type=*/date=*/*.parquet")
+        ]
+    )
+
+
+def test_file_is_ingested_in_chunks(tmp_path: Path) -> None:
+    landing = tmp_path / "events.jsonl"
+    ids = write_landing(landing, 25)
+
+    parts = consume_from_file(landing, chunk_rows=10, base_dir=tmp_path / "b")
+
+    assert [pl.read_parquet(p).height for p in parts] == [10, 10, 5]
+    assert sorted(read_bronze(tmp_path / "b")["event_id"]) == sorted(ids)
+
+
+@pytest.mark.parametrize("suffix", [".jsonl.gz", ".jsonl.zst"])
+def test_compressed_landing_files(tmp_path: Path, suffix: str) -> None:
+    landing = tmp_path / f"events{suffix}"
+    ids = write_landing(landing, 12)
+
+    consume_from_file(landing, chunk_rows=5, base_dir=tmp_path / "b")
+
+    assert sorted(read_bronze(tmp_path / "b")["event_id"]) == sorted(ids)
+
+
+def test_invalid_lines_go_to_dead_letter(tmp_path: Path) -> None:
+    landing = tmp_path / "events.jsonl"
+    bad = InventoryLowFactory()
+    del bad["threshold"]
+    landing.write_text(
+        json.dumps(OrderCreatedFactory()) + "\n\n" + json.dumps(bad) + "\n"
+    )
+
+    consume_from_file(
+        landing,
+        base_dir=tmp_path / "b",
+        dead_letter_dir=tmp_path / "dlq",
+    )
+
+    assert read_bronze(tmp_path / "b").height == 1
+    (dlq_file,) = (tmp_path / "dlq").glob("*.jsonl")
+    record = json.loads(dlq_file.read_text())
+    assert record["source"]["line"] == 3
+
+
+def test_glob_of_files_in_parallel(tmp_path: Path) -> None:
+    landing = tmp_path / "landing"
+    landing.mkdir()
+    ids = write_landing(landing / "a.jsonl", 8)
+    ids += write_landing(landing / "b.jsonl.gz", 8, start=100)
+
+    parts = consume_from_files(
+        str(landing / "*.jsonl*"), workers=2, base_dir=tmp_path / "b"
+    )
+
+    assert len(parts) == 2
+    assert sorted(read_bronze(tmp_path / "b")["event_id"]) == sorted(ids)
+
+
+def test_glob_without_matches_raises(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        consume_from_files(str(tmp_path / "*.jsonl"))
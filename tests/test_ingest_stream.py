@@ -0,0 +1,254 @@
+import asyncio
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+import pytest
+
+from scpulse.etl.decoding import DeadLetterSink
+from scpulse.etl.ingest_stream import (
+    BatchPolicy,
+    BronzeBatchWriter,
+    _consume_loop,
+)
+
+
+def make_event(i: int) -> dict[str, Any]:
+    return {
+        "event_id": f"EVT-{i}",
+        "event_type": "order_created",
+        "timestamp": "2025-09-17T10:00:00+00:00",
+        "supplier": "Fornecedor_A",
+        "qty": i,
+    }
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@dataclass
+class FakeMessage:
+    value: bytes
+    topic: str = "supplychain_events"
+    partition: int = 0
+    offset: int = 0
+    serialized_value_size: int = 100
+
+
+def make_message(event: dict[str, Any]) -> FakeMessage:
+    return FakeMessage(json.dumps(event).encode("utf-8"))
+
+
+class FakeConsumer:
+    """Consumer mínimo: entrega lotes pré-definidos e registra commits."""
+
+    def __init__(self, batches: list[list[FakeMessage]], stop: asyncio.Event):
+        self.batches = batches
+        self.stop = stop
+        self.commits: list[int] = []
+        self.delivered = 0
+
+    async def getmany(self, timeout_ms: int, max_records: int) -> dict:
+        if not self.batches:
+            self.stop.set()
+            await asyncio.sleep(0)  # cede o loop (permite cancelar)
+            return {}
+        batch = self.batches.pop(0)
+        self.delivered += len(batch)
+        return {"tp0": batch}
+
+    async def commit(self) -> None:
+        self.commits.append(self.delivered)
+
+
+def test_writer_flushes_on_max_rows(tmp_path: Path) -> None:
+    writer = BronzeBatchWriter(tmp_path, BatchPolicy(max_rows=3))
+    writer.add(make_event(1))
+    writer.add(make_event(2))
+    assert not writer.should_flush()
+    writer.add(make_event(3))
+    assert writer.should_flush()
+
+
+def test_writer_flushes_on_max_bytes(tmp_path: Path) -> None:
+    writer = BronzeBatchWriter(tmp_path, BatchPolicy(max_bytes=250))
+    writer.add(make_event(1), size_bytes=200)
+    assert not writer.should_flush()
+    writer.add(make_event(2), size_bytes=200)
+    assert writer.should_flush()
+
+
+def test_writer_flushes_on_max_latency(tmp_path: Path) -> None:
+    clock = FakeClock()
+    writer = BronzeBatchWriter(
+        tmp_path, BatchPolicy(max_latency_s=5), clock=clock
+    )
+    assert not writer.should_flush()  # buffer vazio nunca dispara
+    writer.add(make_event(1))
+    clock.now = 4.0
+    assert not writer.should_flush()
+    assert writer.seconds_until_deadline() == 1.0
+    clock.now = 5.0
+    assert writer.should_flush()
+
+
+def test_each_flush_writes_a_new_part_file(tmp_path: Path) -> None:
+    writer = BronzeBatchWriter(tmp_path, BatchPolicy(max_rows=2))
+    for i in range(4):
+        writer.add(make_event(i))
+        if writer.should_flush():
+            writer.flush()
+
+    parts = list(tmp_path.glob("event_type=*/date=*/part-*.parquet"))
+    assert len(parts) == 2
+    assert not list(tmp_path.rglob("*.tmp"))
+    total = sum(pl.read_parquet(p).height for p in parts)
+    assert total == 4
+
+
+def test_consume_loop_commits_only_after_flush(tmp_path: Path) -> None:
+    stop = asyncio.Event()
+    consumer = FakeConsumer(
+        [
+            [make_message(make_event(0)), make_message(make_event(1))],
+            [make_message(make_event(2))],
+        ],
+        stop,
+    )
+    writer = BronzeBatchWriter(tmp_path, BatchPolicy(max_rows=2))
+    dead_letters = DeadLetterSink(tmp_path / "dead_letter")
+
+    asyncio.run(
+        _consume_loop(consumer, writer, stop, dead_letters=dead_letters)
+    )
+
+    # 1º commit após o flush de 2 eventos; 2º no flush final do shutdown
+    assert consumer.commits == [2, 3]
+    parts = list(tmp_path.glob("event_type=*/date=*/part-*.parquet"))
+    assert sum(pl.read_parquet(p).height for p in parts) == 3
+
+
+def test_consume_loop_does_not_commit_when_the_loop_fails(
+    tmp_path: Path,
+) -> None:
+    stop = asyncio.Event()
+    consumer = FakeConsumer(
+        [[make_message(make_event(0)), make_message(make_event(1))]], stop
+    )
+
+    class BrokenDecoder:
+        def decode(self, raw: bytes) -> dict[str, Any]:
+            event = json.loads(raw)
+            if event["event_id"] == "EVT-1":
+                raise RuntimeError("disco cheio")
+            return event
+
+    writer = BronzeBatchWriter(tmp_path, BatchPolicy())
+    dead_letters = DeadLetterSink(tmp_path / "dead_letter")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(
+            _consume_loop(
+                consumer,
+                writer,
+                stop,
+                decoder=BrokenDecoder(),
+                dead_letters=dead_letters,
+            )
+        )
+
+    # o lote inteiro será relido: nada gravado, nenhum offset confirmado
+    assert consumer.commits == []
+    assert not list(tmp_path.glob("event_type=*/date=*/part-*.parquet"))
+
+
+def test_consume_loop_flushes_on_cancellation(tmp_path: Path) -> None:
+    stop = asyncio.Event()  # nunca setado: parada por cancelamento
+    consumer = FakeConsumer([[make_message(make_event(0))]], stop)
+
+    async def run() -> None:
+        task = asyncio.create_task(
+            _consume_loop(
+                consumer,
+                BronzeBatchWriter(tmp_path, BatchPolicy()),
+                dead_letters=DeadLetterSink(tmp_path / "dead_letter"),
+            )
+        )
+        while not consumer.delivered:
+            await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+
+    assert consumer.commits == [1]
+
+
+def test_consume_loop_routes_malformed_events_to_dead_letter(
+    tmp_path: Path,
+) -> None:
+    stop = asyncio.Event()
+    invalid = make_event(1)
+    del invalid["supplier"]  # order_created exige supplier
+    consumer = FakeConsumer(
+        [
+            [
+                make_message(make_event(0)),
+                make_message(invalid),
+                FakeMessage(b"{not json", offset=2),
+            ]
+        ],
+        stop,
+    )
+    writer = BronzeBatchWriter(tmp_path / "bronze", BatchPolicy())
+    dead_letters = DeadLetterSink(tmp_path / "dead_letter")
+
+    asyncio.run(
+        _consume_loop(consumer, writer, stop, dead_letters=dead_letters)
+    )
+
+    parts = list(
+        (tmp_path / "bronze").glob("event_type=*/date=*/part-*.parquet")
+    )
+    assert sum(pl.read_parquet(p).height for p in parts) == 1
+
+    lines = [
+        json.loads(line)
+        for f in (tmp_path / "dead_letter").glob("*.jsonl")
+        for line in f.read_text().splitlines()
+    ]
+    assert len(lines) == 2
+    assert "supplier" in lines[0]["error"]
+    assert lines[1]["source"]["offset"] == 2
+
+
+def test_flush_partitions_by_event_type_and_event_date(tmp_path: Path) -> None:
+    writer = BronzeBatchWriter(tmp_path, BatchPolicy())
+    writer.add(make_event(1))
+    writer.add({**make_event(2), "timestamp": "2025-09-18T01:00:00+00:00"})
+    writer.add(
+        {
+            "event_id": "EVT-3",
+            "event_type": "inventory_low",
+            "timestamp": "2025-09-17T12:00:00+00:00",
+            "sku": "SKU123",
+            "threshold": 5,
+        }
+    )
+
+    paths = writer.flush()
+
+    partitions = sorted(str(p.parent.relative_to(tmp_path)) for p in paths)
+    assert partitions == [
+        "event_type=inventory_low/date=2025-09-17",
+        "event_type=order_created/date=2025-09-17",
+        "event_type=order_created/date=2025-09-18",
+    ]
@@ -0,0 +1,86 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from scpulse.etl.manifest import TransformManifest
+
+
+def make_part(path: Path, content: bytes = b"part") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return path
+
+
+def test_new_day_is_pending(tmp_path: Path) -> None:
+    manifest = TransformManifest(tmp_path / "manifest.json")
+    part = make_part(tmp_path / "d1" / "part-1.parquet")
+
+    assert manifest.pending({"2025-09-17": [part]}) == {"2025-09-17": [part]}
+
+
+def test_processed_day_is_skipped_until_it_changes(tmp_path: Path) -> None:
+    manifest_path = tmp_path / "manifest.json"
+    part = make_part(tmp_path / "d1" / "part-1.parquet")
+    days = {"2025-09-17": [part]}
+
+    manifest = TransformManifest(manifest_path)
+    manifest.mark_processed("2025-09-17", manifest.snapshot([part]))
+
+    # Estado sobrevive entre execuções
+    assert TransformManifest(manifest_path).pending(days) == {}
+
+    new_part = make_part(tmp_path / "d1" / "part-2.parquet")
+    days = {"2025-09-17": [part, new_part]}
+    assert list(TransformManifest(manifest_path).pending(days)) == [
+        "2025-09-17"
+    ]
+
+
+def test_removed_file_marks_day_pending(tmp_path: Path) -> None:
+    manifest = TransformManifest(tmp_path / "manifest.json")
+    parts = [
+        make_part(tmp_path / "d1" / "part-1.parquet"),
+        make_part(tmp_path / "d1" / "part-2.parquet"),
+    ]
+    manifest.mark_processed("2025-09-17", manifest.snapshot(parts))
+
+    assert manifest.pending({"2025-09-17": parts[:1]}) != {}
+
+
+@pytest.mark.parametrize("mode, pending", [("stat", True), ("hash", False)])
+def test_touch_without_content_change(
+    tmp_path: Path, mode: str, pending: bool
+) -> None:
+    manifest = TransformManifest(tmp_path / "manifest.json", mode=mode)
+    part = make_part(tmp_path / "d1" / "part-1.parquet")
+    manifest.mark_processed("2025-09-17", manifest.snapshot([part]))
+
+    stat = part.stat()
+    os.utime(part, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert bool(manifest.pending({"2025-09-17": [part]})) is pending
+
+
+def test_rewritten_file_marks_day_pending(tmp_path: Path) -> None:
+    manifest = TransformManifest(tmp_path / "manifest.json", mode="hash")
+    part = make_part(tmp_path / "d1" / "part-1.parquet")
+    manifest.mark_processed("2025-09-17", manifest.snapshot([part]))
+
+    make_part(part, b"compacted part")
+
+    assert manifest.pending({"2025-09-17": [part]}) != {}
+
+
+def test_new_files_for_append_only_day(tmp_path: Path) -> None:
+    manifest = TransformManifest(tmp_path / "manifest.json")
+    part = make_part(tmp_path / "d1" / "part-1.parquet")
+    assert manifest.new_files("2025-09-17", [part]) is None
+
+    manifest.mark_processed("2025-09-17", manifest.snapshot([part]))
+    new_part = make_part(tmp_path / "d1" / "part-2.parquet")
+    assert manifest.new_files("2025-09-17", [part, new_part]) == [new_part]
+
+    # Arquivo já processado removido (compactação) → reconstrução
+    part.unlink()
+    assert manifest.new_files("2025-09-17", [new_part]) is None
@@ -0,0 +1,83 @@
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import BigInteger, Date, Integer
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from scpulse.api.pagination import (
+    decode_cursor,
+    encode_cursor,
+    select_columns,
+    select_fields,
+)
+from scpulse.api.schemas.schemas import OrderCreatedOut, Page
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Daily(Base):
+    __tablename__ = "daily"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    day: Mapped[date] = mapped_column(Date)
+    total_orders: Mapped[int] = mapped_column(Integer)
+
+
+def test_cursor_round_trip_is_opaque() -> None:
+    cursor = encode_cursor(date(2025, 9, 17), 42)
+
+    assert "2025" not in cursor
+    assert decode_cursor(cursor) == (date(2025, 9, 17), 42)
+
+
+@pytest.mark.parametrize("cursor", ["nao-e-base64!", "e30", "eyJkIjoxfQ"])
+def test_invalid_cursor_is_bad_request(cursor: str) -> None:
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(cursor)
+    assert exc.value.status_code == 400
+
+
+def test_select_columns_projection() -> None:
+    assert select_columns(Daily, None) == ["id", "day", "total_orders"]
+    assert select_columns(Daily, "total_orders, day,day") == [
+        "total_orders",
+        "day",
+    ]
+
+
+def test_select_columns_rejects_unknown_fields() -> None:
+    with pytest.raises(HTTPException) as exc:
+        select_columns(Daily, "day,password")
+    assert exc.value.status_code == 400
+
+
+def test_select_fields_validates_against_item_schema() -> None:
+    available = list(OrderCreatedOut.model_fields)
+    assert select_fields(available, "supplier,day") == ["supplier", "day"]
+    with pytest.raises(HTTPException):
+        select_fields(available, "supplier_name")
+
+
+def test_page_is_typed_and_omits_unrequested_fields() -> None:
+    page = Page[OrderCreatedOut](
+        items=[
+            OrderCreatedOut.model_construct(
+                day=date(2025, 9, 17), supplier="Fornecedor_A"
+            )
+        ],
+        next_cursor=None,
+        total=None,
+    )
+    assert jsonable_encoder(page, exclude_unset=True) == {
+        "items": [{"day": "2025-09-17", "supplier": "Fornecedor_A"}],
+        "next_cursor": None,
+        "total": None,
+    }
+    schema = Page[OrderCreatedOut].model_json_schema()
+    assert schema["properties"]["items"]["items"] == {
+        "$ref": "#/$defs/OrderCreatedOut"
+    }
@@ -0,0 +1,151 @@
+import os
+from datetime import date
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from scpulse.pulseboard_visualization.gold_data import (
+    FrameCache,
+    KpiCache,
+    available_days,
+    chart_data,
+    downsample,
+    list_partitions,
+    lttb,
+    scan_metric,
+)
+
+DAYS = [date(2025, 9, 16), date(2025, 9, 17), date(2025, 9, 18)]
+
+
+def _write_day(gold: Path, day: date, orders: dict[str, int]) -> None:
+    out = gold / f"events_{day}"
+    out.mkdir(parents=True, exist_ok=True)
+    pl.DataFrame(
+        {
+            "supplier": list(orders),
+            "date": [day] * len(orders),
+            "total_orders": list(orders.values()),
+            "total_qty": [n * 10 for n in orders.values()],
+        }
+    ).write_parquet(out / "gold_orders_created.parquet")
+    pl.DataFrame(
+        {
+            "supplier": ["Fornecedor_A"],
+            "delayed_orders": [day.day],
+            "avg_delay_days": [float(day.day % 3)],
+        }
+    ).write_parquet(out / "gold_orders_delayed.parquet")
+    pl.DataFrame(
+        {"sku": ["SKU1"], "low_stock_alerts": [1], "min_threshold": [day.day]}
+    ).write_parquet(out / "gold_inventory_alerts.parquet")
+
+
+@pytest.fixture
+def gold(tmp_path: Path) -> Path:
+    for day in DAYS:
+        _write_day(tmp_path, day, {"Fornecedor_A": 2, "Fornecedor_B": 1})
+    (tmp_path / "events_lixo").mkdir()
+    return tmp_path
+
+
+def test_list_partitions_filters_by_range(gold):
+    parts = list_partitions("orders_created", gold, start=DAYS[1])
+    assert [p.day for p in parts] == DAYS[1:]
+    assert available_days(gold) == DAYS
+    assert list_partitions("orders_created", gold / "nada") == ()
+    with pytest.raises(ValueError):
+        list_partitions("nope", gold)
+
+
+def test_scan_adds_day_and_charts_aggregate_range(gold):
+    parts = list_partitions("orders_delayed", gold)
+    df = scan_metric("orders_delayed", parts).collect()
+    assert df["day"].to_list() == DAYS
+    ranking = chart_data("orders_delayed", parts)
+    assert ranking.rows() == [("Fornecedor_A", 16 + 17 + 18)]
+    assert chart_data("orders_created", ()).is_empty()
+
+
+def test_kpis_recompute_only_changed_partitions(gold):
+    cache = KpiCache()
+    parts = list_partitions("orders_created", gold)
+    assert cache.kpis("orders_created", parts) == {
+        "total_orders": 9,
+        "total_qty": 90,
+        "avg_per_supplier": 4.5,
+    }
+    assert cache.computed == 3
+
+    cache.kpis("orders_created", parts)
+    assert cache.computed == 3
+
+    _write_day(gold, DAYS[2], {"Fornecedor_C": 6})
+    path = gold / f"events_{DAYS[2]}" / "gold_orders_created.parquet"
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    parts = list_partitions("orders_created", gold)
+    assert cache.kpis("orders_created", parts)["total_orders"] == 12
+    assert cache.computed == 4
+
+    delayed = cache.kpis(
+        "orders_delayed", list_partitions("orders_delayed", gold)
+    )
+    assert delayed == {"delayed_orders": 51, "avg_delay_days": 1.0}
+    alerts = cache.kpis(
+        "inventory_alerts",
+        list_partitions("inventory_alerts", gold, end=DAYS[1]),
+    )
+    assert alerts == {"low_stock_alerts": 2, "min_threshold": 16}
+    assert cache.kpis("inventory_alerts", ())["min_threshold"] is None
+
+
+def test_frame_cache_merges_only_new_partitions(gold):
+    frames = FrameCache()
+    parts = list_partitions("orders_created", gold)
+    assert frames.frame("orders_created", parts).height == 6
+    assert frames.loaded == 3
+
+    new_day = date(2025, 9, 19)
+    _write_day(gold, new_day, {"Fornecedor_A": 4})
+    parts = list_partitions("orders_created", gold)
+    df = chart_data("orders_created", parts, frames=frames)
+    assert frames.loaded == 4
+    assert df.filter(pl.col("day") == new_day)["total_orders"].to_list() == [4]
+
+
+def test_lttb_keeps_endpoints_and_peaks():
+    ys = [0.0] * 100
+    ys[37] = 50.0
+    ys[80] = -20.0
+    keep = lttb(list(range(100)), ys, 10)
+    assert len(keep) == 10
+    assert keep[0] == 0 and keep[-1] == 99
+    assert 37 in keep and 80 in keep
+    assert keep == sorted(keep)
+    assert lttb([1, 2, 3], [1, 2, 3], 10) == [0, 1, 2]
+
+
+def test_downsample_bounds_points_per_series(gold):
+    days = pl.date_range(date(2024, 1, 1), date(2024, 12, 30), eager=True)
+    df = pl.DataFrame(
+        {
+            "day": pl.concat([days, days]),
+            "supplier": ["A"] * len(days) + ["B"] * len(days),
+            "total_orders": list(range(len(days) * 2)),
+        }
+    )
+    out = downsample(df, "day", "total_orders", 100, by="supplier")
+    assert out.height == 100
+    assert out.group_by("supplier").len().sort("supplier")[
+        "len"
+    ].to_list() == [
+        50,
+        50,
+    ]
+    assert out["day"].min() == days[0] and out["day"].max() == days[-1]
+    assert downsample(df, "day", "total_orders", 1000).height == df.height
+    # mínimo de 3 pontos por série: 2 fornecedores x 3 dias ficam inteiros
+    parts = list_partitions("orders_created", gold)
+    assert chart_data("orders_created", parts, max_points=2).height == 6
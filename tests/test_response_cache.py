@@ -0,0 +1,78 @@
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from scpulse.api.response_cache import (
+    MemoryBackend,
+    ResponseCache,
+    cache_key,
+    etag_matches,
+)
+
+
+def make_client(generation):
+    calls = []
+
+    async def current():
+        return generation[0]
+
+    cache = ResponseCache(MemoryBackend(maxsize=8), current)
+    app = FastAPI()
+
+    @app.get("/items")
+    async def items(request: Request):
+        async def produce():
+            calls.append(dict(request.query_params))
+            return {"generation": generation[0]}
+
+        return await cache.respond(request, produce)
+
+    return TestClient(app), calls
+
+
+def test_cache_key_normalizes_params():
+    a = cache_key("/x", [("start", "2025-01-01"), ("end", ""), ("s", "A")], 3)
+    b = cache_key("/x", [("s", "A "), ("start", "2025-01-01")], 3)
+    assert a == b
+    assert a != cache_key("/x", [("s", "A"), ("start", "2025-01-01")], 4)
+    assert a != cache_key("/y", [("s", "A"), ("start", "2025-01-01")], 3)
+
+
+def test_etag_matches():
+    assert etag_matches('"1-ab"', '"1-ab"')
+    assert etag_matches('W/"0-zz", "1-ab"', '"1-ab"')
+    assert etag_matches("*", '"1-ab"')
+    assert not etag_matches(None, '"1-ab"')
+    assert not etag_matches('"0-ab"', '"1-ab"')
+
+
+def test_response_cache_hits_until_generation_changes():
+    generation = [1]
+    client, calls = make_client(generation)
+
+    first = client.get("/items?b=2&a=1")
+    second = client.get("/items?a=1&b=2")
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.json() == {"generation": 1}
+    assert len(calls) == 1
+
+    generation[0] = 2
+    third = client.get("/items?a=1&b=2")
+    assert third.headers["X-Cache"] == "MISS"
+    assert third.json() == {"generation": 2}
+    assert third.headers["ETag"] != first.headers["ETag"]
+
+
+def test_response_cache_if_none_match_returns_304():
+    generation = [1]
+    client, calls = make_client(generation)
+    etag = client.get("/items").headers["ETag"]
+
+    not_modified = client.get("/items", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    generation[0] = 2
+    changed = client.get("/items", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert len(calls) == 2
@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from scripts.simulate_suppliers import (
+    EventGenerator,
+    TokenBucket,
+    parse_mix,
+    percentile,
+    rate_profile,
+)
+
+
+def test_parse_mix() -> None:
+    assert parse_mix("order_created=0.7, inventory_low=0.3") == {
+        "order_created": 0.7,
+        "inventory_low": 0.3,
+    }
+    assert parse_mix("order_delayed") == {"order_delayed": 1.0}
+    with pytest.raises(ValueError):
+        parse_mix("order_shipped=1")
+    with pytest.raises(ValueError):
+        parse_mix("order_created=0")
+
+
+def test_rate_profiles() -> None:
+    assert rate_profile("steady", 100, 60)(59) == 100
+    assert rate_profile("ramp", 100, 60)(30) == 50
+    step = rate_profile("step", 100, 40)
+    assert [step(t) for t in (0, 10, 25, 39, 99)] == [25, 50, 75, 100, 100]
+    burst = rate_profile("burst", 100, 60, burst_factor=4, burst_every_s=10)
+    assert [burst(t) for t in (0.5, 5, 10.2)] == [400, 100, 400]
+    with pytest.raises(ValueError):
+        rate_profile("sine", 100, 60)
+
+
+def test_token_bucket_paces_and_caps() -> None:
+    now = [0.0]
+    bucket = TokenBucket(capacity=50, clock=lambda: now[0])
+    now[0] = 0.25
+    bucket.refill(100)
+    assert bucket.take() == 25
+    assert bucket.take() == 0
+    now[0] = 10.0  # atraso longo: recupera no máximo `capacity`
+    bucket.refill(100)
+    assert bucket.take() == 50
+
+
+def test_event_generator_mix_and_cardinality() -> None:
+    gen = EventGenerator(
+        {"order_created": 3, "inventory_low": 1, "order_delayed": 0},
+        suppliers=5,
+        skus=7,
+        pool_size=4,
+        rng=random.Random(1),
+    )
+    events = [gen.next() for _ in range(2000)]
+    types = [e["event_type"] for e in events]
+    assert set(types) == {"order_created", "inventory_low"}
+    assert 0.7 < types.count("order_created") / len(types) < 0.8
+    assert len({e["supplier"] for e in events}) == 5
+    assert len({e["sku"] for e in events}) == 7
+    assert len({e["event_id"] for e in events}) == 2000
+    low = next(e for e in events if e["event_type"] == "inventory_low")
+    assert low["threshold"] > 0
+
+
+def test_percentile() -> None:
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile(values, 100) == 100
+    assert percentile([], 50) == 0.0